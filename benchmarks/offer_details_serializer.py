@@ -0,0 +1,97 @@
+"""
+Benchmarks serializing 10k offer details nested in offers, once as compact
+`{id, url}` details (offer list GET) and once as full details (offer PATCH response),
+comparing the serializers with the previous ones, which selected the fields of the
+details while representing every single instance.
+The instances are built in memory, so only the serialization itself is measured.
+
+Run `python -m benchmarks.offer_details_serializer` from the project root.
+"""
+from benchmarks.utils import measure_ms, print_result
+from django.contrib.auth.models import User
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from users_app.models import BusinessProfile
+from content_app.models import Offer, OfferDetails
+from content_app.api.serializers.general import OfferSerializer
+from content_app.api.serializers.offer_details import OfferDetailsSerializer
+
+DETAILS_COUNT = 10_002
+OFFER_TYPES = (OfferDetails.BASIC, OfferDetails.STANDARD, OfferDetails.PREMIUM)
+
+class PreviousOfferDetailsSerializer(OfferDetailsSerializer):
+    """
+    Emulates the previous `OfferDetailsSerializer`, which removed the fields not represented
+    for the request while representing every single instance.
+    """
+    url = serializers.SerializerMethodField()
+
+    class Meta(OfferDetailsSerializer.Meta):
+        fields = ['id', 'offer_id', 'url', 'title', 'offer_type', 'price', 'features', 'revisions', 'delivery_time_in_days']
+
+    def to_representation(self, instance):
+        request = self.context.get('request', None)
+        if request:
+            if 'offers' in request.path and request.method == 'GET':
+                allowed_fields = {'id', 'url'}
+                existing_fields = set(self.fields.keys())
+                for field_name in existing_fields - allowed_fields:
+                    self.fields.pop(field_name)
+            else:
+                self.fields.pop('url', None)
+        return super().to_representation(instance)
+
+    def get_url(self, obj):
+        return f"/offerdetails/{obj.pk}/"
+
+class PreviousOfferSerializer(OfferSerializer):
+    """
+    Emulates the previous `OfferSerializer`, which used the full details serializer for every request
+    and updated its context while representing every single offer.
+    """
+    details = PreviousOfferDetailsSerializer(many=True)
+
+    def get_fields(self):
+        return serializers.HyperlinkedModelSerializer.get_fields(self)
+
+    def to_representation(self, instance):
+        self.fields['details'].context.update(self.context)
+        return serializers.HyperlinkedModelSerializer.to_representation(self, instance)
+
+def build_offers():
+    """
+    Builds offers with three prefetched details each, without touching the database.
+    """
+    user = User(pk=1, username='benchmark', first_name='bench', last_name='mark')
+    profile = BusinessProfile(pk=1, user=user)
+    offers = []
+    for offer_pk in range(1, DETAILS_COUNT // len(OFFER_TYPES) + 1):
+        offer = Offer(pk=offer_pk, business_profile=profile, title=f"title{offer_pk}", min_price_cents=1000, min_delivery_time_in_days=3)
+        offer._prefetched_objects_cache = {'details': [
+            OfferDetails(
+                pk=offer_pk * len(OFFER_TYPES) + index, offer=offer, offer_type=offer_type, title='details',
+                price_cents=1000, features='feature1,,feature2', revisions=2, delivery_time_in_days=3,
+            )
+            for index, offer_type in enumerate(OFFER_TYPES)
+        ]}
+        offers.append(offer)
+    return offers
+
+def serialize(offers, method, serializer_class=OfferSerializer):
+    """
+    Serializes the offers in the context of an offer list request with the given method.
+    """
+    request = Request(getattr(APIRequestFactory(), method)('/api/content/offers/'))
+    return serializer_class(offers, many=True, context={'request': request}).data
+
+def run():
+    offers = build_offers()
+    print(f"Serializing {DETAILS_COUNT} offer details nested in {len(offers)} offers (median of 10 runs)")
+    for label, method in [('compact details (GET)', 'get'), ('full details (PATCH)', 'patch')]:
+        assert serialize(offers, method, PreviousOfferSerializer) == serialize(offers, method)
+        print_result(f"{label}  previous", measure_ms(lambda: serialize(offers, method, PreviousOfferSerializer), repeat=10))
+        print_result(f"{label}  current", measure_ms(lambda: serialize(offers, method), repeat=10))
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,85 @@
+"""
+Benchmarks the offer search at 100k offers, comparing the full-text search index
+with the previous `icontains` lookups of the DRF `SearchFilter`.
+Each measurement evaluates the count and the first page, as the offer list endpoint does.
+
+Run `python -m benchmarks.offer_search` from the project root.
+"""
+import random
+import string
+from benchmarks.utils import benchmark_database, measure_ms, print_result
+from django.contrib.auth.models import User
+from django.db.models import Q
+from users_app.models import BusinessProfile
+from content_app.models import Offer
+from content_app.search import search_offers
+
+OFFER_COUNT = 100_000
+PAGE_SIZE = 6
+VOCABULARY_SIZE = 20_000
+
+def get_vocabulary():
+    """
+    Returns random words with Zipf-like weights, approximating the word frequencies of natural text.
+    """
+    random.seed(0)
+    words = [''.join(random.choices(string.ascii_lowercase, k=random.randint(4, 10))) for _ in range(VOCABULARY_SIZE)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY_SIZE)]
+    return words, weights
+
+WORDS, WEIGHTS = get_vocabulary()
+SEARCH_STRINGS = {
+    'frequent word': WORDS[0],
+    'medium word': WORDS[200],
+    'rare word': WORDS[5000],
+    'three-letter prefix': WORDS[50][:3],
+    'two words': f"{WORDS[20]} {WORDS[300]}",
+}
+
+def fill_offers():
+    """
+    Creates one business profile with `OFFER_COUNT` offers of random words.
+    """
+    random.seed(0)
+    user = User.objects.create_user(username='benchmark', password='benchmark')
+    profile = BusinessProfile.objects.create(user=user)
+    Offer.objects.bulk_create(
+        [
+            Offer(
+                business_profile=profile,
+                title=f"{' '.join(random.choices(WORDS, WEIGHTS, k=3))} {index}",
+                description=' '.join(random.choices(WORDS, WEIGHTS, k=25)),
+            )
+            for index in range(OFFER_COUNT)
+        ],
+        batch_size=5000,
+    )
+
+def icontains_search(search_str):
+    """
+    Emulates the previous `SearchFilter` lookups over title and description.
+    """
+    queryset = Offer.objects.all()
+    for term in search_str.split():
+        queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+    return queryset.count(), list(queryset[:PAGE_SIZE])
+
+def index_search(search_str):
+    """
+    Runs the full-text index search of `OfferSearchFilter`.
+    """
+    queryset = search_offers(Offer.objects.all(), search_str)
+    return queryset.count(), list(queryset[:PAGE_SIZE])
+
+def run():
+    with benchmark_database():
+        fill_offers()
+        print(f"Offer search at {OFFER_COUNT} offers (median of 20 runs)")
+        for label, search_str in SEARCH_STRINGS.items():
+            match_count = index_search(search_str)[0]
+            print(f"{label} ({match_count} matches)")
+            print_result('  icontains', measure_ms(lambda: icontains_search(search_str)))
+            print_result('  full-text index', measure_ms(lambda: index_search(search_str)))
+
+if __name__ == '__main__':
+    run()
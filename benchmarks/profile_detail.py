@@ -0,0 +1,71 @@
+"""
+Benchmarks the latency of the profile detail endpoint `/api/auth/profile/<pk>/`,
+comparing the single-query `get_profile` with the previous lookup (user, customer profile,
+then business profile, with lazily loaded user and file).
+
+Run `python -m benchmarks.profile_detail` from the project root.
+"""
+from unittest import mock
+from benchmarks.utils import benchmark_database, measure_ms, print_result
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, setup_test_environment
+from django.urls import reverse
+from rest_framework.test import APIClient
+from users_app.models import CustomerProfile, BusinessProfile
+
+PROFILE_COUNT = 1000
+
+def previous_get_profile(user_pk):
+    """
+    Emulates the previous `get_profile`, which queried the user and each profile type separately.
+    """
+    user = User.objects.get(pk=user_pk)
+    try:
+        return CustomerProfile.objects.get(user=user)
+    except CustomerProfile.DoesNotExist:
+        return BusinessProfile.objects.get(user=user)
+
+def fill_profiles():
+    """
+    Creates `PROFILE_COUNT` customer and `PROFILE_COUNT` business users with profiles.
+
+    Returns:
+        tuple: The IDs of a customer user and a business user.
+    """
+    users = User.objects.bulk_create([User(username=f"benchmark{index}") for index in range(2 * PROFILE_COUNT)])
+    CustomerProfile.objects.bulk_create([CustomerProfile(user=user) for user in users[:PROFILE_COUNT]])
+    BusinessProfile.objects.bulk_create([BusinessProfile(user=user) for user in users[PROFILE_COUNT:]])
+    return users[PROFILE_COUNT // 2].pk, users[PROFILE_COUNT + PROFILE_COUNT // 2].pk
+
+def get_profile_detail(client, user_pk):
+    """
+    Requests the profile detail of a user and checks the response.
+    """
+    response = client.get(reverse('profile-detail', kwargs={'pk': user_pk}))
+    assert response.status_code == 200
+
+def count_queries(func):
+    """
+    Returns the number of queries executed by a function.
+    """
+    with CaptureQueriesContext(connection) as context:
+        func()
+    return len(context.captured_queries)
+
+def run():
+    setup_test_environment()
+    with benchmark_database():
+        user_pks = dict(zip(('customer', 'business'), fill_profiles()))
+        client = APIClient()
+        print(f"Profile detail GET at {PROFILE_COUNT} customer and {PROFILE_COUNT} business profiles (median of 200 runs)")
+        for profile_type, user_pk in user_pks.items():
+            request = lambda: get_profile_detail(client, user_pk)
+            with mock.patch('users_app.api.views.get_profile', previous_get_profile):
+                label = f"  previous lookup ({count_queries(request)} queries)"
+                print_result(f"{profile_type}{label}", measure_ms(request, repeat=200))
+            label = f"  single query ({count_queries(request)} queries)"
+            print_result(f"{profile_type}{label}", measure_ms(request, repeat=200))
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,46 @@
+import os
+import statistics
+import time
+from contextlib import contextmanager
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'coderr_backend.settings')
+django.setup()
+
+from django.db import connection
+
+@contextmanager
+def benchmark_database():
+    """
+    Creates a throwaway test database for the duration of a benchmark,
+    so the configured database is never touched.
+    """
+    old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+def measure_ms(func, repeat=20):
+    """
+    Calls a function repeatedly and returns the median duration in milliseconds.
+
+    Args:
+        func (callable): The function to measure.
+        repeat (int): Number of calls.
+
+    Returns:
+        float: Median duration of a single call in milliseconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+def print_result(label, duration_ms):
+    """
+    Prints a benchmark result in a fixed-width format.
+    """
+    print(f"{label:<48} {duration_ms:>10.2f} ms")
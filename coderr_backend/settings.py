@@ -106,7 +106,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'coderr_backend.wsgi.application'
 
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# Set EMAIL_BACKEND to 'django.core.mail.backends.filebased.EmailBackend' to write emails
+# to EMAIL_FILE_PATH instead of sending them, e.g. for local development.
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_FILE_PATH = os.environ.get('EMAIL_FILE_PATH', BASE_DIR / 'sent_emails')
 EMAIL_HOST = EMAIL_HOST
 EMAIL_USE_TLS = False
 EMAIL_PORT = 465
@@ -114,6 +117,12 @@ EMAIL_USE_SSL = True
 EMAIL_HOST_USER = EMAIL_USER
 EMAIL_HOST_PASSWORD = EMAIL_PASSWORD
 
+# Queued emails are retried after EMAIL_QUEUE_RETRY_DELAY seconds, doubling with every
+# failed attempt up to EMAIL_QUEUE_MAX_RETRY_DELAY, and given up after EMAIL_QUEUE_MAX_ATTEMPTS.
+EMAIL_QUEUE_RETRY_DELAY = 60
+EMAIL_QUEUE_MAX_RETRY_DELAY = 60 * 60
+EMAIL_QUEUE_MAX_ATTEMPTS = 5
+
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
@@ -125,6 +134,36 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# A shared cache (e.g. Redis) is used if REDIS_URL is set, otherwise a per-process memory cache.
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+OFFER_CACHE_TIMEOUT = 60 * 15
+
+# Authentication tokens are cached in the shared cache and in a bounded per-process LRU cache.
+# The per-process entries are not invalidated across processes, so their timeout bounds how long
+# another process accepts a deleted token or a deactivated user. Without REDIS_URL the "shared" cache
+# is a per-process memory cache as well, so its token entries use the per-process timeout, too.
+TOKEN_AUTH_CACHE_TIMEOUT = 60 * 5
+TOKEN_AUTH_LOCAL_CACHE_TIMEOUT = 10
+TOKEN_AUTH_LOCAL_CACHE_SIZE = 1024
+BASE_INFO_CACHE_TIMEOUT = 60
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -175,7 +214,7 @@ REST_FRAMEWORK = {
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'users_app.api.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
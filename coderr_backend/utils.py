@@ -1,4 +1,9 @@
+import hashlib
+from django.db.models import Count, Max
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
 from urllib.parse import urlencode
 
 def format_number(value, decimal_places):
@@ -13,4 +18,116 @@ def reverse_with_queryparams(view_name, *args, **kwargs):
     """
     Retrieves an API view URL combined with query parameters.
     """
-    return reverse(view_name, args=args) + '?' + urlencode(kwargs)
\ No newline at end of file
+    return reverse(view_name, args=args) + '?' + urlencode(kwargs)
+
+def get_etag(*values):
+    """
+    Builds a quoted ETag from a digest of the given values.
+    """
+    digest = hashlib.md5(repr(values).encode(), usedforsecurity=False).hexdigest()
+    return quote_etag(digest)
+
+def get_queryset_validators(queryset, fields):
+    """
+    Retrieves cheap validators of a queryset's data in a single aggregate query: the ETag is
+    derived from the count and the maximum of each timestamp field, the last modification
+    is the latest of these timestamps.
+
+    Args:
+        queryset (QuerySet): The queryset whose data is represented.
+        fields (list): Timestamp fields, which may span relations.
+
+    Returns:
+        tuple: ETag and last modification datetime (None if the queryset is empty).
+    """
+    aggregates = {f"last_modified_{i}": Max(field) for i, field in enumerate(fields)}
+    values = queryset.order_by().aggregate(count=Count('pk'), **aggregates)
+    timestamps = [values[name] for name in aggregates]
+    last_modified = max((t for t in timestamps if t is not None), default=None)
+    return get_etag(values['count'], *timestamps), last_modified
+
+def get_object_validators(obj, fields):
+    """
+    Retrieves validators of a single object from its timestamp fields.
+
+    Returns:
+        tuple: ETag and last modification datetime.
+    """
+    timestamps = [getattr(obj, field) for field in fields]
+    return get_etag(obj.pk, *timestamps), max(timestamps)
+
+def conditional_get(request, validators, handler, *args, **kwargs):
+    """
+    Answers a GET request conditionally. If the 'If-None-Match' or 'If-Modified-Since' header
+    matches the validators, a 304 response is returned without calling the handler (and thus
+    without serializing any data). Otherwise, the handler's response is returned with
+    'ETag' and 'Last-Modified' headers. Clients are asked to revalidate on every request.
+
+    Args:
+        request (Request): The GET request.
+        validators (tuple): ETag and last modification datetime, or None to skip the conditional handling.
+        handler (callable): Creates the full response, called with the request and further arguments.
+
+    Returns:
+        Response: The 304 or full response.
+    """
+    if validators is None:
+        return handler(request, *args, **kwargs)
+    etag, last_modified = validators
+    # The representation depends on the renderer (e.g. JSON or browsable API).
+    etag = get_etag(etag, request.accepted_renderer.format)
+    last_modified = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = handler(request, *args, **kwargs)
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        response.headers.setdefault('ETag', etag)
+        if last_modified:
+            response.headers.setdefault('Last-Modified', http_date(last_modified))
+        patch_cache_control(response, no_cache=True)
+    return response
+
+class ConditionalGetMixin:
+    """
+    Mixin for viewsets answering list and detail requests conditionally (see `conditional_get`).
+    The validators are aggregated from the filtered queryset, so up-to-date clients get a 304
+    response after a single aggregate query.
+    Views customize the full responses by overriding `get_list_response` and `get_retrieve_response`.
+
+    Attributes:
+        conditional_fields (list): Timestamp fields which change with the represented data.
+            Defaults to ['updated_at'].
+    """
+    conditional_fields = ['updated_at']
+
+    def list(self, request, *args, **kwargs):
+        validators = get_queryset_validators(self.filter_queryset(self.get_queryset()), self.conditional_fields)
+        return conditional_get(request, validators, self.get_list_response, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return conditional_get(request, self.get_retrieve_validators(**kwargs), self.get_retrieve_response, *args, **kwargs)
+
+    def get_retrieve_validators(self, **kwargs):
+        """
+        Returns the validators of the requested object, or None if it does not exist
+        (the full response then handles the error).
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+        except (TypeError, ValueError):
+            return None
+        validators = get_queryset_validators(queryset, self.conditional_fields)
+        return validators if validators[1] is not None else None
+
+    def get_list_response(self, request, *args, **kwargs):
+        """
+        Returns the full response of a list request.
+        """
+        return super().list(request, *args, **kwargs)
+
+    def get_retrieve_response(self, request, *args, **kwargs):
+        """
+        Returns the full response of a detail request.
+        """
+        return super().retrieve(request, *args, **kwargs)
@@ -1,10 +1,14 @@
 from django_filters import rest_framework as filters
-from content_app.models import Offer, CustomerReview
+from rest_framework.filters import OrderingFilter, SearchFilter
+from content_app.models import Offer, Order, CustomerReview
+from content_app.search import search_offers
 
 class OfferFilter(filters.FilterSet):
     """
     Filter set for the `Offer` model, allowing filtering by creator ID, minimum price, 
     and maximum delivery time.
+    The details filters use the minimums stored on the offer, since an offer has a detail
+    within a limit exactly if its minimum is within the limit. This avoids joining the details.
 
     Attributes:
         creator_id (NumberFilter): Filters offers by the ID of the user who created the offer.
@@ -37,7 +41,7 @@ class OfferFilter(filters.FilterSet):
             QuerySet: Offer queryset filtered by the specified minimum price.
         """
         cents = value * 100
-        return queryset.filter(details__price_cents__lte=cents)
+        return queryset.filter(min_price_cents__lte=cents)
 
     def filter_by_max_delivery_time(self, queryset, name, value):
         """
@@ -47,8 +51,74 @@ class OfferFilter(filters.FilterSet):
         Returns:
             QuerySet: Offer queryset filtered by the specified maximum delivery time.
         """
-        return queryset.filter(details__delivery_time_in_days__lte=value)
+        return queryset.filter(min_delivery_time_in_days__lte=value)
     
+class OfferSearchFilter(SearchFilter):
+    """
+    Search filter for offers using the full-text search index of the database
+    (see `content_app.search`), returning results ranked by relevance.
+    Falls back to the default `SearchFilter` lookups over `search_fields`
+    for database engines without a search index.
+    """
+    def filter_queryset(self, request, queryset, view):
+        """
+        Filters the offer queryset by the 'search' query parameter.
+
+        Returns:
+            QuerySet: Offer queryset matching all search terms, ordered by relevance.
+        """
+        search_str = request.query_params.get(self.search_param, '')
+        searched_queryset = search_offers(queryset, search_str)
+        if searched_queryset is None:
+            return super().filter_queryset(request, queryset, view)
+        return searched_queryset
+    
+class OfferOrderingFilter(OrderingFilter):
+    """
+    Ordering filter for offers, mapping the 'min_price' ordering of the API
+    to the stored `min_price_cents` column.
+
+    Attributes:
+        field_map (dict): Maps ordering names of the API to model fields.
+    """
+    field_map = {'min_price': 'min_price_cents'}
+    
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the valid requested ordering with API names replaced by model fields.
+
+        Returns:
+            list: Ordering terms applicable to `order_by`.
+        """
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        return [self.map_term(term) for term in ordering]
+    
+    def map_term(self, term):
+        """
+        Maps a single ordering term, keeping a leading '-' for descending order.
+        """
+        prefix = '-' if term.startswith('-') else ''
+        name = term.lstrip('-')
+        return prefix + self.field_map.get(name, name)
+
+class OrderFilter(filters.FilterSet):
+    """
+    Filter set for the `Order` model, allowing filtering by status and creation time range.
+
+    Attributes:
+        status (ChoiceFilter): Filters orders by status.
+        created_after (IsoDateTimeFilter): Filters orders created at or after the specified time.
+        created_before (IsoDateTimeFilter): Filters orders created at or before the specified time.
+    """
+    status = filters.ChoiceFilter(choices=Order.STATUS_CHOICES)
+    created_after = filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='gte')
+    created_before = filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='lte')
+
+    class Meta:
+        model = Order
+        fields = ['status', 'created_after', 'created_before']
 
 class CustomerReviewFilter(filters.FilterSet):
     """
@@ -1,15 +1,245 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from django.core.exceptions import FieldDoesNotExist, FieldError, ValidationError
+from django.db.models import F, Q
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+# Range of the 64-bit integers accepted by the database.
+MIN_INTEGER = -2 ** 63
+MAX_INTEGER = 2 ** 63 - 1
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Cursor pagination based on the position of the last item of a page (keyset pagination).
+    The results are ordered by one of the view's `ordering_fields` (selected via the 'ordering'
+    query parameter) with the id as tie-breaker, so every page is a single indexed range query
+    and no count query is needed. Null values of the ordering field are placed last.
+
+    Attributes:
+        cursor_query_param (str): Query parameter name for the cursor. Defaults to 'cursor'.
+        ordering_query_param (str): Query parameter name for the ordering. Defaults to 'ordering'.
+        default_ordering (str): Ordering used if none or an invalid one is requested. Defaults to '-updated_at'.
+        ordering_field_map (dict): Maps ordering names of the API to model fields or annotations.
+        page_size (int): Default number of results per page. Defaults to 6.
+        page_size_query_param (str): Query parameter name for specifying the
+            number of results per page. Defaults to 'page_size'.
+        max_page_size (int): Maximum number of results allowed per page. Defaults to 60.
+    """
+    cursor_query_param = 'cursor'
+    ordering_query_param = 'ordering'
+    default_ordering = '-updated_at'
+    ordering_field_map = {}
+    page_size = 6
+    page_size_query_param = 'page_size'
+    max_page_size = 60
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns the page following the requested cursor position.
+        One additional item is fetched to determine whether a next page exists.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering_field, self.descending = self.get_ordering(request, view)
+        self.nullable = self.is_nullable(queryset.model, self.ordering_field)
+        position = self.decode_cursor(request)
+        if position is not None:
+            position = self.parse_position(self.get_output_field(queryset, self.ordering_field), *position)
+            queryset = queryset.filter(self.get_position_filter(*position))
+        results = list(queryset.order_by(*self.get_order_by())[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        """
+        Returns the requested page size, limited to `max_page_size`.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def get_ordering(self, request, view):
+        """
+        Returns the model field (or annotation) to order by and whether the order is descending.
+        Only the view's `ordering_fields` are accepted.
+        """
+        ordering = request.query_params.get(self.ordering_query_param, '').strip()
+        if ordering.lstrip('-') not in getattr(view, 'ordering_fields', []):
+            ordering = self.default_ordering
+        name = ordering.lstrip('-')
+        return self.ordering_field_map.get(name, name), ordering.startswith('-')
+
+    def is_nullable(self, model, field_name):
+        """
+        Checks whether the ordering field can hold null values. Annotations are treated as nullable.
+        """
+        try:
+            return model._meta.get_field(field_name).null
+        except FieldDoesNotExist:
+            return True
+
+    def get_output_field(self, queryset, field_name):
+        """
+        Returns the model field or the output field of the annotation to order by,
+        or None if its type is unknown.
+        """
+        try:
+            return queryset.model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            try:
+                return queryset.query.annotations[field_name].output_field
+            except (KeyError, FieldError):
+                return None
+
+    def parse_position(self, field, value, pk):
+        """
+        Converts a decoded position to the type of the ordering field, so forged cursors
+        are rejected before they reach the query.
+
+        Raises:
+            NotFound: If the value does not fit the ordering field or the id is no integer.
+        """
+        if isinstance(pk, bool) or not isinstance(pk, int) or not MIN_INTEGER <= pk <= MAX_INTEGER:
+            raise NotFound(self.invalid_cursor_message)
+        if value is None or field is None:
+            return value, pk
+        try:
+            value = field.to_python(value)
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if isinstance(value, int) and not MIN_INTEGER <= value <= MAX_INTEGER:
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk
+
+    def get_order_by(self):
+        """
+        Returns the order_by arguments of the ordering field and the id tie-breaker.
+        """
+        if self.descending:
+            return [F(self.ordering_field).desc(nulls_last=True), '-id']
+        return [F(self.ordering_field).asc(nulls_last=True), 'id']
+
+    def get_position_filter(self, value, pk):
+        """
+        Builds the filter selecting all items after the position (value, pk) in the current order.
+        """
+        field = self.ordering_field
+        beyond, id_beyond = ('lt', 'id__lt') if self.descending else ('gt', 'id__gt')
+        if value is None:
+            return Q(**{f"{field}__isnull": True, id_beyond: pk})
+        position_filter = Q(**{f"{field}__{beyond}": value}) | Q(**{field: value, id_beyond: pk})
+        if self.nullable:
+            position_filter |= Q(**{f"{field}__isnull": True})
+        return position_filter
+
+    def get_next_link(self):
+        """
+        Returns the URL of the next page, or None on the last page.
+        """
+        if not self.has_next:
+            return None
+        last_item = self.page[-1]
+        cursor = self.encode_cursor(getattr(last_item, self.ordering_field), last_item.pk)
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def encode_cursor(self, value, pk):
+        """
+        Encodes a position as URL-safe base64 JSON. Datetimes are stored in full ISO format.
+        """
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        position = json.dumps([value, pk])
+        return urlsafe_b64encode(position.encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, request):
+        """
+        Decodes the position of the requested cursor. An empty cursor requests the first page.
+
+        Raises:
+            NotFound: If the cursor is malformed.
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            value, pk = json.loads(urlsafe_b64decode(cursor.encode('ascii')))
+            return value, pk
+        except (TypeError, ValueError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+class OfferCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for offers, ordered by 'updated_at' or 'min_price' (the stored minimum price).
+    """
+    ordering_field_map = {'min_price': 'min_price_cents'}
+
+class OptInKeysetPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination. Results are only paginated if the 'cursor' query parameter
+    is given (an empty value requests the first page). Otherwise, the complete list is returned.
+    """
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+class OrderCursorPagination(OptInKeysetPagination):
+    """
+    Opt-in keyset pagination for orders, ordered by 'created_at', 'updated_at' or 'price'.
+    """
+    default_ordering = '-created_at'
+
+class ReviewCursorPagination(OptInKeysetPagination):
+    """
+    Opt-in keyset pagination for reviews, ordered by 'updated_at' or 'rating'.
+    """
+    default_ordering = '-updated_at'
 
 class OfferPagination(pagination.PageNumberPagination):
     """
     Custom pagination class for paginating offer results.
+    Page number pagination is the default. If the 'cursor' query parameter is given
+    (an empty value requests the first page), `OfferCursorPagination` is used instead,
+    which neither counts the results nor scans skipped pages.
 
     Attributes:
         page_size (int): Default number of results per page. Defaults to 6.
-        page_size_query_param (str): Query parameter name for specifying the 
+        page_size_query_param (str): Query parameter name for specifying the
             number of results per page. Defaults to 'page_size'.
         max_page_size (int): Maximum number of results allowed per page. Defaults to 60.
+        cursor_pagination_class (class): Pagination class used in cursor mode.
     """
     page_size = 6
     page_size_query_param = 'page_size'
-    max_page_size = 60
\ No newline at end of file
+    max_page_size = 60
+    cursor_pagination_class = OfferCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Delegates to the cursor pagination if requested, otherwise paginates by page number.
+        """
+        self.cursor_pagination = None
+        if self.cursor_pagination_class.cursor_query_param in request.query_params:
+            self.cursor_pagination = self.cursor_pagination_class()
+            return self.cursor_pagination.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_pagination:
+            return self.cursor_pagination.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -71,4 +71,4 @@ class IsReviewer(permissions.BasePermission):
         """
         Check if the user is the reviewer of the review object for access permissions.
         """
-        return obj.reviewer_profile.user == request.user
\ No newline at end of file
+        return obj.reviewer_profile.user_id == request.user.pk
\ No newline at end of file
@@ -1,9 +1,11 @@
-from django.contrib.auth.models import User
+from django.db import transaction
 from rest_framework import serializers
-from users_app.models import BusinessProfile, CustomerProfile
+from coderr_backend.utils import format_number
+from users_app.models import BusinessProfile
 from users_app.api.serializers import UserDetailsSerializer
+from users_app.utils.profiles import get_request_profile
 from content_app.models import Offer, OfferDetails, Order, CustomerReview
-from content_app.api.serializers.offer_details import OfferDetailsSerializer
+from content_app.api.serializers.offer_details import OfferDetailsSerializer, OfferDetailsLinkSerializer
 from content_app.utils.general import get_order_create_dict
 from content_app.utils.general import validate_attrs_has_only_selected_fields, validate_attrs_has_and_has_only_selected_fields
 from content_app.utils.serializers import create_offer_details, update_offer_details
@@ -15,14 +17,15 @@ class OfferSerializer(serializers.HyperlinkedModelSerializer):
     Attributes:
         user (SerializerMethodField): Returns the Offer creator's user ID.
         details (OfferDetailsSerializer): Serializes nested OfferDetails objects.
-        min_price (SerializerMethodField): Gets the minimum price from related OfferDetails.
-        min_delivery_time (SerializerMethodField): Gets the minimum delivery time from related OfferDetails.
+            Replaced by the compact `OfferDetailsLinkSerializer` for GET requests.
+        min_price (SerializerMethodField): The minimum price of the related OfferDetails, stored on the Offer.
+        min_delivery_time (IntegerField): The minimum delivery time of the related OfferDetails, stored on the Offer.
         image (FileField): The offer image file, read-only.
     """
     user = serializers.SerializerMethodField()
     details = OfferDetailsSerializer(many=True)
     min_price = serializers.SerializerMethodField()
-    min_delivery_time = serializers.SerializerMethodField()
+    min_delivery_time = serializers.IntegerField(source='min_delivery_time_in_days', read_only=True)
     image = serializers.SerializerMethodField()
     user_details = UserDetailsSerializer(source='business_profile.user', read_only=True)
         
@@ -30,25 +33,24 @@ class OfferSerializer(serializers.HyperlinkedModelSerializer):
         model = Offer
         fields = ['id', 'user', 'title', 'description', 'image', 'created_at', 'updated_at', 'details', 'min_price', 'min_delivery_time', 'user_details']
         
-    def to_representation(self, instance):
+    def get_fields(self):
         """
-        Removes 'user_details' field from POST response.
-        Updates context for details serializer with the current context.
+        Selects the field variants once per request rather than per represented offer:
+        compact details for GET requests and no 'user_details' field for POST requests.
         """
+        fields = super().get_fields()
         request = self.context.get('request', None)
-        if request and request.method == 'POST':
-            self.fields.pop('user_details')
-        self.fields['details'].context.update(self.context)
-        return super().to_representation(instance)
+        if request and request.method == 'GET':
+            fields['details'] = OfferDetailsLinkSerializer(many=True, read_only=True)
+        elif request and request.method == 'POST':
+            fields.pop('user_details')
+        return fields
         
     def get_user(self, obj):
-        return obj.business_profile.user.pk
+        return obj.business_profile.user_id
     
     def get_min_price(self, obj):
-        return float(obj.details.order_by('price_cents').first().price) if obj.details.exists() else None
-    
-    def get_min_delivery_time(self, obj):
-        return obj.details.order_by('delivery_time_in_days').first().delivery_time_in_days if obj.details.exists() else None
+        return format_number(obj.min_price_cents / 100, 2) if obj.min_price_cents is not None else None
     
     def get_image(self, obj):
         return obj.file.file.url if obj.file else None
@@ -68,24 +70,28 @@ class OfferSerializer(serializers.HyperlinkedModelSerializer):
     def create(self, validated_data):
         """
         Creates a new Offer as well as its associated OfferDetails.
+        The business profile is looked up once per request (see `get_request_profile`).
         """
         many_details_data = validated_data.pop('details', {})
-        user = User.objects.get(pk=self.context['request'].user.pk)
-        profile = BusinessProfile.objects.get(user=user)
+        profile = get_request_profile(self.context['request'])
         new_offer = Offer.objects.create(business_profile=profile, **validated_data)
         for single_details_data in many_details_data:
             create_offer_details(offer_id=new_offer.pk, data=single_details_data, context=self.context)
+        new_offer.refresh_from_db(fields=Offer.MIN_VALUE_FIELDS)
         return new_offer
     
     def update(self, instance, validated_data):
         """
-        Updates an existing Offer as well as its associated OfferDetails.
+        Updates an existing Offer as well as its associated OfferDetails in a single transaction.
+        The details are written in batches, after which the Offer (including its minimums)
+        is saved once.
         """
         details_data = validated_data.pop('details', [])
-        updated_offer = super().update(instance, validated_data)
-        for single_details_data in details_data:
-            update_offer_details(offer=updated_offer, data=single_details_data)
-        return updated_offer
+        with transaction.atomic():
+            if details_data:
+                details = update_offer_details(offer=instance, many_data=details_data)
+                instance.set_min_values(details)
+            return super().update(instance, validated_data)
     
 class OrderSerializer(serializers.HyperlinkedModelSerializer):
     """
@@ -109,13 +115,13 @@ class OrderSerializer(serializers.HyperlinkedModelSerializer):
         fields = ['id', 'customer_user', 'business_user', 'title', 'status', 'offer_detail_id', 'offer_type', 'created_at', 'updated_at', 'price', 'features', 'revisions', 'delivery_time_in_days']
         
     def get_customer_user(self, obj):
-        return obj.orderer_profile.user.pk
+        return obj.orderer_profile.user_id
     
     def get_business_user(self, obj):
-        return obj.business_profile.user.pk
+        return obj.business_profile.user_id
     
     def get_offer_type(self, obj):
-        return obj.offer_details.offer_type
+        return obj.offer_details.offer_type if obj.offer_details else None
     
     def get_features(self, obj):
         return obj.get_features_list()
@@ -134,11 +140,13 @@ class OrderSerializer(serializers.HyperlinkedModelSerializer):
     def create(self, validated_data):
         """
         Creates a new Order instance based on validated data.
+        The offer and its business profile are joined, and the customer profile
+        is looked up once per request (see `get_request_profile`).
         """
-        offer_details = OfferDetails.objects.get(pk=validated_data['offer_detail_id'])
-        offer = offer_details.offer
-        current_user = User.objects.get(pk=self.context['request'].user.pk)
-        order = Order.objects.create(**get_order_create_dict(current_user, offer_details))
+        offer_details = OfferDetails.objects.select_related('offer__business_profile').get(pk=validated_data['offer_detail_id'])
+        request = self.context['request']
+        profile = get_request_profile(request)
+        order = Order.objects.create(**get_order_create_dict(profile, offer_details))
         return order
     
 class CustomerReviewSerializer(serializers.HyperlinkedModelSerializer):
@@ -159,13 +167,14 @@ class CustomerReviewSerializer(serializers.HyperlinkedModelSerializer):
     def to_representation(self, instance):
         """
         Modifies the representation to include the business user's ID.
+        The user IDs are read from the profiles' foreign key columns, so no users are loaded.
         """
         representation = super().to_representation(instance)
-        representation['business_user'] = instance.business_profile.user.pk if instance.business_profile else None
+        representation['business_user'] = instance.business_profile.user_id if instance.business_profile else None
         return representation
 
     def get_reviewer(self, obj):
-        return obj.reviewer_profile.user.pk
+        return obj.reviewer_profile.user_id
     
     def validate(self, attrs):
         """
@@ -181,11 +190,11 @@ class CustomerReviewSerializer(serializers.HyperlinkedModelSerializer):
     def create(self, validated_data):
         """
         Creates a new CustomerReview based on validated data.
+        The customer profile is looked up once per request (see `get_request_profile`).
         """
-        current_user = User.objects.get(pk=self.context['request'].user.pk)
         business_user = validated_data.pop('business_user')
         review = CustomerReview.objects.create(
-            reviewer_profile=CustomerProfile.objects.get(user=current_user),
+            reviewer_profile=get_request_profile(self.context['request']),
             business_profile=BusinessProfile.objects.get(user=business_user),
             **validated_data,
         )
@@ -2,19 +2,44 @@ from rest_framework import serializers
 from content_app.models import Offer, OfferDetails
 from content_app.utils.general import features_list_to_str, merge_features_keys
 
-class OfferDetailsSerializer(serializers.HyperlinkedModelSerializer):
+class OfferDetailsLinkSerializer(serializers.ModelSerializer):
     """
-    Serializer for OfferDetails model, with support for URL generation, feature validation, and custom handling
-    of feature representation.
+    Compact read-only serializer for OfferDetails, representing the ID and URL only.
+    Used for the details nested in offer GET responses.
 
     Attributes:
         url (SerializerMethodField): Generates URL based on `obj.pk`.
+    """
+    url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = OfferDetails
+        fields = ['id', 'url']
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+        """
+        Builds the representation directly from the instance attributes.
+        """
+        return {'id': instance.pk, 'url': self.get_url(instance)}
+
+    def get_url(self, obj):
+        """
+        Generates a URL for the OfferDetails instance.
+        """
+        return f"/offerdetails/{obj.pk}/"
+
+class OfferDetailsSerializer(serializers.HyperlinkedModelSerializer):
+    """
+    Serializer for OfferDetails model, with support for feature validation and custom handling
+    of feature representation. See `OfferDetailsLinkSerializer` for the compact representation.
+
+    Attributes:
         features (ListField): A list of feature strings, sourced from `get_features_list`.
         offer_id (IntegerField): Write-only field for Offer ID, allowing linkage on creation.
         offer_type (CharField): Required Offer type string.
         price (CharField): Required price string.
     """
-    url = serializers.SerializerMethodField()
     features = serializers.ListField(
         child=serializers.CharField(max_length=31),
         source='get_features_list'
@@ -25,22 +50,7 @@ class OfferDetailsSerializer(serializers.HyperlinkedModelSerializer):
 
     class Meta:
         model = OfferDetails
-        fields = ['id', 'offer_id', 'url', 'title', 'offer_type', 'price', 'features', 'revisions', 'delivery_time_in_days']
-        
-    def to_representation(self, instance):
-        """
-        Customizes the output fields based on the request path and method.
-        """
-        request = self.context.get('request', None)
-        if request:
-            if 'offers' in request.path and request.method == 'GET':
-                allowed_fields = {'id', 'url'}
-                existing_fields = set(self.fields.keys())
-                for field_name in existing_fields - allowed_fields:
-                    self.fields.pop(field_name)
-            else:
-                self.fields.pop('url', None)
-        return super().to_representation(instance)
+        fields = ['id', 'offer_id', 'title', 'offer_type', 'price', 'features', 'revisions', 'delivery_time_in_days']
         
     def validate_features(self, value):
         """
@@ -49,12 +59,6 @@ class OfferDetailsSerializer(serializers.HyperlinkedModelSerializer):
         if any(',,' in feature for feature in value):
             raise serializers.ValidationError('No double commas allowed.')
         return value
-    
-    def get_url(self, obj):
-        """
-        Generates a URL for the OfferDetails instance.
-        """
-        return f"/offerdetails/{obj.pk}/"
 
     def create(self, validated_data):
         """
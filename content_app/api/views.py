@@ -1,29 +1,40 @@
 from django.db import IntegrityError
-from django.db.models import Min, Q
+from django.db.models import Q, Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, viewsets, filters
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from coderr_backend.utils import ConditionalGetMixin
+from users_app.utils.profiles import get_profile_ids, get_request_profile
 from users_app.api.permissions import ReadOnly, PostAsBusinessUser, PostAsCustomerUser
 from uploads_app.utils import handle_file_update
 from content_app.utils.general import get_integrity_error_response, update_offer
+from content_app.utils.bulk import validate_offers_bulk_data, bulk_create_offers
 from content_app.models import Offer, OfferDetails, Order, CustomerReview
+from content_app.cache import get_cached_offer_data, cache_offer_data, get_offer_cache_stats
 from .serializers.general import OfferSerializer, OfferDetailsSerializer, OrderSerializer, CustomerReviewSerializer
-from .filters import OfferFilter, CustomerReviewFilter
-from .pagination import OfferPagination
+from .filters import OfferFilter, OfferSearchFilter, OfferOrderingFilter, OrderFilter, CustomerReviewFilter
+from .pagination import OfferPagination, OrderCursorPagination, ReviewCursorPagination
 from .permissions import IsAdmin, IsCreator, PatchAsCreator, IsReviewer
 
-class OfferViewSet(viewsets.ModelViewSet):
+class OfferViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for handling CRUD operations on the Offer model.
+    GET requests are answered conditionally, also considering changes of the creator's profile.
     """
-    queryset = Offer.objects.all().annotate(min_price=Min('details__price_cents'))
+    queryset = Offer.objects.select_related(
+        'business_profile__user', 'file'
+    ).prefetch_related(
+        Prefetch('details', queryset=OfferDetails.objects.order_by('price_cents'))
+    )
     serializer_class = OfferSerializer
     permission_classes = [PostAsBusinessUser|IsCreator|ReadOnly]
     pagination_class = OfferPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OfferSearchFilter, OfferOrderingFilter]
     filterset_class = OfferFilter
     search_fields = ['title', 'description']
     ordering_fields = ['updated_at', 'min_price']
+    conditional_fields = ['updated_at', 'business_profile__updated_at']
 
     def create(self, request, *args, **kwargs):
         """
@@ -39,6 +50,63 @@ class OfferViewSet(viewsets.ModelViewSet):
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         except IntegrityError as e:
             return get_integrity_error_response(e)
+        
+    @action(detail=False, methods=['post'], url_path='bulk', url_name='bulk')
+    def bulk_create(self, request):
+        """
+        Handle bulk Offer creation requests with a list of offers (e.g. for catalogue imports).
+        Valid offers are created in a single transaction, while invalid offers (including title
+        conflicts) are reported per item without aborting the batch.
+
+        Returns:
+            Response: HTTP 201 with the created Offers and per-item errors,
+                HTTP 400 if no Offer could be created, or HTTP 409/500 on error.
+        """
+        if not isinstance(request.data, list):
+            return Response({'error': 'Es wird eine Liste von Angeboten erwartet.'}, status=status.HTTP_400_BAD_REQUEST)
+        profile = get_request_profile(request)
+        many_validated_data, errors = validate_offers_bulk_data(request.data, profile, self.get_serializer_context())
+        if not many_validated_data:
+            return Response({'created': [], 'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            offers = bulk_create_offers(many_validated_data, profile)
+        except IntegrityError as e:
+            return get_integrity_error_response(e)
+        created_offers = self.get_queryset().filter(pk__in=[offer.pk for offer in offers]).order_by('pk')
+        serializer = self.get_serializer(created_offers, many=True)
+        return Response({'created': serializer.data, 'errors': errors}, status=status.HTTP_201_CREATED)
+        
+    def get_retrieve_response(self, request, *args, **kwargs):
+        """
+        Handle Offer detail requests via the offer cache (see `content_app.cache`).
+        A cached representation is used as long as the 'updated_at' timestamps of the offer
+        and its business profile (updated by a profile PATCH) are unchanged, so that changes
+        also reach processes with their own memory cache. Changes which update neither timestamp
+        invalidate the cache via `content_app.signals`.
+
+        Returns:
+            Response: HTTP 200 with Offer data, or HTTP 404 if the Offer does not exist.
+        """
+        try:
+            pk = int(kwargs['pk'])
+        except (TypeError, ValueError):
+            return super().get_retrieve_response(request, *args, **kwargs)
+        version = Offer.objects.filter(pk=pk).values_list('updated_at', 'business_profile__updated_at').first()
+        if version is None:
+            return super().get_retrieve_response(request, *args, **kwargs)
+        data = get_cached_offer_data(pk, version)
+        if data is None:
+            response = super().get_retrieve_response(request, *args, **kwargs)
+            cache_offer_data(pk, version, response.data)
+            return response
+        return Response(data)
+    
+    @action(detail=False, methods=['get'], url_path='cache-stats', permission_classes=[IsAdmin])
+    def cache_stats(self, request):
+        """
+        Returns the hit and miss counters of the offer cache for admin users.
+        """
+        return Response(get_offer_cache_stats())
             
     def update(self, request, *args, **kwargs):
         """
@@ -55,41 +123,59 @@ class OfferViewSet(viewsets.ModelViewSet):
         offer_serializer = self.get_serializer(instance, data=request.data, partial=partial)
         return update_offer(offer_view=self, offer_serializer=offer_serializer)
     
-class OfferDetailsViewSet(viewsets.ModelViewSet):
+class OfferDetailsViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for handling CRUD operations on the OfferDetails model.
     Permissions are set to 'ReadOnly' because OfferDetails are written
-    via OfferViewSet PATCH requests. 
+    via OfferViewSet PATCH requests, which update the offer's 'updated_at' timestamp.
+    GET requests are therefore answered conditionally based on that timestamp.
     """
     queryset = OfferDetails.objects.all()
     serializer_class = OfferDetailsSerializer
     permission_classes = [ReadOnly]
+    conditional_fields = ['offer__updated_at']
     
 class OrderViewSet(viewsets.ModelViewSet):
     """
     ViewSet for handling CRUD operations on the Order model.
+    The list can be filtered by status and creation time and is paginated if a cursor is requested.
     """
     serializer_class = OrderSerializer
     permission_classes = [PostAsCustomerUser|PatchAsCreator|IsAdmin|ReadOnly]
+    pagination_class = OrderCursorPagination
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_class = OrderFilter
+    ordering_fields = ['created_at', 'updated_at', 'price']
     
     def get_queryset(self):
         """
         Filter queryset to return orders featuring the authenticated user only.
+        The user's profile IDs are resolved once, so the orders are filtered by the indexed
+        profile columns instead of joining both profile tables.
+        The profiles and offer details are joined, so the serializer reads the user IDs
+        and the offer type without further queries.
         """
         user = self.request.user
         if not user.is_authenticated:
             return Order.objects.none()
-        return Order.objects.filter(
-            Q(business_profile__user=user) | Q(orderer_profile__user=user)
-        )
+        customer_profile_id, business_profile_id = get_profile_ids(user.pk)
+        profile_filter = Q(pk__in=[])
+        if customer_profile_id is not None:
+            profile_filter |= Q(orderer_profile_id=customer_profile_id)
+        if business_profile_id is not None:
+            profile_filter |= Q(business_profile_id=business_profile_id)
+        return Order.objects.filter(profile_filter).select_related('orderer_profile', 'business_profile', 'offer_details')
     
-class CustomerReviewViewSet(viewsets.ModelViewSet):
+class CustomerReviewViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for handling CRUD operations on the CustomerReview model.
+    GET requests are answered conditionally. The list is paginated if a cursor is requested.
+    The profiles are joined, so the serializer reads the user IDs without further queries.
     """
-    queryset = CustomerReview.objects.all()
+    queryset = CustomerReview.objects.select_related('business_profile', 'reviewer_profile')
     serializer_class = CustomerReviewSerializer
     permission_classes = [PostAsCustomerUser|IsReviewer|IsAdmin|ReadOnly]
+    pagination_class = ReviewCursorPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = CustomerReviewFilter
     ordering_fields = ['updated_at', 'rating']
\ No newline at end of file
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ContentAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'content_app'
+
+    def ready(self):
+        """
+        Connects the offer cache invalidation signals.
+        """
+        import content_app.signals
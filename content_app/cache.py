@@ -0,0 +1,89 @@
+from django.conf import settings
+from django.core.cache import cache
+
+OFFER_CACHE_KEY_PREFIX = 'offer-detail'
+OFFER_CACHE_HITS_KEY = 'offer-cache:hits'
+OFFER_CACHE_MISSES_KEY = 'offer-cache:misses'
+
+def get_offer_cache_key(pk):
+    """
+    Returns the cache key of an offer representation.
+
+    Args:
+        pk (int): The offer ID.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"{OFFER_CACHE_KEY_PREFIX}:{pk}"
+
+def get_cached_offer_data(pk, version):
+    """
+    Returns the cached representation of an offer, if it was cached for the given version,
+    i.e. the 'updated_at' timestamps of the offer and its business profile.
+    Counts the lookup as a cache hit or miss.
+
+    Args:
+        pk (int): The offer ID.
+        version (tuple): The current 'updated_at' timestamps of the offer and its business profile.
+
+    Returns:
+        dict: The cached offer data, or None on a cache miss.
+    """
+    entry = cache.get(get_offer_cache_key(pk))
+    hit = entry is not None and entry[0] == version
+    count_offer_cache_access(hit)
+    return entry[1] if hit else None
+
+def cache_offer_data(pk, version, data):
+    """
+    Caches the representation of an offer together with its version.
+
+    Args:
+        pk (int): The offer ID.
+        version (tuple): The 'updated_at' timestamps of the represented offer and its business profile.
+        data (dict): The serialized offer data.
+    """
+    cache.set(get_offer_cache_key(pk), (version, data), timeout=settings.OFFER_CACHE_TIMEOUT)
+
+def invalidate_offer_cache(pks):
+    """
+    Removes the cached representations of the given offers.
+
+    Args:
+        pks (iterable): The offer IDs.
+    """
+    keys = [get_offer_cache_key(pk) for pk in pks]
+    if keys:
+        cache.delete_many(keys)
+
+def count_offer_cache_access(hit):
+    """
+    Increments the offer cache hit or miss counter.
+
+    Args:
+        hit (bool): Whether the lookup was a cache hit.
+    """
+    key = OFFER_CACHE_HITS_KEY if hit else OFFER_CACHE_MISSES_KEY
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+def get_offer_cache_stats():
+    """
+    Returns the offer cache hit and miss counters and the resulting hit rate.
+
+    Returns:
+        dict: Dictionary containing 'hits', 'misses' and 'hit_rate'.
+    """
+    counters = cache.get_many([OFFER_CACHE_HITS_KEY, OFFER_CACHE_MISSES_KEY])
+    hits = counters.get(OFFER_CACHE_HITS_KEY, 0)
+    misses = counters.get(OFFER_CACHE_MISSES_KEY, 0)
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / lookups, 4) if lookups else None,
+    }
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from content_app.utils.orders import get_outdated_order_counts, recount_orders
+
+class Command(BaseCommand):
+    """
+    Recounts or verifies the order counts stored on each business profile.
+
+    Usage:
+        python manage.py recount_orders
+        python manage.py recount_orders --verify
+    """
+    help = 'Recounts the in-progress, completed and cancelled orders stored on business profiles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report business profiles with drifted counts, without writing. Fails if any are found.',
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            outdated_profiles = get_outdated_order_counts()
+            if outdated_profiles:
+                ids = ', '.join(str(profile.pk) for profile in outdated_profiles)
+                raise CommandError(f"{len(outdated_profiles)} business profiles have drifted order counts: {ids}")
+            self.stdout.write(self.style.SUCCESS('All order counts are up to date.'))
+            return
+        outdated_profiles = recount_orders()
+        self.stdout.write(self.style.SUCCESS(f"Recounted the orders of {len(outdated_profiles)} business profiles."))
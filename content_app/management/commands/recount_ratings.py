@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from content_app.utils.ratings import get_outdated_rating_aggregates, recount_ratings
+
+class Command(BaseCommand):
+    """
+    Recounts or verifies the rating aggregates stored on each business profile.
+
+    Usage:
+        python manage.py recount_ratings
+        python manage.py recount_ratings --verify
+    """
+    help = 'Recounts the rating count, rating sum and rating histogram stored on business profiles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report business profiles with drifted rating aggregates, without writing. Fails if any are found.',
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            outdated_profiles = get_outdated_rating_aggregates()
+            if outdated_profiles:
+                ids = ', '.join(str(profile.pk) for profile in outdated_profiles)
+                raise CommandError(f"{len(outdated_profiles)} business profiles have drifted rating aggregates: {ids}")
+            self.stdout.write(self.style.SUCCESS('All rating aggregates are up to date.'))
+            return
+        outdated_profiles = recount_ratings()
+        self.stdout.write(self.style.SUCCESS(f"Recounted the ratings of {len(outdated_profiles)} business profiles."))
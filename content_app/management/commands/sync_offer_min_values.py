@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils.timezone import now
+from content_app.models import Offer
+
+class Command(BaseCommand):
+    """
+    Backfills or verifies the minimum price and delivery time stored on each offer.
+
+    Usage:
+        python manage.py sync_offer_min_values
+        python manage.py sync_offer_min_values --verify
+    """
+    help = 'Backfills the minimum price and delivery time stored on offers from their details.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report offers with outdated minimums, without writing. Fails if any are found.',
+        )
+
+    def handle(self, *args, **options):
+        outdated_offers = self.get_outdated_offers()
+        if options['verify']:
+            if outdated_offers:
+                ids = ', '.join(str(offer.pk) for offer in outdated_offers)
+                raise CommandError(f"{len(outdated_offers)} offers have outdated minimums: {ids}")
+            self.stdout.write(self.style.SUCCESS('All offer minimums are up to date.'))
+            return
+        Offer.objects.bulk_update(outdated_offers, [*Offer.MIN_VALUE_FIELDS, 'updated_at'], batch_size=1000)
+        self.stdout.write(self.style.SUCCESS(f"Updated the minimums of {len(outdated_offers)} offers."))
+
+    def get_outdated_offers(self):
+        """
+        Aggregates the minimums of all offers in one query and returns the offers whose
+        stored minimums differ, with the stored values and `updated_at` already corrected in memory.
+
+        Returns:
+            list: Offers with outdated minimums.
+        """
+        offers = Offer.objects.annotate(
+            actual_min_price_cents=Min('details__price_cents'),
+            actual_min_delivery_time_in_days=Min('details__delivery_time_in_days'),
+        ).only('id', *Offer.MIN_VALUE_FIELDS)
+        outdated_offers = []
+        updated_at = now()
+        for offer in offers.iterator(chunk_size=2000):
+            actual_values = {field: getattr(offer, f"actual_{field}") for field in Offer.MIN_VALUE_FIELDS}
+            if any(getattr(offer, field) != value for field, value in actual_values.items()):
+                for field, value in actual_values.items():
+                    setattr(offer, field, value)
+                offer.updated_at = updated_at
+                outdated_offers.append(offer)
+        return outdated_offers
@@ -0,0 +1,93 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:15
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('uploads_app', '0001_initial'),
+        ('users_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Offer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(blank=True, default=None, max_length=63, null=True)),
+                ('description', models.CharField(blank=True, default=None, max_length=1023, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('min_price_cents', models.PositiveIntegerField(blank=True, db_index=True, default=None, null=True)),
+                ('min_delivery_time_in_days', models.PositiveIntegerField(blank=True, db_index=True, default=None, null=True)),
+                ('business_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='offers', to='users_app.businessprofile')),
+                ('file', models.OneToOneField(blank=True, default=None, null=True, on_delete=django.db.models.deletion.SET_NULL, to='uploads_app.fileupload')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='OfferDetails',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('offer_type', models.CharField(choices=[('basic', 'basic'), ('standard', 'standard'), ('premium', 'premium')], default='standard', max_length=16)),
+                ('title', models.CharField(blank=True, default=None, max_length=31, null=True)),
+                ('price_cents', models.PositiveIntegerField(blank=True, default=None, null=True)),
+                ('features', models.CharField(blank=True, default='', max_length=255)),
+                ('revisions', models.IntegerField(blank=True, default=None, null=True, validators=[django.core.validators.MinValueValidator(-1)])),
+                ('delivery_time_in_days', models.PositiveIntegerField(blank=True, default=None, null=True)),
+                ('offer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='details', to='content_app.offer')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Order',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('in_progress', 'in_progress'), ('completed', 'completed'), ('cancelled', 'cancelled')], default='in_progress', max_length=16)),
+                ('title', models.CharField(blank=True, default=None, max_length=63, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('price', models.FloatField(blank=True, default=None, null=True)),
+                ('features', models.CharField(blank=True, default='', max_length=255)),
+                ('revisions', models.IntegerField(blank=True, default=None, null=True, validators=[django.core.validators.MinValueValidator(-1)])),
+                ('delivery_time_in_days', models.PositiveIntegerField(blank=True, default=None, null=True)),
+                ('business_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users_app.businessprofile')),
+                ('offer_details', models.ForeignKey(blank=True, default=None, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='content_app.offerdetails')),
+                ('orderer_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='orders', to='users_app.customerprofile')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CustomerReview',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.PositiveIntegerField(blank=True, default=None, null=True, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(5)])),
+                ('description', models.CharField(blank=True, default=None, max_length=1023, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('business_profile', models.ForeignKey(blank=True, default=None, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='users_app.businessprofile')),
+                ('reviewer_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='users_app.customerprofile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('reviewer_profile', 'business_profile'), name='unique_reviewer_business')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='offer',
+            constraint=models.UniqueConstraint(fields=('business_profile', 'title'), name='unique_profile_title'),
+        ),
+        migrations.AddIndex(
+            model_name='offerdetails',
+            index=models.Index(fields=['offer', 'price_cents'], name='details_offer_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='offerdetails',
+            index=models.Index(fields=['offer', 'delivery_time_in_days'], name='details_offer_delivery_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='offerdetails',
+            constraint=models.UniqueConstraint(fields=('offer_type', 'offer'), name='unique_offer_offer_type'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+from django.db.models import Count
+
+COUNT_FIELDS = {
+    'in_progress': 'in_progress_order_count',
+    'completed': 'completed_order_count',
+    'cancelled': 'cancelled_order_count',
+}
+
+def count_business_orders(apps, schema_editor):
+    """
+    Fills the order counts of the business profiles from the existing orders.
+    """
+    Order = apps.get_model('content_app', 'Order')
+    BusinessProfile = apps.get_model('users_app', 'BusinessProfile')
+    profiles = {}
+    for row in Order.objects.values('business_profile_id', 'status').annotate(count=Count('id')).order_by():
+        field = COUNT_FIELDS.get(row['status'])
+        if field:
+            profile = profiles.setdefault(row['business_profile_id'], BusinessProfile(pk=row['business_profile_id']))
+            setattr(profile, field, row['count'])
+    BusinessProfile.objects.bulk_update(profiles.values(), list(COUNT_FIELDS.values()), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content_app', '0002_lookup_indexes'),
+        ('users_app', '0002_business_order_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(count_business_orders, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+from django.db.models import Count
+
+RATING_HISTOGRAM_FIELDS = [
+    'rating_0_count', 'rating_1_count', 'rating_2_count', 'rating_3_count', 'rating_4_count', 'rating_5_count',
+]
+
+def count_business_ratings(apps, schema_editor):
+    """
+    Fills the rating aggregates of the business profiles from the existing reviews.
+    """
+    CustomerReview = apps.get_model('content_app', 'CustomerReview')
+    BusinessProfile = apps.get_model('users_app', 'BusinessProfile')
+    profiles = {}
+    reviews = CustomerReview.objects.filter(business_profile__isnull=False, rating__isnull=False)
+    for row in reviews.values('business_profile_id', 'rating').annotate(count=Count('id')).order_by():
+        profile = profiles.setdefault(row['business_profile_id'], BusinessProfile(pk=row['business_profile_id']))
+        profile.rating_count += row['count']
+        profile.rating_sum += row['count'] * row['rating']
+        setattr(profile, RATING_HISTOGRAM_FIELDS[row['rating']], row['count'])
+    BusinessProfile.objects.bulk_update(
+        profiles.values(), ['rating_count', 'rating_sum'] + RATING_HISTOGRAM_FIELDS, batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content_app', '0003_recount_business_orders'),
+        ('users_app', '0003_business_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.RunPython(count_business_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content_app', '0004_recount_business_ratings'),
+        ('users_app', '0003_business_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['orderer_profile', 'business_profile'], name='order_orderer_business_idx'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+from django.db import migrations
+
+OFFER_TABLE = 'content_app_offer'
+OFFER_SEARCH_TABLE = 'content_app_offer_fts'
+
+SQLITE_SEARCH_INDEX_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {OFFER_SEARCH_TABLE} USING fts5(
+        title, description, content='{OFFER_TABLE}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {OFFER_SEARCH_TABLE}_insert AFTER INSERT ON {OFFER_TABLE} BEGIN
+        INSERT INTO {OFFER_SEARCH_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {OFFER_SEARCH_TABLE}_delete AFTER DELETE ON {OFFER_TABLE} BEGIN
+        INSERT INTO {OFFER_SEARCH_TABLE}({OFFER_SEARCH_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {OFFER_SEARCH_TABLE}_update AFTER UPDATE OF title, description ON {OFFER_TABLE} BEGIN
+        INSERT INTO {OFFER_SEARCH_TABLE}({OFFER_SEARCH_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {OFFER_SEARCH_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"INSERT INTO {OFFER_SEARCH_TABLE}({OFFER_SEARCH_TABLE}) VALUES ('rebuild')",
+]
+SQLITE_SEARCH_INDEX_REVERSE_SQL = [
+    f"DROP TRIGGER IF EXISTS {OFFER_SEARCH_TABLE}_insert",
+    f"DROP TRIGGER IF EXISTS {OFFER_SEARCH_TABLE}_delete",
+    f"DROP TRIGGER IF EXISTS {OFFER_SEARCH_TABLE}_update",
+    f"DROP TABLE IF EXISTS {OFFER_SEARCH_TABLE}",
+]
+
+POSTGRESQL_SEARCH_INDEX_SQL = [
+    f"""
+    CREATE INDEX IF NOT EXISTS {OFFER_TABLE}_search_idx ON {OFFER_TABLE}
+    USING GIN (to_tsvector('simple', COALESCE({OFFER_TABLE}.title, '') || ' ' || COALESCE({OFFER_TABLE}.description, '')))
+    """,
+]
+POSTGRESQL_SEARCH_INDEX_REVERSE_SQL = [
+    f"DROP INDEX IF EXISTS {OFFER_TABLE}_search_idx",
+]
+
+
+class RunVendorSQL(migrations.RunSQL):
+    """
+    Runs the SQL only on databases of the given vendor, since the full-text index is engine-specific.
+    Other engines fall back to the `SearchFilter` lookups and need no index.
+    """
+    def __init__(self, vendor, *args, **kwargs):
+        self.vendor = vendor
+        super().__init__(*args, **kwargs)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+    """
+    Creates the offer full-text search index (see `content_app.search`). Databases on which
+    the index was created by an earlier post_migrate hook keep it, and its content is rebuilt.
+    """
+
+    dependencies = [
+        ('content_app', '0005_order_profiles_index'),
+    ]
+
+    operations = [
+        RunVendorSQL('sqlite', SQLITE_SEARCH_INDEX_SQL, SQLITE_SEARCH_INDEX_REVERSE_SQL),
+        RunVendorSQL('postgresql', POSTGRESQL_SEARCH_INDEX_SQL, POSTGRESQL_SEARCH_INDEX_REVERSE_SQL),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content_app', '0006_offer_search_index'),
+        ('users_app', '0006_business_rating_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='customerreview',
+            constraint=models.CheckConstraint(condition=models.Q(('rating__isnull', True), models.Q(('rating__gte', 0), ('rating__lte', 5)), _connector='OR'), name='review_rating_range'),
+        ),
+    ]
@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Min, OuterRef, Subquery
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
+from django.utils.timezone import now
 from django.utils.translation import gettext as _
 from users_app.models import BusinessProfile, CustomerProfile
 from uploads_app.models import FileUpload
@@ -18,18 +20,79 @@ class Offer(models.Model):
         features (CharField): Features of the offer, stored as a comma-separated string.
         revisions (IntegerField): Number of revisions allowed, minimum -1. Optional.
         delivery_time_in_days (PositiveIntegerField): Delivery time for the offer in days. Optional.
+        min_price_cents (PositiveIntegerField): Lowest price in cents of the offer details, stored on write.
+        min_delivery_time_in_days (PositiveIntegerField): Lowest delivery time of the offer details, stored on write.
     """
+    MIN_VALUE_FIELDS = ['min_price_cents', 'min_delivery_time_in_days']
     business_profile = models.ForeignKey(BusinessProfile, on_delete=models.CASCADE, related_name='offers')
     title = models.CharField(max_length=63, default=None, blank=True, null=True)
     description = models.CharField(max_length=1023, default=None, blank=True, null=True)
     file = models.OneToOneField(FileUpload, on_delete=models.SET_NULL, default=None, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price_cents = models.PositiveIntegerField(default=None, blank=True, null=True, db_index=True)
+    min_delivery_time_in_days = models.PositiveIntegerField(default=None, blank=True, null=True, db_index=True)
     
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=['business_profile', 'title'], name='unique_profile_title')
         ]
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='offer_updated_idx'),
+        ]
+        
+    def set_min_values(self, details=None):
+        """
+        Sets the minimum price and delivery time from the offer details without saving.
+
+        Args:
+            details (iterable): The complete offer details, if already loaded.
+                Otherwise, the minimums are aggregated in a single query.
+        """
+        if details is None:
+            min_values = self.details.aggregate(
+                min_price_cents=Min('price_cents'),
+                min_delivery_time_in_days=Min('delivery_time_in_days'),
+            )
+        else:
+            details = list(details)
+            min_values = {
+                'min_price_cents': min((d.price_cents for d in details if d.price_cents is not None), default=None),
+                'min_delivery_time_in_days': min((d.delivery_time_in_days for d in details if d.delivery_time_in_days is not None), default=None),
+            }
+        for attr, value in min_values.items():
+            setattr(self, attr, value)
+            
+    def update_min_values(self, details=None):
+        """
+        Sets and saves the minimum price and delivery time from the offer details.
+        `updated_at` is saved as well, so the validators of conditional GET requests
+        and the offer cache follow the changed minimums.
+
+        Args:
+            details (iterable): The complete offer details, if already loaded.
+        """
+        self.set_min_values(details)
+        self.save(update_fields=[*self.MIN_VALUE_FIELDS, 'updated_at'])
+        
+    @classmethod
+    def update_min_values_of(cls, offer_ids):
+        """
+        Updates the minimum price and delivery time and `updated_at` of the given offers
+        with a single UPDATE query, aggregating the minimums in subqueries.
+        Called when offer details are saved or deleted (also by a queryset). Writes bypassing both,
+        such as `OfferDetails.objects.bulk_create` or `update`, have to call it themselves
+        (or run the `sync_offer_min_values` command).
+
+        Args:
+            offer_ids (iterable): The offer IDs.
+        """
+        details = OfferDetails.objects.filter(offer=OuterRef('pk')).order_by().values('offer')
+        cls.objects.filter(pk__in=offer_ids).update(
+            min_price_cents=Subquery(details.annotate(value=Min('price_cents')).values('value')),
+            min_delivery_time_in_days=Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+            updated_at=now(),
+        )
     
 class OfferDetails(models.Model):
     """
@@ -80,6 +143,10 @@ class OfferDetails(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['offer_type', 'offer'], name='unique_offer_offer_type')
         ]
+        indexes = [
+            models.Index(fields=['offer', 'price_cents'], name='details_offer_price_idx'),
+            models.Index(fields=['offer', 'delivery_time_in_days'], name='details_offer_delivery_idx'),
+        ]
         
     def get_features_list(self):
         """
@@ -99,6 +166,20 @@ class OfferDetails(models.Model):
         """
         self.features = features_list_to_str(features_list)
         
+    def save(self, *args, **kwargs):
+        """
+        Overrides save to keep the minimums stored on the offer up to date.
+        A deletion updates them via `content_app.signals`.
+
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        super().save(*args, **kwargs)
+        Offer.update_min_values_of([self.offer_id])
+        if OfferDetails.offer.is_cached(self):
+            self.offer.refresh_from_db(fields=[*Offer.MIN_VALUE_FIELDS, 'updated_at'])
+        
 class Order(models.Model):
     """
     Model representing a customer order for an offer.
@@ -122,6 +203,11 @@ class Order(models.Model):
             (COMPLETED, _(COMPLETED)),
             (CANCELLED, _(CANCELLED)),
     )
+    COUNT_FIELDS = {
+        IN_PROGRESS: 'in_progress_order_count',
+        COMPLETED: 'completed_order_count',
+        CANCELLED: 'cancelled_order_count',
+    }
     status = models.CharField(
         max_length=16,
         choices=STATUS_CHOICES,
@@ -138,6 +224,48 @@ class Order(models.Model):
     revisions = models.IntegerField(validators=[MinValueValidator(-1)], default=None, blank=True, null=True)
     delivery_time_in_days = models.PositiveIntegerField(default=None, blank=True, null=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_profile', 'status'], name='order_business_status_idx'),
+            models.Index(fields=['business_profile', 'created_at'], name='order_business_created_idx'),
+            models.Index(fields=['orderer_profile', 'created_at'], name='order_orderer_created_idx'),
+            models.Index(fields=['orderer_profile', 'business_profile'], name='order_orderer_business_idx'),
+        ]
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the business profile and status of a loaded order, as counted on the business profile.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance.set_counted_as()
+        return instance
+    
+    def set_counted_as(self):
+        """
+        Remembers the current business profile and status as counted on the business profile.
+        Unknown if either field is deferred.
+        """
+        if 'business_profile_id' in self.__dict__ and 'status' in self.__dict__:
+            self._counted_as = (self.business_profile_id, self.status)
+        else:
+            self._counted_as = None
+    
+    @classmethod
+    def update_order_count(cls, business_profile_id, status, delta):
+        """
+        Changes the stored count of orders with a status on a business profile by an atomic update.
+
+        Args:
+            business_profile_id (int): The ID of the business profile.
+            status (str): The order status.
+            delta (int): The change of the count.
+        """
+        field = cls.COUNT_FIELDS.get(status)
+        if business_profile_id is None or field is None:
+            return
+        BusinessProfile.objects.filter(pk=business_profile_id).update(**{field: F(field) + delta})
+    
     def get_features_list(self):
         """
         Converts the features string to a list.
@@ -147,6 +275,18 @@ class Order(models.Model):
         """
         return get_features_list_from_str(self.features)
     
+    def save(self, *args, **kwargs):
+        """
+        Overrides save to update the order counts of the business profile in the same transaction
+        (see `content_app.signals`).
+
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+    
 class CustomerReview(models.Model):
     """
     Model representing a customer review of a business.
@@ -169,15 +309,105 @@ class CustomerReview(models.Model):
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=['reviewer_profile', 'business_profile'], name='unique_reviewer_business'),
+            models.CheckConstraint(
+                condition=models.Q(rating__isnull=True) | models.Q(rating__gte=0, rating__lte=5), name='review_rating_range',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['updated_at'], name='review_updated_idx'),
+            models.Index(fields=['business_profile', 'updated_at'], name='review_business_updated_idx'),
+            models.Index(fields=['business_profile', 'rating'], name='review_business_rating_idx'),
         ]
         
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the business profile and rating of a loaded review, as counted in the rating aggregates,
+        and its profiles, as checked for a corresponding order.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance.set_counted_as()
+        instance.set_checked_profiles()
+        return instance
+    
+    def set_counted_as(self):
+        """
+        Remembers the current business profile and rating as counted in the rating aggregates.
+        Unknown if either field is deferred.
+        """
+        if 'business_profile_id' in self.__dict__ and 'rating' in self.__dict__:
+            self._counted_as = (self.business_profile_id, self.rating)
+        else:
+            self._counted_as = None
+    
+    def set_checked_profiles(self):
+        """
+        Remembers the current reviewer and business profiles as checked for a corresponding order.
+        Unknown if either field is deferred.
+        """
+        if 'reviewer_profile_id' in self.__dict__ and 'business_profile_id' in self.__dict__:
+            self._checked_profiles = (self.reviewer_profile_id, self.business_profile_id)
+        else:
+            self._checked_profiles = None
+    
+    @classmethod
+    def update_rating_aggregates(cls, business_profile_id, rating, delta):
+        """
+        Changes the stored rating aggregates of a business profile by an atomic update.
+        Also sets the profile's 'rating_updated_at' timestamp, since the aggregates are part of its representation.
+        Its 'updated_at' timestamp is left untouched, so the cached offers of the business stay valid.
+
+        Args:
+            business_profile_id (int): The ID of the business profile. Nothing is changed if None.
+            rating (int): The rating to add or remove. Nothing is changed if None.
+            delta (int): 1 to add the rating, -1 to remove it.
+        """
+        if business_profile_id is None or rating is None:
+            return
+        histogram_field = BusinessProfile.RATING_HISTOGRAM_FIELDS[rating]
+        BusinessProfile.objects.filter(pk=business_profile_id).update(
+            rating_count=F('rating_count') + delta,
+            rating_sum=F('rating_sum') + delta * rating,
+            rating_updated_at=now(),
+            **{histogram_field: F(histogram_field) + delta},
+        )
+        
+    @classmethod
+    def check_orders(cls, reviews):
+        """
+        Checks for many reviews at once whether a corresponding order exists, in a single query.
+        Reviews with a corresponding order are remembered as checked, so saving them runs no further check.
+
+        Args:
+            reviews (list): The reviews to check.
+
+        Returns:
+            list: The reviews without a corresponding order.
+        """
+        ordered_profiles = set(Order.objects.filter(
+            orderer_profile_id__in={review.reviewer_profile_id for review in reviews},
+            business_profile_id__in={review.business_profile_id for review in reviews},
+        ).values_list('orderer_profile_id', 'business_profile_id').distinct())
+        reviews_without_order = []
+        for review in reviews:
+            if (review.reviewer_profile_id, review.business_profile_id) in ordered_profiles:
+                review.set_checked_profiles()
+            else:
+                reviews_without_order.append(review)
+        return reviews_without_order
+        
     def clean(self):
         """
         Validates that a review can only be created if a corresponding order exists.
+        The check is skipped if the reviewer and business profiles were already checked,
+        i.e. for a loaded review whose profiles did not change.
 
         Raises:
             ValidationError: If no matching order exists.
         """
+        checked_profiles = getattr(self, '_checked_profiles', None)
+        if checked_profiles is not None and checked_profiles == (self.reviewer_profile_id, self.business_profile_id):
+            return
         if not Order.objects.filter(
             business_profile=self.business_profile, 
             orderer_profile=self.reviewer_profile,
@@ -189,10 +419,15 @@ class CustomerReview(models.Model):
     def save(self, *args, **kwargs):
         """
         Overrides save to include custom validation.
+        Saves in a transaction, so the rating aggregates are updated together with the review,
+        and remembers the saved profiles and rating afterwards.
 
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
         self.clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        self.set_counted_as()
+        self.set_checked_profiles()
\ No newline at end of file
@@ -0,0 +1,68 @@
+import re
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+# The full-text search index is created by the migration '0006_offer_search_index'.
+OFFER_TABLE = 'content_app_offer'
+OFFER_SEARCH_TABLE = 'content_app_offer_fts'
+
+POSTGRESQL_SEARCH_DOCUMENT = (
+    f"to_tsvector('simple', COALESCE({OFFER_TABLE}.title, '') || ' ' || COALESCE({OFFER_TABLE}.description, ''))"
+)
+
+def get_search_terms(search_str):
+    """
+    Splits a search string into lower-case word terms, dropping any operator characters.
+
+    Args:
+        search_str (str): The raw search string from the request.
+
+    Returns:
+        list: List of search terms.
+    """
+    return re.findall(r'\w+', search_str.lower())
+
+def search_offers(queryset, search_str):
+    """
+    Filters an offer queryset by the full-text search index and orders it by relevance.
+    Every term has to match as a word or word prefix within the title or description.
+
+    Args:
+        queryset (QuerySet): The offer queryset to search.
+        search_str (str): The raw search string from the request.
+
+    Returns:
+        QuerySet: Searched offer queryset annotated with 'search_rank',
+            or None if the database engine has no search index.
+    """
+    terms = get_search_terms(search_str)
+    if not terms:
+        return queryset
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        match = ' '.join(f'"{term}"*' for term in terms)
+        document_matches = Q(pk__in=RawSQL(f"SELECT rowid FROM {OFFER_SEARCH_TABLE} WHERE {OFFER_SEARCH_TABLE} MATCH %s", (match,)))
+        # The ranks of all matches are read by a single MATCH query. 'LIMIT -1' keeps SQLite from
+        # merging it into the correlated subquery, which would re-run the MATCH query for every offer.
+        rank = RawSQL(
+            f"""
+            SELECT ranked.rank FROM (
+                SELECT rowid, rank FROM {OFFER_SEARCH_TABLE} WHERE {OFFER_SEARCH_TABLE} MATCH %s LIMIT -1
+            ) AS ranked
+            WHERE ranked.rowid = {OFFER_TABLE}.id
+            """,
+            (match,),
+            output_field=FloatField(),
+        )
+        return queryset.filter(document_matches).annotate(search_rank=rank).order_by('search_rank', '-pk')
+    if vendor == 'postgresql':
+        match = ' & '.join(f"{term}:*" for term in terms)
+        document_matches = RawSQL(
+            f"{POSTGRESQL_SEARCH_DOCUMENT} @@ to_tsquery('simple', %s)", (match,), output_field=BooleanField()
+        )
+        rank = RawSQL(
+            f"ts_rank({POSTGRESQL_SEARCH_DOCUMENT}, to_tsquery('simple', %s))", (match,), output_field=FloatField()
+        )
+        return queryset.filter(document_matches).annotate(search_rank=rank).order_by('-search_rank', '-pk')
+    return None
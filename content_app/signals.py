@@ -0,0 +1,113 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from users_app.models import BusinessProfile
+from uploads_app.models import FileUpload
+from content_app.models import Offer, OfferDetails, Order, CustomerReview
+from content_app.cache import invalidate_offer_cache
+from content_app.utils.orders import recount_orders
+from content_app.utils.ratings import recount_ratings
+
+OFFER_CACHED_USER_FIELDS = {'username', 'first_name', 'last_name'}
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def invalidate_offer(sender, instance, **kwargs):
+    """
+    Invalidates the cached representation of a saved or deleted offer.
+    """
+    invalidate_offer_cache([instance.pk])
+
+@receiver(post_save, sender=OfferDetails)
+@receiver(post_delete, sender=OfferDetails)
+def invalidate_offer_of_details(sender, instance, **kwargs):
+    """
+    Invalidates the cached representation of the offer of saved or deleted offer details.
+    """
+    invalidate_offer_cache([instance.offer_id])
+
+@receiver(post_delete, sender=OfferDetails)
+def update_offer_min_values_on_delete(sender, instance, **kwargs):
+    """
+    Updates the minimums stored on the offer of deleted offer details, also if deleted by a queryset.
+    """
+    Offer.update_min_values_of([instance.offer_id])
+
+@receiver(post_save, sender=FileUpload)
+@receiver(pre_delete, sender=FileUpload)
+def invalidate_offer_of_file(sender, instance, **kwargs):
+    """
+    Invalidates the cached representation of the offer using a saved or deleted file.
+    Deletions are handled before the offer's file reference is set to null.
+    """
+    invalidate_offer_cache(Offer.objects.filter(file_id=instance.pk).values_list('pk', flat=True))
+
+@receiver(post_save, sender=BusinessProfile)
+def invalidate_offers_of_business_profile(sender, instance, created, **kwargs):
+    """
+    Invalidates the cached representations of all offers of a saved business profile.
+    """
+    if not created:
+        invalidate_offer_cache(instance.offers.values_list('pk', flat=True))
+
+@receiver(post_save, sender=User)
+def invalidate_offers_of_user(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Invalidates the cached representations of all offers of a saved user,
+    unless only fields were saved which the offer representation does not contain.
+    """
+    if created or (update_fields and not OFFER_CACHED_USER_FIELDS.intersection(update_fields)):
+        return
+    invalidate_offer_cache(
+        Offer.objects.filter(business_profile__user_id=instance.pk).values_list('pk', flat=True)
+    )
+
+@receiver(post_save, sender=Order)
+def update_order_counts_on_save(sender, instance, created, **kwargs):
+    """
+    Updates the order counts of the business profile for a created order or a changed status.
+    If the previously counted status of an updated order is unknown, the business profile is recounted.
+    """
+    counted_as = None if created else getattr(instance, '_counted_as', None)
+    current = (instance.business_profile_id, instance.status)
+    if counted_as == current:
+        return
+    if not created and counted_as is None:
+        recount_orders(business_profile_ids=[instance.business_profile_id])
+    else:
+        if counted_as is not None:
+            Order.update_order_count(*counted_as, -1)
+        Order.update_order_count(*current, 1)
+    instance.set_counted_as()
+
+@receiver(post_delete, sender=Order)
+def update_order_counts_on_delete(sender, instance, **kwargs):
+    """
+    Updates the order counts of the business profile for a deleted order, also if deleted by a cascade.
+    """
+    Order.update_order_count(instance.business_profile_id, instance.status, -1)
+
+@receiver(post_save, sender=CustomerReview)
+def update_rating_aggregates_on_save(sender, instance, created, **kwargs):
+    """
+    Updates the rating aggregates of the business profile for a created review or a changed rating.
+    If the previously counted rating of an updated review is unknown, the business profile is recounted.
+    """
+    counted_as = None if created else getattr(instance, '_counted_as', None)
+    current = (instance.business_profile_id, instance.rating)
+    if counted_as == current:
+        return
+    if not created and counted_as is None:
+        if instance.business_profile_id is not None:
+            recount_ratings(business_profile_ids=[instance.business_profile_id])
+    else:
+        if counted_as is not None:
+            CustomerReview.update_rating_aggregates(*counted_as, -1)
+        CustomerReview.update_rating_aggregates(*current, 1)
+
+@receiver(post_delete, sender=CustomerReview)
+def update_rating_aggregates_on_delete(sender, instance, **kwargs):
+    """
+    Updates the rating aggregates of the business profile for a deleted review, also if deleted by a cascade.
+    """
+    CustomerReview.update_rating_aggregates(instance.business_profile_id, instance.rating, -1)
@@ -0,0 +1,84 @@
+from unittest import skipUnless
+from django.db import connection
+from rest_framework.test import APITestCase
+from content_app.models import Offer, Order, CustomerReview
+from content_app.tests.tests_reviews import General as ReviewsTests
+
+@skipUnless(connection.vendor == 'sqlite', 'The query plans are specific to SQLite.')
+class QueryPlanTests(APITestCase):
+    """
+    Tests that the hot lookups of the API are served by the indexes of the migrations
+    rather than by table scans or temporary sort trees.
+    """
+    def setUp(self):
+        """
+        Inherits the reviews tests general setup, which creates offers, orders and reviews.
+        """
+        ReviewsTests.setUp(self)
+        
+    def assertUsesIndex(self, queryset, index_name):
+        """
+        Asserts that the query plan of the queryset uses the index and neither scans
+        the table without an index nor sorts the results separately.
+        """
+        plan = queryset.explain()
+        self.assertIn(f"INDEX {index_name}", plan)
+        self.assertNotIn('USE TEMP B-TREE', plan)
+        for line in plan.splitlines():
+            if 'SCAN' in line:
+                self.assertIn('USING', line)
+        
+    def test_order_count_by_business_and_status(self):
+        """
+        Tests the query plan of the order counts of the statistics views.
+        
+        Asserts:
+            - The orders are searched via `order_business_status_idx`.
+        """
+        queryset = Order.objects.filter(business_profile=self.business_profile, status=Order.IN_PROGRESS)
+        self.assertUsesIndex(queryset, 'order_business_status_idx')
+        
+    def test_order_list_by_profile_and_created_at(self):
+        """
+        Tests the query plans of the order lists of business and customer users, newest first.
+        
+        Asserts:
+            - The orders are searched via `order_business_created_idx` and `order_orderer_created_idx`.
+        """
+        queryset = Order.objects.filter(business_profile=self.business_profile).order_by('-created_at')
+        self.assertUsesIndex(queryset, 'order_business_created_idx')
+        queryset = Order.objects.filter(orderer_profile=self.customer_profile).order_by('-created_at')
+        self.assertUsesIndex(queryset, 'order_orderer_created_idx')
+        
+    def test_order_check_by_orderer_and_business(self):
+        """
+        Tests the query plan of the order check of reviews.
+        
+        Asserts:
+            - The orders are searched via `order_orderer_business_idx`.
+        """
+        queryset = Order.objects.filter(orderer_profile=self.customer_profile, business_profile=self.business_profile)
+        self.assertUsesIndex(queryset.values('pk')[:1], 'order_orderer_business_idx')
+
+    def test_offer_list_by_updated_at(self):
+        """
+        Tests the query plan of the offer list ordered by last update, as used by the cursor pagination.
+        
+        Asserts:
+            - The offers are scanned in order of `offer_updated_idx`.
+        """
+        queryset = Offer.objects.order_by('-updated_at', '-id')[:6]
+        self.assertUsesIndex(queryset, 'offer_updated_idx')
+        
+    def test_review_list_by_updated_at_and_rating(self):
+        """
+        Tests the query plans of the review lists, ordered by last update or by rating of a business.
+        
+        Asserts:
+            - The reviews are scanned in order of `review_updated_idx`.
+            - The reviews of a business are searched via `review_business_updated_idx` and `review_business_rating_idx`.
+        """
+        self.assertUsesIndex(CustomerReview.objects.order_by('-updated_at'), 'review_updated_idx')
+        queryset = CustomerReview.objects.filter(business_profile=self.business_profile)
+        self.assertUsesIndex(queryset.order_by('-updated_at'), 'review_business_updated_idx')
+        self.assertUsesIndex(queryset.order_by('-rating'), 'review_business_rating_idx')
@@ -1,13 +1,21 @@
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils.timezone import now
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
 from coderr_backend.utils import reverse_with_queryparams
 from users_app.models import BusinessProfile
 from content_app.models import Offer, OfferDetails
+from content_app.api.pagination import KeysetPagination
 from content_app.utils.general import features_list_to_str
 import copy
+from io import StringIO
 
 class General(APITestCase):
     """
@@ -17,7 +25,9 @@ class General(APITestCase):
         """
         Creates a business user, business profile, and an offer with associated offer details.
         Configures the client with an authorization token for the business user.
+        Clears the cache to start without cached offers and cache counters.
         """
+        cache.clear()
         self.business_user = User.objects.create_user(username='businessuser', password='businesspassword')
         self.business_profile = BusinessProfile.objects.create(user=self.business_user, location='businesslocation', description='businessdescription')
         self.offer = Offer.objects.create(business_profile=self.business_profile, title='testtitle', description='testdescription')
@@ -159,6 +169,20 @@ class OfferTests(APITestCase):
             min_price_int = int(float(offer_data['min_price']))
             self.assertLessEqual(min_price_int, self.QUERY_PARAMS['min_price'])
         
+    def test_get_offer_list_filter_no_duplicates(self):
+        """
+        Tests that offers with several matching details are returned only once.
+        
+        Asserts:
+            - 200 OK status.
+            - The offer, whose three details all match both filters, is counted and listed once.
+        """
+        url = reverse_with_queryparams('offer-list', min_price=200, max_delivery_time=10)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual([offer_data['id'] for offer_data in response.data['results']], [self.offer.pk])
+        
     def test_post_offer_list_ok(self):
         """
         Tests successful creation of an offer with multiple details.
@@ -168,6 +192,7 @@ class OfferTests(APITestCase):
             - Three details are included in the created offer.
             - Image key exists in results but is None.
             - 'user_details' key is not in response data.
+            - Nested details are complete but contain no 'url'.
         """
         url = reverse('offer-list')
         response = self.client.post(url, self.CREATE_DATA, format='json')
@@ -175,6 +200,9 @@ class OfferTests(APITestCase):
         self.assertEqual(len(response.data['details']), 3)
         self.assertEqual(response.data['image'], None)
         self.assertNotIn('user_details', response.data)
+        for details_data in response.data['details']:
+            self.assertNotIn('url', details_data)
+            self.assertIn('price', details_data)
         
     def test_post_offer_list_double_title_unique_constraint(self):
         """
@@ -190,6 +218,63 @@ class OfferTests(APITestCase):
         self.assertEqual(response_first.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response_second.status_code, status.HTTP_409_CONFLICT)
         
+    def test_post_offer_bulk_partial_errors(self):
+        """
+        Tests bulk creation of offers with invalid items, which are reported per item.
+        
+        Asserts:
+            - 201 Created status.
+            - The valid offer is created with its details and minimums.
+            - Title conflicts with an existing offer and within the batch are reported by index.
+            - A missing offer type is reported by index.
+        """
+        invalid_details_data = copy.deepcopy(self.CREATE_DATA)
+        invalid_details_data['title'] = 'invalidtitle'
+        invalid_details_data['details'][0].pop('offer_type')
+        data = [
+            self.CREATE_DATA,
+            {**self.CREATE_DATA, 'title': self.offer.title},
+            self.CREATE_DATA,
+            invalid_details_data,
+        ]
+        response = self.client.post(reverse('offer-bulk'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['created']), 1)
+        self.assertEqual(len(response.data['created'][0]['details']), 3)
+        self.assertEqual(response.data['created'][0]['min_price'], 100)
+        self.assertEqual([error['index'] for error in response.data['errors']], [1, 2, 3])
+        self.assertIn('title', response.data['errors'][0]['errors'])
+        self.assertIn('title', response.data['errors'][1]['errors'])
+        self.assertIn('details', response.data['errors'][2]['errors'])
+        
+    def test_post_offer_bulk_query_count_constant(self):
+        """
+        Tests that the number of queries of a bulk creation does not depend on the number of offers.
+        
+        Asserts:
+            - 201 Created status for both batch sizes.
+            - Equal query counts for both batch sizes.
+        """
+        self.client.get(reverse('offer-list'))
+        query_counts = []
+        for batch_size in (2, 20):
+            data = [{**self.CREATE_DATA, 'title': f"bulktitle{batch_size}-{i}"} for i in range(batch_size)]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(reverse('offer-bulk'), data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            query_counts.append(len(context.captured_queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+        
+    def test_post_offer_bulk_no_list_bad_request(self):
+        """
+        Tests bulk creation with a single offer instead of a list.
+        
+        Asserts:
+            - 400 Bad Request status.
+        """
+        response = self.client.post(reverse('offer-bulk'), self.CREATE_DATA, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
     def test_post_offer_list_double_offer_type_validation_err(self):
         """
         Tests validation error for duplicate offer types in offer details.
@@ -210,12 +295,48 @@ class OfferTests(APITestCase):
         Asserts:
             - 200 OK status.
             - 'user_details' fields exist nested in response data.
+            - Nested details contain only 'id' and 'url'.
         """
         url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         for key in ('username', 'first_name', 'last_name'):
             self.assertIn(key, response.data['user_details'])
+        for details_data in response.data['details']:
+            self.assertEqual(details_data, {'id': details_data['id'], 'url': f"/offerdetails/{details_data['id']}/"})
+        
+    def test_get_offer_detail_min_values_ok(self):
+        """
+        Tests that the minimum price and delivery time are derived from the offer details.
+        
+        Asserts:
+            - 200 OK status.
+            - 'min_price' matches the lowest details price as a float.
+            - 'min_delivery_time' matches the lowest details delivery time.
+        """
+        self.details_basic.price = 50
+        self.details_basic.delivery_time_in_days = 2
+        self.details_basic.save()
+        url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['min_price'], 50.0)
+        self.assertEqual(response.data['min_delivery_time'], 2)
+        
+    def test_patch_offer_detail_min_price_updated(self):
+        """
+        Tests that the minimum price in the PATCH response reflects the updated details.
+        
+        Asserts:
+            - 200 OK status.
+            - 'min_price' matches the patched details price.
+        """
+        data = copy.deepcopy(self.PATCH_DATA)
+        data['details'][0]['price'] = '12.50'
+        url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+        response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['min_price'], 12.5)
         
     def test_patch_offer_detail_ok(self):
         """
@@ -237,6 +358,35 @@ class OfferTests(APITestCase):
         for key in ('username', 'first_name', 'last_name'):
             self.assertIn(key, response.data['user_details'])
         
+    def test_patch_offer_detail_all_tiers_batched(self):
+        """
+        Tests that a PATCH of all three tiers writes the details in a single query.
+        
+        Asserts:
+            - 200 OK status.
+            - One UPDATE of the details, writing only the changed price column.
+            - One UPDATE of the offer, which bumps 'updated_at'.
+            - The prices and minimum price are updated.
+        """
+        data = {'details': [
+            {'offer_type': offer_type, 'price': price}
+            for offer_type, price in ((OfferDetails.BASIC, '50.00'), (OfferDetails.STANDARD, '150.00'), (OfferDetails.PREMIUM, '250.00'))
+        ]}
+        url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+        updated_at = self.offer.updated_at
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        details_updates = [q['sql'] for q in context.captured_queries if q['sql'].startswith('UPDATE "content_app_offerdetails"')]
+        offer_updates = [q['sql'] for q in context.captured_queries if q['sql'].startswith('UPDATE "content_app_offer"')]
+        self.assertEqual(len(details_updates), 1)
+        self.assertNotIn('"title"', details_updates[0])
+        self.assertEqual(len(offer_updates), 1)
+        self.offer.refresh_from_db()
+        self.assertGreater(self.offer.updated_at, updated_at)
+        self.assertEqual(sorted(self.offer.details.values_list('price_cents', flat=True)), [5000, 15000, 25000])
+        self.assertEqual(response.data['min_price'], 50)
+        
     def test_patch_offer_detail_double_title_unique_constraint(self):
         """
         Tests unique constraint on title during offer update.
@@ -288,4 +438,408 @@ class OfferTests(APITestCase):
         """
         url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
         response = self.client.delete(url)
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        
+class OfferMinValuesTests(APITestCase):
+    """
+    Tests for the minimum price and delivery time stored on offers.
+    """
+    def setUp(self):
+        """
+        Inherits the general setup for creating test data.
+        """
+        General.setUp(self)
+        
+    def test_details_save_updates_min_values(self):
+        """
+        Tests that saving and deleting details keeps the stored minimums up to date.
+        
+        Asserts:
+            - The minimums follow a cheaper and faster detail.
+            - The minimums are reset after deleting that detail.
+        """
+        self.details_basic.price = 20
+        self.details_basic.delivery_time_in_days = 1
+        self.details_basic.save()
+        self.offer.refresh_from_db()
+        self.assertEqual((self.offer.min_price_cents, self.offer.min_delivery_time_in_days), (2000, 1))
+        self.details_basic.delete()
+        self.offer.refresh_from_db()
+        self.assertEqual((self.offer.min_price_cents, self.offer.min_delivery_time_in_days), (10000, 6))
+        
+    def test_details_queryset_delete_updates_min_values(self):
+        """
+        Tests that deleting details by a queryset updates the stored minimums and the offer timestamp.
+        
+        Asserts:
+            - The minimums are reset after deleting the cheapest detail by a queryset.
+            - The offer's 'updated_at' timestamp is newer.
+        """
+        self.details_basic.price = 20
+        self.details_basic.save()
+        updated_at = Offer.objects.get(pk=self.offer.pk).updated_at
+        OfferDetails.objects.filter(pk=self.details_basic.pk).delete()
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price_cents, 10000)
+        self.assertGreater(self.offer.updated_at, updated_at)
+        
+    def test_sync_offer_min_values_command(self):
+        """
+        Tests verifying and backfilling outdated minimums with the management command.
+        
+        Asserts:
+            - Verification fails for an outdated offer.
+            - The backfill restores the minimums, after which verification succeeds.
+        """
+        Offer.objects.filter(pk=self.offer.pk).update(min_price_cents=None, min_delivery_time_in_days=None)
+        with self.assertRaises(CommandError):
+            call_command('sync_offer_min_values', verify=True, stdout=StringIO())
+        call_command('sync_offer_min_values', stdout=StringIO())
+        call_command('sync_offer_min_values', verify=True, stdout=StringIO())
+        self.offer.refresh_from_db()
+        self.assertEqual((self.offer.min_price_cents, self.offer.min_delivery_time_in_days), (10000, 6))
+        
+class OfferCacheTests(APITestCase):
+    """
+    Tests for the cache of the offer detail endpoint.
+    """
+    def setUp(self):
+        """
+        Inherits the general setup for creating test data.
+        """
+        General.setUp(self)
+        self.url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+        
+    def test_get_offer_detail_cached(self):
+        """
+        Tests that a repeated offer detail request is served from the cache.
+        
+        Asserts:
+            - Both responses are equal.
+            - The second request only queries the validators and the offer timestamp
+              (the token authentication is cached by the first request).
+            - The cache counters show one miss and one hit.
+        """
+        first_response = self.client.get(self.url)
+        with self.assertNumQueries(2):
+            second_response = self.client.get(self.url)
+        self.assertEqual(first_response.data, second_response.data)
+        admin_user = User.objects.create_user(username='adminuser', password='adminpassword', is_staff=True)
+        self.client.force_authenticate(user=admin_user)
+        response = self.client.get(reverse('offer-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+        
+    def test_get_offer_detail_cache_invalidated(self):
+        """
+        Tests that changes of the details and the creator's name invalidate the cached offer.
+        
+        Asserts:
+            - The minimum price follows a changed detail.
+            - The user details follow a changed first name.
+        """
+        self.client.get(self.url)
+        self.details_basic.price = 20
+        self.details_basic.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['min_price'], 20)
+        self.business_user.first_name = 'newfirstname'
+        self.business_user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['user_details']['first_name'], 'newfirstname')
+        
+    def test_get_offer_detail_cache_profile_version(self):
+        """
+        Tests that a changed business profile invalidates the cached offer without the signals,
+        as required for processes with their own memory cache.
+
+        Asserts:
+            - The user details follow a first name changed without signals once the profile timestamp changes.
+        """
+        self.client.get(self.url)
+        User.objects.filter(pk=self.business_user.pk).update(first_name='newfirstname')
+        BusinessProfile.objects.filter(pk=self.business_profile.pk).update(updated_at=now())
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['user_details']['first_name'], 'newfirstname')
+
+    def test_get_offer_detail_cache_key_normalized(self):
+        """
+        Tests that an offer requested with a zero-padded ID is cached under its numeric ID.
+
+        Asserts:
+            - The user details follow a changed first name for the zero-padded URL.
+        """
+        url = reverse('offer-detail', kwargs={'pk': f"0{self.offer.pk}"})
+        self.client.get(url)
+        self.business_user.first_name = 'newfirstname'
+        self.business_user.save()
+        response = self.client.get(url)
+        self.assertEqual(response.data['user_details']['first_name'], 'newfirstname')
+
+    def test_get_offer_cache_stats_forbidden(self):
+        """
+        Tests that the cache counters are available to admin users only.
+        
+        Asserts:
+            - 403 Forbidden status.
+        """
+        response = self.client.get(reverse('offer-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        
+class OfferConditionalGetTests(APITestCase):
+    """
+    Tests for conditional GET requests of offers and offer details.
+    """
+    def setUp(self):
+        """
+        Inherits the general setup for creating test data.
+        """
+        General.setUp(self)
+        
+    def test_get_offer_list_not_modified(self):
+        """
+        Tests that an unchanged offer list is answered with 304 by a single aggregate query.
+        
+        Asserts:
+            - The first response has 'ETag' and 'Last-Modified' headers.
+            - The repeated request with 'If-None-Match' gets a 304 response without data,
+              running only the aggregate query (the token authentication is cached by the first request).
+        """
+        url = reverse('offer-list')
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response.headers)
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response.headers['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        
+    def test_get_offer_modified_by_details_save(self):
+        """
+        Tests that saving details outside the API changes the validators of the offer and its details.
+        
+        Asserts:
+            - 200 OK status with the new minimum price for the previous offer ETag.
+            - 200 OK status for the previous details ETag.
+        """
+        offer_url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+        details_url = reverse('offerdetails-detail', kwargs={'pk': self.details_basic.pk})
+        offer_etag = self.client.get(offer_url).headers['ETag']
+        details_etag = self.client.get(details_url).headers['ETag']
+        self.details_basic.price = 20
+        self.details_basic.save()
+        response = self.client.get(offer_url, HTTP_IF_NONE_MATCH=offer_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['min_price'], 20)
+        response = self.client.get(details_url, HTTP_IF_NONE_MATCH=details_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+    def test_get_offer_detail_modified(self):
+        """
+        Tests that changes of the offer and the creator's profile change the offer's ETag.
+        
+        Asserts:
+            - 200 OK status after updating the offer, with a new ETag.
+            - 200 OK status after updating the creator's profile.
+        """
+        url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+        etag = self.client.get(url).headers['ETag']
+        self.client.patch(url, {'title': 'newtitle'}, format='json')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        etag = response.headers['ETag']
+        self.business_profile.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+    def test_get_offerdetails_detail_not_modified(self):
+        """
+        Tests that unchanged offer details are answered with 304.
+        
+        Asserts:
+            - 304 Not Modified status.
+        """
+        url = reverse('offerdetails-detail', kwargs={'pk': self.details_basic.pk})
+        etag = self.client.get(url).headers['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+class OfferSearchTests(APITestCase):
+    """
+    Tests for the full-text search of the offer list.
+    """
+    def setUp(self):
+        """
+        Inherits the general setup and adds two offers mentioning a logo with different relevance.
+        """
+        General.setUp(self)
+        self.logo_offer = Offer.objects.create(business_profile=self.business_profile, title='Logo Design', description='Logo in drei Varianten.')
+        self.web_offer = Offer.objects.create(business_profile=self.business_profile, title='Internetauftritt', description='Eine Webseite mit Kontaktformular, Impressum und eingebundenem Logo.')
+        
+    def get_search_result_ids(self, search_str):
+        """
+        Returns the offer IDs of the search results in the order of the response.
+        """
+        url = reverse_with_queryparams('offer-list', search=search_str)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [offer_data['id'] for offer_data in response.data['results']]
+        
+    def test_get_offer_list_search_ranked_ok(self):
+        """
+        Tests that search results contain matching offers only, ordered by relevance.
+        
+        Asserts:
+            - The offer mentioning the term in its title and description ranks first.
+            - Offers not matching the term are excluded.
+        """
+        self.assertEqual(self.get_search_result_ids('logo'), [self.logo_offer.pk, self.web_offer.pk])
+        
+    def test_get_offer_list_search_prefix_ok(self):
+        """
+        Tests that every search term is matched as a word prefix, ignoring operator characters.
+        
+        Asserts:
+            - Only the offer matching all term prefixes is returned.
+        """
+        self.assertEqual(self.get_search_result_ids('"Webs* Kontakt-'), [self.web_offer.pk])
+        
+    def test_get_offer_list_search_after_update_ok(self):
+        """
+        Tests that the search index follows title updates and deletions of offers.
+        
+        Asserts:
+            - The old title is no longer found after an update.
+            - The new title is found after an update.
+            - Deleted offers are no longer found.
+        """
+        self.web_offer.title = 'Homepage'
+        self.web_offer.save()
+        self.logo_offer.delete()
+        self.assertEqual(self.get_search_result_ids('internetauftritt'), [])
+        self.assertEqual(self.get_search_result_ids('homepage'), [self.web_offer.pk])
+        self.assertEqual(self.get_search_result_ids('logo design'), [])
+        
+    def test_get_offer_list_search_all_matches_ranked(self):
+        """
+        Tests that the best-ranked match is returned first, however many newer matches exist.
+        
+        Asserts:
+            - The count covers every match.
+            - The oldest offer, mentioning the term in its title and description, ranks first.
+        """
+        for index in range(5):
+            Offer.objects.create(business_profile=self.business_profile, title=f"Angebot {index}", description='Mit Logo.')
+        url = reverse_with_queryparams('offer-list', search='logo')
+        response = self.client.get(url)
+        self.assertEqual(response.data['count'], 7)
+        self.assertEqual(response.data['results'][0]['id'], self.logo_offer.pk)
+        
+class OfferQueryCountTests(APITestCase):
+    """
+    Tests pinning the number of database queries of the offer list, independent of the page size.
+    
+    Attributes:
+        OFFER_COUNT (int): Number of offers available for the list, matching the maximum page size.
+        LIST_QUERY_COUNT (int): Expected queries (validators, count, page, details prefetch)
+            once the token authentication is cached.
+    """
+    OFFER_COUNT = 60
+    LIST_QUERY_COUNT = 4
+    
+    def setUp(self):
+        """
+        Inherits the general setup and adds offers with details until `OFFER_COUNT` is reached.
+        """
+        General.setUp(self)
+        for index in range(self.OFFER_COUNT - Offer.objects.count()):
+            offer = Offer.objects.create(business_profile=self.business_profile, title=f"title{index}")
+            for offer_type in (OfferDetails.BASIC, OfferDetails.STANDARD, OfferDetails.PREMIUM):
+                OfferDetails.objects.create(offer_type=offer_type, offer=offer, **OfferDetailsTests.CREATE_DATA)
+                
+    def test_get_offer_list_query_count_constant(self):
+        """
+        Tests that a full page costs as many queries as a small page.
+        
+        Asserts:
+            - 200 OK status for both page sizes.
+            - `LIST_QUERY_COUNT` queries for both page sizes.
+            - The full page contains `OFFER_COUNT` offers.
+        """
+        self.client.get(reverse('offer-list'))
+        for page_size in (6, self.OFFER_COUNT):
+            url = reverse_with_queryparams('offer-list', page_size=page_size)
+            with self.assertNumQueries(self.LIST_QUERY_COUNT):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), self.OFFER_COUNT)
+
+        
+class OfferCursorPaginationTests(APITestCase):
+    """
+    Tests for the opt-in cursor mode of the offer list.
+    """
+    def setUp(self):
+        """
+        Inherits the general setup and adds offers with equal prices as well as an offer without details.
+        """
+        General.setUp(self)
+        for index in range(7):
+            offer = Offer.objects.create(business_profile=self.business_profile, title=f"title{index}")
+            OfferDetails.objects.create(offer_type=OfferDetails.BASIC, offer=offer, **OfferDetailsTests.CREATE_DATA)
+        Offer.objects.create(business_profile=self.business_profile, title='nodetails')
+        
+    def get_all_pages(self, **params):
+        """
+        Follows the 'next' links of the cursor mode and collects the offer IDs of all pages.
+        """
+        url = reverse_with_queryparams('offer-list', cursor='', page_size=3, **params)
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            ids += [offer_data['id'] for offer_data in response.data['results']]
+            url = response.data['next']
+        return ids
+        
+    def test_get_offer_list_cursor_ok(self):
+        """
+        Tests that paging through the cursor mode returns every offer exactly once in the requested order.
+        
+        Asserts:
+            - Each ordering returns all offers without duplicates.
+            - Offers are ordered by ascending minimum price, the offer without details coming last.
+        """
+        for ordering in ('updated_at', '-updated_at', 'min_price', '-min_price'):
+            ids = self.get_all_pages(ordering=ordering)
+            self.assertEqual(sorted(ids), list(Offer.objects.order_by('id').values_list('id', flat=True)))
+        ids = self.get_all_pages(ordering='min_price')
+        self.assertEqual(ids[-1], Offer.objects.get(title='nodetails').pk)
+        
+    def test_get_offer_list_invalid_cursor_not_found(self):
+        """
+        Tests the response to a malformed cursor.
+        
+        Asserts:
+            - 404 Not Found status.
+        """
+        url = reverse_with_queryparams('offer-list', cursor='invalid')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_get_offer_list_forged_cursor_not_found(self):
+        """
+        Tests the response to well-formed cursors with positions not matching the ordering field or the id.
+        
+        Asserts:
+            - 404 Not Found status for every forged cursor and ordering.
+        """
+        forged_positions = [('abc', 1), ([1], 1), ({'a': 1}, 1), (1, 'abc'), (1, 1.5), (1, [1]), (2 ** 64, 1), (1, 2 ** 64)]
+        for ordering in ['updated_at', 'min_price']:
+            for value, pk in forged_positions:
+                with self.subTest(ordering=ordering, value=value, pk=pk):
+                    cursor = KeysetPagination().encode_cursor(value, pk)
+                    url = reverse_with_queryparams('offer-list', cursor=cursor, ordering=ordering)
+                    response = self.client.get(url)
+                    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
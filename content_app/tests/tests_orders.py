@@ -1,10 +1,14 @@
+from datetime import timedelta
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
+from coderr_backend.utils import reverse_with_queryparams
 from users_app.models import CustomerProfile
-from content_app.models import Order
+from content_app.models import OfferDetails, Order
 from content_app.api.serializers.general import OfferDetailsSerializer, OrderSerializer
 from content_app.tests.tests_offers import General as OffersTests
 from content_app.utils.general import get_order_create_dict
@@ -22,7 +26,7 @@ class General(APITestCase):
         self.customer_user = User.objects.create_user(username='customeruser', password='customerpassword')
         self.customer_profile = CustomerProfile.objects.create(user=self.customer_user)
         self.order = Order.objects.create(**get_order_create_dict(
-            current_user=self.customer_user,
+            orderer_profile=self.customer_profile,
             offer_details=self.details_standard,
         ))
         self.customer_token = Token.objects.create(user=self.customer_user)
@@ -50,6 +54,67 @@ class OrderTests(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
+    def test_get_order_list_query_count_constant(self):
+        """
+        Tests that the number of queries of the order list does not depend on the number of orders.
+
+        Asserts:
+            - 200 OK status.
+            - Three queries (token authentication, profile IDs and orders) for 21 orders.
+            - The user IDs and offer type are represented.
+        """
+        for offer_details in (self.details_basic, self.details_premium) * 10:
+            Order.objects.create(**get_order_create_dict(orderer_profile=self.customer_profile, offer_details=offer_details))
+        url = reverse('order-list')
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 21)
+        for order_data in response.data:
+            self.assertEqual(order_data['customer_user'], self.customer_user.pk)
+            self.assertEqual(order_data['business_user'], self.business_user.pk)
+            self.assertIn(order_data['offer_type'], (OfferDetails.BASIC, OfferDetails.STANDARD, OfferDetails.PREMIUM))
+        
+    def test_get_order_list_filter_ok(self):
+        """
+        Tests filtering the order list by status and creation time.
+
+        Asserts:
+            - Only the completed order is returned for the status filter.
+            - No order is returned for a creation time range in the future.
+        """
+        completed_order = Order.objects.create(status=Order.COMPLETED, **get_order_create_dict(
+            orderer_profile=self.customer_profile,
+            offer_details=self.details_basic,
+        ))
+        url = reverse_with_queryparams('order-list', status=Order.COMPLETED)
+        response = self.client.get(url)
+        self.assertEqual([order_data['id'] for order_data in response.data], [completed_order.pk])
+        created_after = (self.order.created_at + timedelta(days=1)).isoformat()
+        url = reverse_with_queryparams('order-list', created_after=created_after)
+        response = self.client.get(url)
+        self.assertEqual(response.data, [])
+        
+    def test_get_order_list_cursor_ok(self):
+        """
+        Tests the opt-in cursor pagination of the order list, as seen by the business user.
+
+        Asserts:
+            - Pages contain 'next' and 'results' keys.
+            - Paging by ascending price returns every order exactly once in order.
+        """
+        for offer_details in (self.details_basic, self.details_premium) * 2:
+            Order.objects.create(**get_order_create_dict(orderer_profile=self.customer_profile, offer_details=offer_details))
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        url = reverse_with_queryparams('order-list', cursor='', page_size=2, ordering='price')
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(set(response.data.keys()), {'next', 'results'})
+            ids += [order_data['id'] for order_data in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(ids, list(Order.objects.order_by('price', 'id').values_list('id', flat=True)))
+        
     def test_post_order_list_ok(self):
         """
         Tests successful creation of an order with basic offer details.
@@ -69,6 +134,23 @@ class OrderTests(APITestCase):
         self.assertNotIn('offer_detail_id', response.data)
         self.assertNotIn('offer_details', response.data)
         
+    def test_post_order_list_profile_lookups(self):
+        """
+        Tests that an order creation looks up the customer profile once and no user.
+
+        Asserts:
+            - 201 Created status.
+            - A single customer profile query and no user query, once the token authentication is cached.
+        """
+        url = reverse('order-list')
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, {'offer_detail_id': self.details_basic.pk}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        queries = [query['sql'] for query in context.captured_queries]
+        self.assertEqual(sum(query.startswith('SELECT') and 'FROM "users_app_customerprofile"' in query for query in queries), 1)
+        self.assertFalse(any('FROM "auth_user"' in query for query in queries))
+        
     def test_post_order_list_bad_request(self):
         """
         Tests order creation with invalid data, expecting a bad request response.
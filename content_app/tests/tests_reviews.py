@@ -1,14 +1,22 @@
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, transaction, IntegrityError
+from django.test.utils import CaptureQueriesContext
+from django.core.exceptions import ValidationError
+from django.core.management.base import CommandError
 from rest_framework import status
 from rest_framework.test import APITestCase
 from coderr_backend.utils import reverse_with_queryparams
-from users_app.models import BusinessProfile
+from users_app.models import BusinessProfile, CustomerProfile
 from content_app.models import Offer, OfferDetails, Order, CustomerReview
 from content_app.api.serializers.general import CustomerReviewSerializer
 from content_app.tests.tests_offers import OfferDetailsTests
 from content_app.tests.tests_orders import General as OrdersTests
 from content_app.utils.general import get_order_create_dict
+from content_app.api.pagination import KeysetPagination
+from content_app.utils.ratings import get_actual_rating_aggregates
+from io import StringIO
 
 class General(APITestCase):
     """
@@ -31,7 +39,7 @@ class General(APITestCase):
         self.scnd_offer = Offer.objects.create(business_profile=self.scnd_business_profile, title='testtitle', description='testdescription')
         self.scnd_details_standard = OfferDetails.objects.create(offer_type=OfferDetails.STANDARD, offer=self.scnd_offer, **OfferDetailsTests.CREATE_DATA)
         self.scnd_order = Order.objects.create(**get_order_create_dict(
-            current_user=self.customer_user,
+            orderer_profile=self.customer_profile,
             offer_details=self.scnd_details_standard,
         ))
         
@@ -75,6 +83,67 @@ class ReviewTests(APITestCase):
             self.assertEqual(review_data['business_user'], params['business_user_id'])
             self.assertEqual(review_data['reviewer'], params['reviewer_id'])
         
+    def create_reviews(self, count):
+        """
+        Creates reviews of the business profile by additional customers with corresponding orders.
+        """
+        for i in range(count):
+            user = User.objects.create_user(username=f"reviewer{i}", password='customerpassword')
+            profile = CustomerProfile.objects.create(user=user)
+            Order.objects.create(**get_order_create_dict(orderer_profile=profile, offer_details=self.details_basic))
+            CustomerReview.objects.create(reviewer_profile=profile, business_profile=self.business_profile, rating=i % 6)
+
+    def test_get_review_list_query_count_constant(self):
+        """
+        Tests that the number of queries of the review list does not depend on the number of reviews.
+
+        Asserts:
+            - 200 OK status.
+            - Three queries (token authentication, validators and reviews) for 11 reviews.
+            - The user IDs are represented.
+        """
+        self.create_reviews(10)
+        url = reverse_with_queryparams('review-list', business_user_id=self.business_user.pk)
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 11)
+        for review_data in response.data:
+            self.assertEqual(review_data['business_user'], self.business_user.pk)
+            self.assertIsNotNone(review_data['reviewer'])
+
+    def test_get_review_list_cursor_ok(self):
+        """
+        Tests the opt-in cursor pagination of the review list, filtered by business user and ordered by rating.
+
+        Asserts:
+            - Pages contain 'next' and 'results' keys.
+            - Paging by descending rating returns every review of the business exactly once in order.
+        """
+        self.create_reviews(7)
+        url = reverse_with_queryparams('review-list', cursor='', page_size=3, ordering='-rating', business_user_id=self.business_user.pk)
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(set(response.data.keys()), {'next', 'results'})
+            ids += [review_data['id'] for review_data in response.data['results']]
+            url = response.data['next']
+        expected_reviews = CustomerReview.objects.filter(business_profile=self.business_profile).order_by('-rating', '-id')
+        self.assertEqual(ids, list(expected_reviews.values_list('id', flat=True)))
+
+    def test_get_review_list_forged_cursor_not_found(self):
+        """
+        Tests the response to well-formed cursors with values not matching the ordering field.
+
+        Asserts:
+            - 404 Not Found status for a forged timestamp and rating.
+        """
+        for ordering, value in [('updated_at', 'abc'), ('rating', 'abc'), ('rating', {'a': 1})]:
+            with self.subTest(ordering=ordering, value=value):
+                cursor = KeysetPagination().encode_cursor(value, 1)
+                response = self.client.get(reverse_with_queryparams('review-list', cursor=cursor, ordering=ordering))
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_post_review_list_ok(self):
         """
         Tests successful creation of a new review for a business.
@@ -138,6 +207,23 @@ class ReviewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, expected_data)
         
+    def test_get_review_detail_not_modified(self):
+        """
+        Tests conditional retrieval of a review before and after an update.
+
+        Asserts:
+            - 304 Not Modified status for an unchanged review.
+            - 200 OK status after updating the review.
+        """
+        url = reverse('review-detail', kwargs={'pk': self.review.pk})
+        etag = self.client.get(url).headers['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.review.rating = 5
+        self.review.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
     def test_delete_review_detail_no_content(self):
         """
         Tests successful deletion of a review.
@@ -147,4 +233,197 @@ class ReviewTests(APITestCase):
         """
         url = reverse('review-detail', kwargs={'pk': self.review.pk})
         response = self.client.delete(url)
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+class RatingAggregateTests(APITestCase):
+    """
+    Tests for the rating aggregates stored on business profiles and exposed on the profile endpoints.
+    """
+    def setUp(self):
+        """
+        Inherits setup from the General class, including test users, profiles, and reviews.
+        """
+        General.setUp(self)
+
+    def assertRatingAggregatesUpToDate(self):
+        """
+        Asserts that the stored rating aggregates of all business profiles match the actual reviews.
+        """
+        actual_aggregates = get_actual_rating_aggregates()
+        for profile in BusinessProfile.objects.all():
+            expected = actual_aggregates.get(profile.pk, dict.fromkeys(BusinessProfile.RATING_FIELDS, 0))
+            self.assertEqual({field: getattr(profile, field) for field in BusinessProfile.RATING_FIELDS}, expected)
+
+    def test_rating_aggregates_follow_review_changes(self):
+        """
+        Tests that the rating aggregates follow created, updated, moved and deleted reviews.
+
+        Asserts:
+            - The stored aggregates are up to date after each change.
+            - The histogram of the business profile counts the current rating.
+        """
+        scnd_review = CustomerReview.objects.create(
+            reviewer_profile=self.customer_profile,
+            business_profile=self.scnd_business_profile,
+            rating=2,
+        )
+        self.assertRatingAggregatesUpToDate()
+        self.review.rating = 5
+        self.review.save()
+        self.assertRatingAggregatesUpToDate()
+        self.assertEqual(BusinessProfile.objects.get(pk=self.business_profile.pk).rating_histogram['5'], 1)
+        reloaded_review = CustomerReview.objects.get(pk=scnd_review.pk)
+        reloaded_review.rating = None
+        reloaded_review.save()
+        self.assertRatingAggregatesUpToDate()
+        self.review.delete()
+        self.assertRatingAggregatesUpToDate()
+
+    def test_rating_aggregates_recounted_for_deferred_rating(self):
+        """
+        Tests that saving a review loaded without its rating recounts the rating aggregates.
+
+        Asserts:
+            - The stored aggregates are up to date after the save.
+        """
+        review = CustomerReview.objects.defer('rating').get(pk=self.review.pk)
+        CustomerReview.objects.filter(pk=review.pk).update(rating=1)
+        review.description = 'changed'
+        review.save()
+        self.assertRatingAggregatesUpToDate()
+
+    def test_get_business_profile_list_ratings(self):
+        """
+        Tests that the business profile list contains the rating aggregates without a query per profile.
+
+        Asserts:
+            - 200 OK status.
+            - A single query (the token authentication is cached by the first request),
+              independent of the number of business profiles.
+            - The average rating and histogram of the reviewed business profile match its review.
+        """
+        url = reverse('business-list')
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile_data = next(data for data in response.data if data['user']['pk'] == self.business_user.pk)
+        self.assertEqual(profile_data['rating_count'], 1)
+        self.assertEqual(profile_data['average_rating'], self.review.rating)
+        self.assertEqual(profile_data['rating_histogram'][str(self.review.rating)], 1)
+        scnd_profile_data = next(data for data in response.data if data['user']['pk'] == self.scnd_business_user.pk)
+        self.assertIsNone(scnd_profile_data['average_rating'])
+
+    def test_get_business_profile_detail_ratings_modified(self):
+        """
+        Tests that the business profile detail reflects a new rating despite a previously received ETag.
+
+        Asserts:
+            - 200 OK status with the new average rating.
+        """
+        url = reverse('profile-detail', kwargs={'pk': self.business_user.pk})
+        etag = self.client.get(url)['ETag']
+        self.review.rating = 2
+        self.review.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['average_rating'], 2)
+
+    def test_get_offer_detail_not_modified_by_ratings(self):
+        """
+        Tests that a new rating keeps the ETag of the business's offers, which do not contain the ratings.
+
+        Asserts:
+            - 304 Not Modified status for the previous offer ETag after changing the rating.
+        """
+        url = reverse('offer-detail', kwargs={'pk': self.offer.pk})
+        etag = self.client.get(url)['ETag']
+        self.review.rating = 2
+        self.review.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_rating_out_of_range_rejected(self):
+        """
+        Tests that the database rejects ratings out of range, also when saved without the serializer.
+
+        Asserts:
+            - IntegrityError for a rating above 5, and the rating aggregates stay unchanged.
+        """
+        self.review.rating = 6
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.review.save()
+        self.assertRatingAggregatesUpToDate()
+
+    def test_recount_ratings_command(self):
+        """
+        Tests the `recount_ratings` command on drifted rating aggregates.
+
+        Asserts:
+            - `--verify` fails on drifted aggregates.
+            - Recounting restores the actual aggregates.
+        """
+        BusinessProfile.objects.filter(pk=self.business_profile.pk).update(rating_count=7)
+        with self.assertRaises(CommandError):
+            call_command('recount_ratings', '--verify', stdout=StringIO())
+        call_command('recount_ratings', stdout=StringIO())
+        self.assertRatingAggregatesUpToDate()
+
+class ReviewOrderCheckTests(APITestCase):
+    """
+    Tests for the check that a review has a corresponding order.
+    """
+    def setUp(self):
+        """
+        Inherits setup from the General class, including test users, profiles, and reviews.
+        """
+        General.setUp(self)
+
+    def test_save_unchanged_profiles_skips_check(self):
+        """
+        Tests that saving a loaded review with unchanged profiles does not check for an order again.
+
+        Asserts:
+            - The save runs no order query.
+        """
+        review = CustomerReview.objects.get(pk=self.review.pk)
+        review.description = 'changed'
+        with CaptureQueriesContext(connection) as queries:
+            review.save()
+        self.assertFalse(any('content_app_order' in query['sql'] for query in queries.captured_queries))
+
+    def test_save_changed_profiles_checks_order(self):
+        """
+        Tests that saving a review moved to a business without a corresponding order fails.
+
+        Asserts:
+            - A `ValidationError` is raised.
+        """
+        Order.objects.filter(business_profile=self.scnd_business_profile).delete()
+        review = CustomerReview.objects.get(pk=self.review.pk)
+        review.business_profile = self.scnd_business_profile
+        with self.assertRaises(ValidationError):
+            review.save()
+
+    def test_check_orders_batch(self):
+        """
+        Tests checking many reviews for corresponding orders at once.
+
+        Asserts:
+            - The check runs a single query and returns the reviews without an order.
+            - Saving the checked reviews runs no further order query.
+        """
+        self.review.delete()
+        other_profile = BusinessProfile.objects.create(user=User.objects.create_user(username='otherbusinessuser'))
+        reviews = [
+            CustomerReview(reviewer_profile=self.customer_profile, business_profile=self.business_profile, rating=3),
+            CustomerReview(reviewer_profile=self.customer_profile, business_profile=self.scnd_business_profile, rating=5),
+            CustomerReview(reviewer_profile=self.customer_profile, business_profile=other_profile, rating=1),
+        ]
+        with self.assertNumQueries(1):
+            reviews_without_order = CustomerReview.check_orders(reviews)
+        self.assertEqual(reviews_without_order, [reviews[2]])
+        with CaptureQueriesContext(connection) as queries:
+            for review in reviews[:2]:
+                review.save()
+        self.assertFalse(any('content_app_order' in query['sql'] for query in queries.captured_queries))
@@ -0,0 +1,85 @@
+from django.db import transaction
+from content_app.models import Offer, OfferDetails
+from content_app.api.serializers.general import OfferSerializer
+from statistics_app.models import PlatformStatistics
+from .general import merge_features_keys, features_list_to_str, OFFER_TITLE_CONFLICT_ERROR
+
+def validate_offers_bulk_data(many_offer_data, profile, context):
+    """
+    Validates a list of offer data using the `OfferSerializer`. Titles are checked against
+    the existing offers of the business profile (in a single query) and against previous items,
+    so `unique_profile_title` conflicts are reported per item instead of failing the insert.
+
+    Args:
+        many_offer_data (list): The offer data items of the request.
+        profile (BusinessProfile): The business profile creating the offers.
+        context (dict): The serializer context.
+
+    Returns:
+        tuple: List of validated offer data and list of errors, each containing the item 'index' and its 'errors'.
+    """
+    validated_items, errors = [], []
+    for index, offer_data in enumerate(many_offer_data):
+        serializer = OfferSerializer(data=offer_data, context=context)
+        if serializer.is_valid():
+            validated_items.append((index, serializer.validated_data))
+        else:
+            errors.append({'index': index, 'errors': serializer.errors})
+    titles = {validated_data.get('title') for index, validated_data in validated_items}
+    taken_titles = set(profile.offers.filter(title__in=titles).values_list('title', flat=True))
+    many_validated_data = []
+    for index, validated_data in validated_items:
+        title = validated_data.get('title')
+        if title in taken_titles:
+            errors.append({'index': index, 'errors': dict(OFFER_TITLE_CONFLICT_ERROR)})
+            continue
+        if title is not None:
+            taken_titles.add(title)
+        many_validated_data.append(validated_data)
+    errors.sort(key=lambda error: error['index'])
+    return many_validated_data, errors
+
+def get_offer_details_instance(details_data):
+    """
+    Creates an unsaved `OfferDetails` instance from validated offer details data.
+
+    Args:
+        details_data (dict): Validated data of the `OfferDetailsSerializer`.
+
+    Returns:
+        OfferDetails: The unsaved offer details, not yet linked to an offer.
+    """
+    details_data = merge_features_keys(dict(details_data))
+    details_data.pop('offer_id', None)
+    details_data['features'] = features_list_to_str(details_data['features'])
+    return OfferDetails(**details_data)
+
+def bulk_create_offers(many_validated_data, profile):
+    """
+    Creates offers and their details with one `bulk_create` each, in a single transaction.
+    Since `bulk_create` bypasses `OfferDetails.save`, the offer minimums are set in memory beforehand.
+    It also bypasses the model signals, so the created offers are added to the platform statistics here.
+
+    Args:
+        many_validated_data (list): Validated data of the `OfferSerializer`, including the details.
+        profile (BusinessProfile): The business profile creating the offers.
+
+    Returns:
+        list: The created offers.
+    """
+    offers, many_details = [], []
+    for validated_data in many_validated_data:
+        offer_data = dict(validated_data)
+        details = [get_offer_details_instance(details_data) for details_data in offer_data.pop('details', [])]
+        offer = Offer(business_profile=profile, **offer_data)
+        offer.set_min_values(details)
+        offers.append(offer)
+        many_details.append(details)
+    with transaction.atomic():
+        Offer.objects.bulk_create(offers)
+        for offer, details in zip(offers, many_details):
+            for single_details in details:
+                single_details.offer = offer
+        OfferDetails.objects.bulk_create([single_details for details in many_details for single_details in details])
+        PlatformStatistics.add(offer_count=len(offers))
+    return offers
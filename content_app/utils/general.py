@@ -2,6 +2,8 @@ from django.db import IntegrityError
 from rest_framework import status, serializers
 from rest_framework.response import Response
 
+OFFER_TITLE_CONFLICT_ERROR = {'title': 'Dieser Nutzer hat bereits ein Angebot mit diesem Titel.'}
+
 def features_list_to_str(features_list):
     """
     Converts a list of features into a single string, with features separated by ',,'.
@@ -54,7 +56,7 @@ def get_offer_unique_error_details(error_msg):
     if 'content_app_offerdetails.offer_type' in error_msg:
         return {'details': 'Der Angebotstyp existiert für dieses Angebot bereits.'}
     elif 'content_app_offer.title' in error_msg:
-        return {'title': 'Dieser Nutzer hat bereits ein Angebot mit diesem Titel.'}
+        return dict(OFFER_TITLE_CONFLICT_ERROR)
     else:
         return {'error': 'Ein Angebot mit diesen Daten existiert bereits.'}
     
@@ -89,6 +91,9 @@ def update_offer(offer_view, offer_serializer):
     try:
         offer_serializer.is_valid(raise_exception=True)
         offer_view.perform_update(offer_serializer)
+        if getattr(offer_serializer.instance, '_prefetched_objects_cache', None):
+            # Details prefetched by the view queryset are outdated after the update.
+            offer_serializer.instance._prefetched_objects_cache = {}
         return Response(offer_serializer.data, status=status.HTTP_200_OK)
     except IntegrityError as e:
         return get_integrity_error_response(e)
@@ -126,19 +131,19 @@ def validate_attrs_has_and_has_only_selected_fields(fields, attrs):
         if field not in attrs:
             raise serializers.ValidationError({field: "This field is not allowed for this request."})
         
-def get_order_create_dict(current_user, offer_details):
+def get_order_create_dict(orderer_profile, offer_details):
     """
-    Creates a dictionary for an order based on the current user and offer details.
+    Creates a dictionary for an order based on the ordering customer profile and offer details.
 
     Args:
-        current_user (User): The user creating the order.
+        orderer_profile (CustomerProfile): The profile of the customer creating the order.
         offer_details (OfferDetails): The details of the offer.
 
     Returns:
         dict: Dictionary containing order data.
     """
     return {
-        'orderer_profile': current_user.customer_profile,
+        'orderer_profile': orderer_profile,
         'business_profile': offer_details.offer.business_profile,
         'title': offer_details.offer.title,
         'offer_details': offer_details,
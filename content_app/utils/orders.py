@@ -0,0 +1,63 @@
+from django.db.models import Count
+from users_app.models import BusinessProfile
+from content_app.models import Order
+
+def get_actual_order_counts(business_profile_ids=None):
+    """
+    Counts the orders of business profiles by status in a single query.
+
+    Args:
+        business_profile_ids (list): IDs of the business profiles to count. Counts all if None.
+
+    Returns:
+        dict: Maps business profile IDs to dictionaries of order count fields and counts.
+    """
+    orders = Order.objects.all()
+    if business_profile_ids is not None:
+        orders = orders.filter(business_profile_id__in=business_profile_ids)
+    counts = {}
+    for row in orders.values('business_profile_id', 'status').annotate(count=Count('id')).order_by():
+        field = Order.COUNT_FIELDS.get(row['status'])
+        if field:
+            counts.setdefault(row['business_profile_id'], {})[field] = row['count']
+    return counts
+
+def get_outdated_order_counts(business_profile_ids=None):
+    """
+    Compares the stored order counts of business profiles to the actual counts and returns
+    the profiles whose stored counts differ, with the stored counts already corrected in memory.
+
+    Args:
+        business_profile_ids (list): IDs of the business profiles to check. Checks all if None.
+
+    Returns:
+        list: Business profiles with outdated order counts.
+    """
+    actual_counts = get_actual_order_counts(business_profile_ids)
+    count_fields = list(Order.COUNT_FIELDS.values())
+    profiles = BusinessProfile.objects.only('id', *count_fields)
+    if business_profile_ids is not None:
+        profiles = profiles.filter(pk__in=business_profile_ids)
+    outdated_profiles = []
+    for profile in profiles.iterator(chunk_size=2000):
+        profile_counts = actual_counts.get(profile.pk, {})
+        actual_values = {field: profile_counts.get(field, 0) for field in count_fields}
+        if any(getattr(profile, field) != value for field, value in actual_values.items()):
+            for field, value in actual_values.items():
+                setattr(profile, field, value)
+            outdated_profiles.append(profile)
+    return outdated_profiles
+
+def recount_orders(business_profile_ids=None):
+    """
+    Corrects the stored order counts of business profiles from the actual orders.
+
+    Args:
+        business_profile_ids (list): IDs of the business profiles to recount. Recounts all if None.
+
+    Returns:
+        list: Business profiles whose order counts were corrected.
+    """
+    outdated_profiles = get_outdated_order_counts(business_profile_ids)
+    BusinessProfile.objects.bulk_update(outdated_profiles, list(Order.COUNT_FIELDS.values()), batch_size=1000)
+    return outdated_profiles
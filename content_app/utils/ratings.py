@@ -0,0 +1,67 @@
+from django.db.models import Count
+from django.utils.timezone import now
+from users_app.models import BusinessProfile
+from content_app.models import CustomerReview
+
+def get_actual_rating_aggregates(business_profile_ids=None):
+    """
+    Computes the rating aggregates of business profiles from their reviews in a single query.
+
+    Args:
+        business_profile_ids (list): IDs of the business profiles to compute. Computes all if None.
+
+    Returns:
+        dict: Maps business profile IDs to dictionaries of rating fields and values.
+    """
+    reviews = CustomerReview.objects.filter(business_profile__isnull=False, rating__isnull=False)
+    if business_profile_ids is not None:
+        reviews = reviews.filter(business_profile_id__in=business_profile_ids)
+    aggregates = {}
+    for row in reviews.values('business_profile_id', 'rating').annotate(count=Count('id')).order_by():
+        profile_aggregates = aggregates.setdefault(row['business_profile_id'], dict.fromkeys(BusinessProfile.RATING_FIELDS, 0))
+        profile_aggregates['rating_count'] += row['count']
+        profile_aggregates['rating_sum'] += row['count'] * row['rating']
+        profile_aggregates[BusinessProfile.RATING_HISTOGRAM_FIELDS[row['rating']]] = row['count']
+    return aggregates
+
+def get_outdated_rating_aggregates(business_profile_ids=None):
+    """
+    Compares the stored rating aggregates of business profiles to the actual ones and returns
+    the profiles whose stored aggregates differ, with the stored aggregates already corrected in memory.
+
+    Args:
+        business_profile_ids (list): IDs of the business profiles to check. Checks all if None.
+
+    Returns:
+        list: Business profiles with outdated rating aggregates.
+    """
+    actual_aggregates = get_actual_rating_aggregates(business_profile_ids)
+    profiles = BusinessProfile.objects.only('id', *BusinessProfile.RATING_FIELDS)
+    if business_profile_ids is not None:
+        profiles = profiles.filter(pk__in=business_profile_ids)
+    outdated_profiles = []
+    for profile in profiles.iterator(chunk_size=2000):
+        actual_values = actual_aggregates.get(profile.pk, dict.fromkeys(BusinessProfile.RATING_FIELDS, 0))
+        if any(getattr(profile, field) != value for field, value in actual_values.items()):
+            for field, value in actual_values.items():
+                setattr(profile, field, value)
+            outdated_profiles.append(profile)
+    return outdated_profiles
+
+def recount_ratings(business_profile_ids=None):
+    """
+    Corrects the stored rating aggregates of business profiles from the actual reviews,
+    setting the 'rating_updated_at' timestamp of the corrected profiles.
+
+    Args:
+        business_profile_ids (list): IDs of the business profiles to recount. Recounts all if None.
+
+    Returns:
+        list: Business profiles whose rating aggregates were corrected.
+    """
+    outdated_profiles = get_outdated_rating_aggregates(business_profile_ids)
+    rating_updated_at = now()
+    for profile in outdated_profiles:
+        profile.rating_updated_at = rating_updated_at
+    BusinessProfile.objects.bulk_update(outdated_profiles, BusinessProfile.RATING_FIELDS + ['rating_updated_at'], batch_size=1000)
+    return outdated_profiles
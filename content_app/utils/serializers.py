@@ -25,31 +25,66 @@ def create_offer_details(offer_id, data, context):
     if details_serializer.is_valid(raise_exception=True):
         details_serializer.save()
         
-def update_offer_details(offer, data):
+def update_offer_details(offer, many_data):
     """
-    Updates an existing `OfferDetails` instance or creates a new one if the specified offer type does not exist.
+    Updates the existing `OfferDetails` instances of an offer and creates those whose offer type does not exist yet.
 
-    This function merges feature keys in the data, verifies that an offer type is present, 
-    and either updates an existing `OfferDetails` instance for the offer type or creates 
-    a new one if none exists.
+    All details of the offer are loaded once (or taken from the prefetch cache) and diffed in memory.
+    Changed details are written with a single `bulk_update` of the changed columns only,
+    new details with a single `bulk_create`. Since both bypass `OfferDetails.save`, the caller
+    has to update the offer's minimums from the returned details.
 
     Args:
         offer (Offer): The offer object to which the details belong.
-        data (dict): The data to use for updating or creating the offer details.
+        many_data (list): The data to use for updating or creating the offer details.
+
+    Returns:
+        list: All details of the offer after the update.
 
     Raises:
         serializers.ValidationError: If the offer type is not specified in the data.
     """
-    data = merge_features_keys(data)
-    offer_type = data.get('offer_type')
-    if not offer_type:
-        raise serializers.ValidationError('Offer details are missing an offer type.')
-    details_instance = offer.details.filter(offer_type=offer_type).first()          
-    if details_instance:
-        for attr, value in data.items():
-            if attr == 'features':
-                value = features_list_to_str(value)
-            setattr(details_instance, attr, value)
-        details_instance.save()
-    else:
-        OfferDetails.objects.create(offer=offer, **data)
\ No newline at end of file
+    details_by_type = {details.offer_type: details for details in offer.details.all()}
+    changed_details, changed_fields, new_details = [], set(), []
+    for data in many_data:
+        data = merge_features_keys(dict(data))
+        data.pop('offer_id', None)
+        offer_type = data.get('offer_type')
+        if not offer_type:
+            raise serializers.ValidationError('Offer details are missing an offer type.')
+        if 'features' in data:
+            data['features'] = features_list_to_str(data['features'])
+        details_instance = details_by_type.get(offer_type)
+        if details_instance is None:
+            details_instance = OfferDetails(offer=offer, **data)
+            details_by_type[offer_type] = details_instance
+            new_details.append(details_instance)
+            continue
+        fields = set_changed_attrs(details_instance, data)
+        if fields:
+            changed_details.append(details_instance)
+            changed_fields.update(fields)
+    if changed_details:
+        OfferDetails.objects.bulk_update(changed_details, sorted(changed_fields))
+    if new_details:
+        OfferDetails.objects.bulk_create(new_details)
+    return list(details_by_type.values())
+
+def set_changed_attrs(instance, data):
+    """
+    Sets attributes of a model instance and determines which concrete fields have changed.
+    Attributes can also be properties (e.g. `OfferDetails.price`), whose changes are detected
+    via the underlying fields.
+
+    Args:
+        instance (Model): The model instance to update.
+        data (dict): The attribute values to set.
+
+    Returns:
+        list: Names of the fields whose values have changed.
+    """
+    field_names = [field.attname for field in instance._meta.concrete_fields if not field.primary_key]
+    old_values = {name: getattr(instance, name) for name in field_names}
+    for attr, value in data.items():
+        setattr(instance, attr, value)
+    return [name for name in field_names if getattr(instance, name) != old_values[name]]
@@ -176,39 +176,43 @@ def fill_database():
     ]
 
     orders = [
-        Order.objects.create(**get_order_create_dict(users[0], offer_details[0]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[2], offer_details[3]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[4], offer_details[6]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[0], offer_details[1]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[2], offer_details[7]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[0], offer_details[8])),
-        Order.objects.create(**get_order_create_dict(users[4], offer_details[2])),
-        Order.objects.create(**get_order_create_dict(users[2], offer_details[4])),
-        Order.objects.create(**get_order_create_dict(users[0], offer_details[5]), status='cancelled'),
-        Order.objects.create(**get_order_create_dict(users[0], offer_details[0]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[2], offer_details[13]), status='cancelled'),
-        Order.objects.create(**get_order_create_dict(users[4], offer_details[26]), status='cancelled'),
-        Order.objects.create(**get_order_create_dict(users[0], offer_details[35])),
-        Order.objects.create(**get_order_create_dict(users[2], offer_details[42]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[4], offer_details[47])),
-        Order.objects.create(**get_order_create_dict(users[2], offer_details[40]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[0], offer_details[46]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[2], offer_details[37]), status='completed'),
-        Order.objects.create(**get_order_create_dict(users[4], offer_details[41]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[0], offer_details[0]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[1], offer_details[3]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[2], offer_details[6]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[0], offer_details[1]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[1], offer_details[7]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[0], offer_details[8])),
+        Order.objects.create(**get_order_create_dict(c_profs[2], offer_details[2])),
+        Order.objects.create(**get_order_create_dict(c_profs[1], offer_details[4])),
+        Order.objects.create(**get_order_create_dict(c_profs[0], offer_details[5]), status='cancelled'),
+        Order.objects.create(**get_order_create_dict(c_profs[0], offer_details[0]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[1], offer_details[13]), status='cancelled'),
+        Order.objects.create(**get_order_create_dict(c_profs[2], offer_details[26]), status='cancelled'),
+        Order.objects.create(**get_order_create_dict(c_profs[0], offer_details[35])),
+        Order.objects.create(**get_order_create_dict(c_profs[1], offer_details[42]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[2], offer_details[47])),
+        Order.objects.create(**get_order_create_dict(c_profs[1], offer_details[40]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[0], offer_details[46]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[1], offer_details[37]), status='completed'),
+        Order.objects.create(**get_order_create_dict(c_profs[2], offer_details[41]), status='completed'),
     ]
 
     reviews = [
-        CustomerReview.objects.create(reviewer_profile=c_profs[0], business_profile=b_profs[0], rating=5, description='Exzellenter Service! Sehr zufrieden mit dem Ergebnis.', created_at=date.today()),
-        CustomerReview.objects.create(reviewer_profile=c_profs[1], business_profile=b_profs[1], rating=4, description='Gute Arbeit, aber die Lieferung war etwas verspätet.', created_at=date.today() - timedelta(days=2)),
-        CustomerReview.objects.create(reviewer_profile=c_profs[2], business_profile=b_profs[2], rating=5, description='Toller Service! Sehr professionell und zuverlässig.', created_at=date.today() - timedelta(days=5)),
-        CustomerReview.objects.create(reviewer_profile=c_profs[0], business_profile=b_profs[1], rating=5, description='Sehr zufrieden mit der SEO-Optimierung. Die Ergebnisse waren schnell sichtbar.', created_at=date.today() - timedelta(days=3)),
-        CustomerReview.objects.create(reviewer_profile=c_profs[1], business_profile=b_profs[2], rating=4, description='Die Social Media-Kampagne war insgesamt gut, aber die Anzahl der Beiträge könnte höher sein.', created_at=date.today() - timedelta(days=10)),
-        CustomerReview.objects.create(reviewer_profile=c_profs[0], business_profile=b_profs[2], rating=4, description='Professionelle Betreuung und schnelle Reaktionszeit.', created_at=date.today() - timedelta(days=15)),
-        CustomerReview.objects.create(reviewer_profile=c_profs[1], business_profile=b_profs[0], rating=5, description='Sehr ansprechendes Webdesign und klare Kommunikation.', created_at=date.today() - timedelta(days=7)),
-        CustomerReview.objects.create(reviewer_profile=c_profs[2], business_profile=b_profs[3], rating=5, description='Hervorragender SEO-Service, die Sichtbarkeit hat sich stark verbessert.', created_at=date.today() - timedelta(days=8)),
-        CustomerReview.objects.create(reviewer_profile=c_profs[0], business_profile=b_profs[5], rating=4, description='Die Webdesign-Lösung war gut, aber es gab kleine Verzögerungen.', created_at=date.today() - timedelta(days=12)),
-        CustomerReview.objects.create(reviewer_profile=c_profs[2], business_profile=b_profs[0], rating=5, description='Effektiver Service, hat meine Erwartungen übertroffen.', created_at=date.today() - timedelta(days=14))
+        CustomerReview(reviewer_profile=c_profs[0], business_profile=b_profs[0], rating=5, description='Exzellenter Service! Sehr zufrieden mit dem Ergebnis.', created_at=date.today()),
+        CustomerReview(reviewer_profile=c_profs[1], business_profile=b_profs[1], rating=4, description='Gute Arbeit, aber die Lieferung war etwas verspätet.', created_at=date.today() - timedelta(days=2)),
+        CustomerReview(reviewer_profile=c_profs[2], business_profile=b_profs[2], rating=5, description='Toller Service! Sehr professionell und zuverlässig.', created_at=date.today() - timedelta(days=5)),
+        CustomerReview(reviewer_profile=c_profs[0], business_profile=b_profs[1], rating=5, description='Sehr zufrieden mit der SEO-Optimierung. Die Ergebnisse waren schnell sichtbar.', created_at=date.today() - timedelta(days=3)),
+        CustomerReview(reviewer_profile=c_profs[1], business_profile=b_profs[2], rating=4, description='Die Social Media-Kampagne war insgesamt gut, aber die Anzahl der Beiträge könnte höher sein.', created_at=date.today() - timedelta(days=10)),
+        CustomerReview(reviewer_profile=c_profs[0], business_profile=b_profs[2], rating=4, description='Professionelle Betreuung und schnelle Reaktionszeit.', created_at=date.today() - timedelta(days=15)),
+        CustomerReview(reviewer_profile=c_profs[1], business_profile=b_profs[0], rating=5, description='Sehr ansprechendes Webdesign und klare Kommunikation.', created_at=date.today() - timedelta(days=7)),
+        CustomerReview(reviewer_profile=c_profs[2], business_profile=b_profs[3], rating=5, description='Hervorragender SEO-Service, die Sichtbarkeit hat sich stark verbessert.', created_at=date.today() - timedelta(days=8)),
+        CustomerReview(reviewer_profile=c_profs[0], business_profile=b_profs[5], rating=4, description='Die Webdesign-Lösung war gut, aber es gab kleine Verzögerungen.', created_at=date.today() - timedelta(days=12)),
+        CustomerReview(reviewer_profile=c_profs[2], business_profile=b_profs[0], rating=5, description='Effektiver Service, hat meine Erwartungen übertroffen.', created_at=date.today() - timedelta(days=14))
     ]
+    if CustomerReview.check_orders(reviews):
+        raise ValueError('Each review requires a corresponding order.')
+    for review in reviews:
+        review.save()
 
     print('Data added successfully.')
 
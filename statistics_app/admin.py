@@ -1,3 +1,4 @@
 from django.contrib import admin
+from statistics_app.models import PlatformStatistics
 
-# Register your models here.
+admin.site.register(PlatformStatistics)
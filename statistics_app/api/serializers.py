@@ -1,34 +1,23 @@
-from django.db.models import Avg
 from rest_framework import serializers
 from coderr_backend.utils import format_number
-from users_app.models import BusinessProfile
-from content_app.models import Offer, CustomerReview
 
 class BaseInfoSerializer(serializers.Serializer):
     """
     A serializer for providing general application statistics, such as counts
     of reviews, average rating, business profiles, and offers.
+    Reads the running aggregates of a `PlatformStatistics` instance.
 
     Attributes:
-        review_count (SerializerMethodField): The total number of customer reviews.
+        review_count (IntegerField): The total number of customer reviews.
         average_rating (SerializerMethodField): The average rating across all reviews.
-        business_profile_count (SerializerMethodField): The total number of business profiles.
-        offer_count (SerializerMethodField): The total number of offers available.
+        business_profile_count (IntegerField): The total number of business profiles.
+        offer_count (IntegerField): The total number of offers available.
     """
-    review_count = serializers.SerializerMethodField()
+    review_count = serializers.IntegerField(read_only=True)
     average_rating = serializers.SerializerMethodField()
-    business_profile_count = serializers.SerializerMethodField()
-    offer_count = serializers.SerializerMethodField()
-    
-    def get_review_count(self, obj):
-        return CustomerReview.objects.count()
+    business_profile_count = serializers.IntegerField(read_only=True)
+    offer_count = serializers.IntegerField(read_only=True)
 
     def get_average_rating(self, obj):
-        average = CustomerReview.objects.aggregate(Avg('rating'))['rating__avg']
+        average = obj.average_rating
         return format_number(average, 1) if average is not None else '-'
-
-    def get_business_profile_count(self, obj):
-        return BusinessProfile.objects.count()
-
-    def get_offer_count(self, obj):
-        return Offer.objects.count()
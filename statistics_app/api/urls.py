@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import BaseInfoView, OrderCountView, CompletedOrderCountView
+from .views import BaseInfoView, OrderCountView, CompletedOrderCountView, OrderCountListView
 
 urlpatterns = [
     path('base-info/', BaseInfoView.as_view(), name='base-info-list'),
     path('order-count/<int:pk>/', OrderCountView.as_view(), name='order-count-detail'),
+    path('order-counts/', OrderCountListView.as_view(), name='order-count-list'),
     path('completed-order-count/<int:pk>/', CompletedOrderCountView.as_view(), name='completed-order-count-detail'),
 ]
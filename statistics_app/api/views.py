@@ -1,18 +1,27 @@
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from .serializers import BaseInfoSerializer
 from content_app.models import Order
-from statistics_app.utils import get_business_user_orders
+from statistics_app.models import PlatformStatistics
+from statistics_app.utils import get_business_user_order_count, get_business_users_order_counts
 
 class BaseInfoView(APIView):
     """
     A view to retrieve general application statistics, including review count,
     average rating, business profile count, and offer count.
+    The statistics are read from the running aggregates and cached for 'BASE_INFO_CACHE_TIMEOUT' seconds.
     """
+    cache_key = 'base-info'
+
     def get(self, request, *args, **kwargs):
-        serializer = BaseInfoSerializer({})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = cache.get(self.cache_key)
+        if data is None:
+            data = BaseInfoSerializer(PlatformStatistics.load()).data
+            cache.set(self.cache_key, data, timeout=settings.BASE_INFO_CACHE_TIMEOUT)
+        return Response(data, status=status.HTTP_200_OK)
     
 class OrderCountView(APIView):
     """
@@ -20,11 +29,10 @@ class OrderCountView(APIView):
     """
     def get(self, request, pk, format=None):
         try:
-            orders = get_business_user_orders(pk)
+            order_count = get_business_user_order_count(pk, Order.IN_PROGRESS)
         except:
             return Response({'error': 'Business user not found.'}, status=status.HTTP_404_NOT_FOUND)
-        orders = orders.filter(status=Order.IN_PROGRESS)
-        return Response({'order_count': orders.count()})
+        return Response({'order_count': order_count})
     
 class CompletedOrderCountView(APIView):
     """
@@ -32,10 +40,34 @@ class CompletedOrderCountView(APIView):
     """
     def get(self, request, pk, format=None):
         try:
-            orders = get_business_user_orders(pk)
+            order_count = get_business_user_order_count(pk, Order.COMPLETED)
         except:
             return Response({'error': 'Business user not found.'}, status=status.HTTP_404_NOT_FOUND)
-        orders = orders.filter(status=Order.COMPLETED)
-        return Response({'completed_order_count': orders.count()})
+        return Response({'completed_order_count': order_count})
 
+class OrderCountListView(APIView):
+    """
+    A view to retrieve the counts of orders in progress and completed orders for several business users
+    at once, given as comma-separated user IDs in the 'user_ids' query parameter.
+    Users without a business profile are reported per ID.
 
+    Attributes:
+        max_user_ids (int): Maximum number of user IDs per request. Defaults to 100.
+    """
+    max_user_ids = 100
+
+    def get(self, request, format=None):
+        try:
+            user_ids = [int(user_id) for user_id in request.query_params.get('user_ids', '').split(',') if user_id]
+        except ValueError:
+            return Response({'error': 'User IDs must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+        if not user_ids or len(user_ids) > self.max_user_ids:
+            return Response({'error': f"Between 1 and {self.max_user_ids} user IDs are required."}, status=status.HTTP_400_BAD_REQUEST)
+        order_counts = get_business_users_order_counts(user_ids)
+        results, errors = [], []
+        for user_id in dict.fromkeys(user_ids):
+            if user_id in order_counts:
+                results.append({'user_id': user_id, **order_counts[user_id]})
+            else:
+                errors.append({'user_id': user_id, 'error': 'Business user not found.'})
+        return Response({'results': results, 'errors': errors})
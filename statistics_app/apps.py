@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class StatisticsAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'statistics_app'
+
+    def ready(self):
+        """
+        Connects the signals maintaining the platform statistics.
+        """
+        import statistics_app.signals
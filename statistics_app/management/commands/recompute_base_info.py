@@ -0,0 +1,37 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from statistics_app.models import PlatformStatistics
+from statistics_app.api.views import BaseInfoView
+
+class Command(BaseCommand):
+    """
+    Recomputes or verifies the platform statistics served by the base info endpoint.
+
+    Usage:
+        python manage.py recompute_base_info
+        python manage.py recompute_base_info --verify
+    """
+    help = 'Recomputes the review, rating, business profile and offer aggregates of the base info endpoint.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report drifted aggregates, without writing. Fails if any are found.',
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            statistics = PlatformStatistics.load()
+            drifted = [
+                f"{field} ({getattr(statistics, field)} instead of {value})"
+                for field, value in PlatformStatistics.get_actual_values().items()
+                if getattr(statistics, field) != value
+            ]
+            if drifted:
+                raise CommandError(f"{len(drifted)} platform statistics have drifted: {', '.join(drifted)}")
+            self.stdout.write(self.style.SUCCESS('All platform statistics are up to date.'))
+            return
+        PlatformStatistics.recompute()
+        cache.delete(BaseInfoView.cache_key)
+        self.stdout.write(self.style.SUCCESS('Recomputed the platform statistics.'))
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:19
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.utils.timezone import now
+
+
+def compute_platform_statistics(apps, schema_editor):
+    """
+    Creates the platform statistics from the existing reviews, business profiles and offers.
+    """
+    PlatformStatistics = apps.get_model('statistics_app', 'PlatformStatistics')
+    CustomerReview = apps.get_model('content_app', 'CustomerReview')
+    BusinessProfile = apps.get_model('users_app', 'BusinessProfile')
+    Offer = apps.get_model('content_app', 'Offer')
+    values = CustomerReview.objects.aggregate(
+        review_count=Count('id'),
+        rating_count=Count('rating'),
+        rating_sum=Sum('rating', default=0),
+    )
+    PlatformStatistics.objects.create(
+        pk=1,
+        business_profile_count=BusinessProfile.objects.count(),
+        offer_count=Offer.objects.count(),
+        recomputed_at=now(),
+        **values,
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('content_app', '0003_recount_business_orders'),
+        ('users_app', '0002_business_order_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformStatistics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('rating_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('business_profile_count', models.PositiveIntegerField(default=0)),
+                ('offer_count', models.PositiveIntegerField(default=0)),
+                ('recomputed_at', models.DateTimeField(blank=True, default=None, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'platform statistics',
+            },
+        ),
+        migrations.RunPython(compute_platform_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,91 @@
+from django.db import models
+from django.db.models import Count, F, Sum
+from django.utils.timezone import now
+from users_app.models import BusinessProfile
+from content_app.models import Offer, CustomerReview
+
+class PlatformStatistics(models.Model):
+    """
+    Singleton model holding running aggregates of the platform for the base info statistics.
+    The aggregates are updated incrementally by model signals (see `statistics_app.signals`)
+    and can be recomputed from scratch with `recompute`.
+
+    Attributes:
+        review_count (PositiveIntegerField): Number of customer reviews.
+        rating_count (PositiveIntegerField): Number of customer reviews with a rating.
+        rating_sum (PositiveIntegerField): Sum of all ratings.
+        business_profile_count (PositiveIntegerField): Number of business profiles.
+        offer_count (PositiveIntegerField): Number of offers.
+        recomputed_at (DateTimeField): Timestamp of the last full recompute. Optional.
+    """
+    SINGLETON_PK = 1
+    COUNT_FIELDS = ['review_count', 'rating_count', 'rating_sum', 'business_profile_count', 'offer_count']
+    review_count = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    business_profile_count = models.PositiveIntegerField(default=0)
+    offer_count = models.PositiveIntegerField(default=0)
+    recomputed_at = models.DateTimeField(default=None, blank=True, null=True)
+
+    class Meta:
+        verbose_name_plural = 'platform statistics'
+
+    @property
+    def average_rating(self):
+        """
+        Returns the average rating, or None if there are no ratings.
+        """
+        return self.rating_sum / self.rating_count if self.rating_count else None
+
+    @classmethod
+    def load(cls):
+        """
+        Returns the singleton instance, computing the aggregates if it does not exist yet.
+        """
+        try:
+            return cls.objects.get(pk=cls.SINGLETON_PK)
+        except cls.DoesNotExist:
+            return cls.recompute()
+
+    @classmethod
+    def add(cls, **deltas):
+        """
+        Changes the aggregates by the given deltas in a single atomic update.
+
+        Args:
+            **deltas: Changes of the aggregate fields, e.g. `offer_count=1`.
+        """
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if deltas:
+            cls.objects.filter(pk=cls.SINGLETON_PK).update(**{field: F(field) + delta for field, delta in deltas.items()})
+
+    @classmethod
+    def get_actual_values(cls):
+        """
+        Computes all aggregates from scratch.
+
+        Returns:
+            dict: The actual values of the aggregate fields.
+        """
+        values = CustomerReview.objects.aggregate(
+            review_count=Count('id'),
+            rating_count=Count('rating'),
+            rating_sum=Sum('rating', default=0),
+        )
+        values['business_profile_count'] = BusinessProfile.objects.count()
+        values['offer_count'] = Offer.objects.count()
+        return values
+
+    @classmethod
+    def recompute(cls):
+        """
+        Recomputes all aggregates from scratch and saves them.
+
+        Returns:
+            PlatformStatistics: The recomputed singleton instance.
+        """
+        statistics, created = cls.objects.update_or_create(
+            pk=cls.SINGLETON_PK,
+            defaults={**cls.get_actual_values(), 'recomputed_at': now()},
+        )
+        return statistics
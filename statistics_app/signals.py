@@ -0,0 +1,61 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from users_app.models import BusinessProfile
+from content_app.models import Offer, CustomerReview
+from statistics_app.models import PlatformStatistics
+
+def get_rating_deltas(rating, sign):
+    """
+    Returns the changes of the rating aggregates for adding (sign 1) or removing (sign -1) a rating.
+    """
+    if rating is None:
+        return {}
+    return {'rating_count': sign, 'rating_sum': sign * rating}
+
+@receiver(post_save, sender=CustomerReview)
+def count_review_on_save(sender, instance, created, **kwargs):
+    """
+    Counts a created review and its rating, or the changed rating of an updated review.
+    If the previously counted rating of an updated review is unknown, all aggregates are recomputed.
+    """
+    if created:
+        PlatformStatistics.add(review_count=1, **get_rating_deltas(instance.rating, 1))
+        return
+    counted_as = getattr(instance, '_counted_as', None)
+    if counted_as is None:
+        PlatformStatistics.recompute()
+    elif counted_as[1] != instance.rating:
+        deltas = get_rating_deltas(counted_as[1], -1)
+        for field, delta in get_rating_deltas(instance.rating, 1).items():
+            deltas[field] = deltas.get(field, 0) + delta
+        PlatformStatistics.add(**deltas)
+
+@receiver(post_delete, sender=CustomerReview)
+def count_review_on_delete(sender, instance, **kwargs):
+    """
+    Removes a deleted review and its rating from the aggregates, also if deleted by a cascade.
+    """
+    PlatformStatistics.add(review_count=-1, **get_rating_deltas(instance.rating, -1))
+
+@receiver(post_save, sender=BusinessProfile)
+@receiver(post_save, sender=Offer)
+def count_created_instance(sender, instance, created, **kwargs):
+    """
+    Counts a created business profile or offer.
+    """
+    if created:
+        PlatformStatistics.add(**{get_count_field(sender): 1})
+
+@receiver(post_delete, sender=BusinessProfile)
+@receiver(post_delete, sender=Offer)
+def count_deleted_instance(sender, instance, **kwargs):
+    """
+    Removes a deleted business profile or offer from the counts, also if deleted by a cascade.
+    """
+    PlatformStatistics.add(**{get_count_field(sender): -1})
+
+def get_count_field(model):
+    """
+    Returns the aggregate field counting instances of the model.
+    """
+    return 'business_profile_count' if model is BusinessProfile else 'offer_count'
@@ -1,9 +1,16 @@
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from rest_framework import status
 from rest_framework.test import APITestCase
+from coderr_backend.utils import reverse_with_queryparams
 from content_app.tests.tests_reviews import General as ReviewsTests
-from content_app.models import CustomerReview
+from users_app.models import BusinessProfile
+from content_app.models import Offer, Order, CustomerReview
+from statistics_app.models import PlatformStatistics
+from io import StringIO
 
 class General(APITestCase):
     """
@@ -22,7 +29,9 @@ class BaseInfoTests(APITestCase):
     def setUp(self):
         """
         Extends the setup from `General`, creating an additional customer review instance.
+        Clears the cache, so no base info is served from previous tests.
         """
+        cache.clear()
         General.setUp(self)
         self.scnd_review = CustomerReview.objects.create(
             reviewer_profile=self.customer_profile,
@@ -44,6 +53,71 @@ class BaseInfoTests(APITestCase):
         average_rating = (self.review.rating + self.scnd_review.rating) / 2
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['average_rating'], average_rating)
+
+    def test_get_base_info_counts(self):
+        """
+        Tests that the base info returns the counts maintained by the platform statistics.
+
+        Asserts:
+            - 200 OK status.
+            - The review, business profile and offer counts match the actual numbers of instances.
+        """
+        url = reverse('base-info-list')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['review_count'], CustomerReview.objects.count())
+        self.assertEqual(response.data['business_profile_count'], BusinessProfile.objects.count())
+        self.assertEqual(response.data['offer_count'], Offer.objects.count())
+
+    def test_get_base_info_cached(self):
+        """
+        Tests that the base info is served from the cache without database queries.
+
+        Asserts:
+            - The second request executes no queries and returns the same data.
+        """
+        self.client.credentials()
+        url = reverse('base-info-list')
+        response = self.client.get(url)
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(url)
+        self.assertEqual(cached_response.data, response.data)
+
+    def test_platform_statistics_follow_changes(self):
+        """
+        Tests that the platform statistics follow updated, deleted and cascade-deleted instances.
+
+        Asserts:
+            - After changing a rating, deleting a review and deleting a business profile with its offers
+              and reviews, the stored aggregates match the recomputed ones.
+        """
+        self.review.rating = 1
+        self.review.save()
+        reloaded_review = CustomerReview.objects.get(pk=self.scnd_review.pk)
+        reloaded_review.rating = 5
+        reloaded_review.save()
+        reloaded_review.delete()
+        self.business_profile.delete()
+        statistics = PlatformStatistics.load()
+        for field, value in PlatformStatistics.get_actual_values().items():
+            self.assertEqual(getattr(statistics, field), value, field)
+
+    def test_recompute_base_info_command(self):
+        """
+        Tests the `recompute_base_info` command on drifted platform statistics.
+
+        Asserts:
+            - `--verify` fails and names the drifted aggregate.
+            - Recomputing restores the actual values and clears the cached base info.
+        """
+        self.client.get(reverse('base-info-list'))
+        PlatformStatistics.objects.update(offer_count=99)
+        with self.assertRaisesMessage(CommandError, 'offer_count'):
+            call_command('recompute_base_info', '--verify', stdout=StringIO())
+        call_command('recompute_base_info', stdout=StringIO())
+        call_command('recompute_base_info', '--verify', stdout=StringIO())
+        response = self.client.get(reverse('base-info-list'))
+        self.assertEqual(response.data['offer_count'], Offer.objects.count())
         
 class OrderCountTests(APITestCase):
     """
@@ -66,6 +140,59 @@ class OrderCountTests(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
+    def test_get_order_count_detail_counts_maintained(self):
+        """
+        Tests that the order counts follow order creation, status updates and deletion
+        and are read in a single query.
+
+        Asserts:
+            - The initial order is counted as in progress.
+            - A completed order moves from the in-progress count to the completed count.
+            - A deleted order is no longer counted.
+            - One query besides the token authentication.
+        """
+        url = reverse('order-count-detail', kwargs={'pk': self.business_user.pk})
+        completed_url = reverse('completed-order-count-detail', kwargs={'pk': self.business_user.pk})
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.data, {'order_count': 1})
+        self.order.status = Order.COMPLETED
+        self.order.save()
+        self.assertEqual(self.client.get(url).data, {'order_count': 0})
+        self.assertEqual(self.client.get(completed_url).data, {'completed_order_count': 1})
+        self.order.delete()
+        self.assertEqual(self.client.get(completed_url).data, {'completed_order_count': 0})
+        
+    def test_profile_save_keeps_order_counts(self):
+        """
+        Tests that saving a business profile instance with outdated counts keeps the stored counts.
+
+        Asserts:
+            - The stored in-progress count is unchanged.
+        """
+        profile = BusinessProfile.objects.get(pk=self.business_profile.pk)
+        Order.objects.create(orderer_profile=self.customer_profile, business_profile=self.business_profile)
+        profile.location = 'newlocation'
+        profile.save()
+        profile.refresh_from_db()
+        self.assertEqual(profile.in_progress_order_count, 2)
+        
+    def test_recount_orders_command(self):
+        """
+        Tests verifying and recounting drifted order counts with the management command.
+
+        Asserts:
+            - Verification fails for a drifted count.
+            - The recount restores the count, after which verification succeeds.
+        """
+        BusinessProfile.objects.filter(pk=self.business_profile.pk).update(in_progress_order_count=5)
+        with self.assertRaises(CommandError):
+            call_command('recount_orders', verify=True, stdout=StringIO())
+        call_command('recount_orders', stdout=StringIO())
+        call_command('recount_orders', verify=True, stdout=StringIO())
+        self.business_profile.refresh_from_db()
+        self.assertEqual(self.business_profile.in_progress_order_count, 1)
+        
     def test_get_order_count_detail_user_not_found(self):
         """
         Tests response when requesting order count for a non-existent user.
@@ -107,4 +234,47 @@ class CompletedOrderCountTests(APITestCase):
         """
         url = reverse('completed-order-count-detail', kwargs={'pk': User.objects.count() + 1})
         response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+class OrderCountListTests(APITestCase):
+    """
+    Tests for retrieving the order counts of several business users at once.
+    """
+    def setUp(self):
+        """
+        Sets up the test environment by extending setup from the `General` class.
+        """
+        General.setUp(self)
+        
+    def test_get_order_count_list_ok(self):
+        """
+        Tests retrieval of the order counts of two business users and unknown users in a single query.
+
+        Asserts:
+            - 200 OK status.
+            - One query besides the token authentication.
+            - The counts of both business users are returned in the requested order.
+            - The customer user and a non-existent user are reported per ID.
+        """
+        unknown_pk = User.objects.count() + 1
+        user_ids = [self.scnd_business_user.pk, self.business_user.pk, self.customer_user.pk, unknown_pk]
+        url = reverse_with_queryparams('order-count-list', user_ids=','.join(str(pk) for pk in user_ids))
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [
+            {'user_id': self.scnd_business_user.pk, 'order_count': 1, 'completed_order_count': 0},
+            {'user_id': self.business_user.pk, 'order_count': 1, 'completed_order_count': 0},
+        ])
+        self.assertEqual([error['user_id'] for error in response.data['errors']], [self.customer_user.pk, unknown_pk])
+        
+    def test_get_order_count_list_invalid_ids_bad_request(self):
+        """
+        Tests response to malformed user IDs.
+
+        Asserts:
+            - 400 Bad Request status.
+        """
+        url = reverse_with_queryparams('order-count-list', user_ids='1,abc')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
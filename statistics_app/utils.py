@@ -1,13 +1,40 @@
-from django.contrib.auth.models import User
 from users_app.models import BusinessProfile
 from content_app.models import Order
 
-def get_business_user_orders(user_id):
+def get_business_user_order_count(user_id, status):
     """
-    Retrieves all orders associated with a business profile for a given user.
+    Retrieves the number of orders with a given status of the business profile of a given user.
+    The count is read from the business profile in a single lookup.
 
     Args:
-        user_id (int): The ID of the user whose business orders are being retrieved.
+        user_id (int): The ID of the user whose business orders are being counted.
+        status (str): The order status.
+
+    Raises:
+        BusinessProfile.DoesNotExist: If the user does not exist or has no business profile.
+    """
+    count = BusinessProfile.objects.filter(user_id=user_id).values_list(Order.COUNT_FIELDS[status], flat=True).first()
+    if count is None:
+        raise BusinessProfile.DoesNotExist
+    return count
+
+
+def get_business_users_order_counts(user_ids):
+    """
+    Retrieves the numbers of orders in progress and completed orders of the business profiles
+    of several users in a single query. The counts are read from the business profiles.
+
+    Args:
+        user_ids (list): The IDs of the users whose business orders are being counted.
+
+    Returns:
+        dict: Maps the IDs of users with a business profile to dictionaries containing
+            'order_count' and 'completed_order_count'.
     """
-    business_profile = User.objects.get(pk=user_id).business_profile
-    return Order.objects.filter(business_profile=business_profile)
+    rows = BusinessProfile.objects.filter(user_id__in=user_ids).values_list(
+        'user_id', Order.COUNT_FIELDS[Order.IN_PROGRESS], Order.COUNT_FIELDS[Order.COMPLETED]
+    )
+    return {
+        user_id: {'order_count': order_count, 'completed_order_count': completed_order_count}
+        for user_id, order_count, completed_order_count in rows
+    }
\ No newline at end of file
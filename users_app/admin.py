@@ -1,5 +1,6 @@
 from django.contrib import admin
-from users_app.models import CustomerProfile, BusinessProfile 
+from users_app.models import CustomerProfile, BusinessProfile, OutgoingEmail
 
 admin.site.register(CustomerProfile)
-admin.site.register(BusinessProfile)
\ No newline at end of file
+admin.site.register(BusinessProfile)
+admin.site.register(OutgoingEmail)
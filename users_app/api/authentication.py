@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import router
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from users_app.models import CustomerProfile, BusinessProfile
+
+TOKEN_CACHE_KEY_PREFIX = 'auth-token'
+# In the order of the user model's fields, as required by `Model.from_db`.
+CACHED_USER_FIELDS = ['id', 'is_superuser', 'username', 'first_name', 'last_name', 'email', 'is_staff', 'is_active']
+
+class LocalTTLCache:
+    """
+    Thread-safe in-process cache with a maximum size (least recently used entries are evicted first)
+    and a time to live for each entry.
+
+    Attributes:
+        maxsize (int): Maximum number of entries.
+        timeout (float): Time to live of an entry in seconds.
+    """
+    def __init__(self, maxsize, timeout):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the value of an entry that has not expired yet, or None.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Stores an entry, evicting the least recently used entries beyond `maxsize`.
+        """
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.timeout, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete_many(self, keys):
+        """
+        Removes the entries of the given keys.
+        """
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self.lock:
+            self.entries.clear()
+
+local_token_cache = LocalTTLCache(settings.TOKEN_AUTH_LOCAL_CACHE_SIZE, settings.TOKEN_AUTH_LOCAL_CACHE_TIMEOUT)
+
+def get_token_cache_key(key):
+    """
+    Returns the shared cache key of an authentication token.
+    """
+    return f"{TOKEN_CACHE_KEY_PREFIX}:{key}"
+
+def get_shared_token_cache_timeout():
+    """
+    Returns the timeout of the token entries in the shared cache. A per-process memory cache
+    is not invalidated by other processes, so its entries expire as early as the process LRU entries.
+    """
+    if isinstance(caches['default'], LocMemCache):
+        return min(settings.TOKEN_AUTH_CACHE_TIMEOUT, settings.TOKEN_AUTH_LOCAL_CACHE_TIMEOUT)
+    return settings.TOKEN_AUTH_CACHE_TIMEOUT
+
+def invalidate_tokens(keys):
+    """
+    Removes the cached entries of the given authentication tokens from the shared cache
+    and the cache of this process. Other processes drop their entries after
+    'TOKEN_AUTH_LOCAL_CACHE_TIMEOUT' seconds (see `get_shared_token_cache_timeout`).
+
+    Args:
+        keys (iterable): The token keys.
+    """
+    keys = list(keys)
+    if keys:
+        cache.delete_many([get_token_cache_key(key) for key in keys])
+        local_token_cache.delete_many(keys)
+
+def load_token_entry(key):
+    """
+    Loads the token's creation time, its user's fields and the user's profile type in a single query.
+
+    Returns:
+        dict: The token entry, or None if the token does not exist.
+    """
+    values = Token.objects.filter(key=key).values(
+        'created',
+        'user__customer_profile__id',
+        'user__business_profile__id',
+        *[f"user__{field}" for field in CACHED_USER_FIELDS],
+    ).first()
+    if values is None:
+        return None
+    if values['user__customer_profile__id'] is not None:
+        profile_type = CustomerProfile.TYPE
+    elif values['user__business_profile__id'] is not None:
+        profile_type = BusinessProfile.TYPE
+    else:
+        profile_type = None
+    return {
+        'created': values['created'],
+        'user': [values[f"user__{field}"] for field in CACHED_USER_FIELDS],
+        'profile_type': profile_type,
+    }
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in replacement for `TokenAuthentication` which caches each token with its user
+    (including 'is_active') and the user's profile type. Tokens are looked up in a
+    bounded in-process LRU cache first, then in the shared cache, and only then in the database.
+    The entries are invalidated by signals when a token is deleted or its user or profiles change
+    (see `users_app.signals`).
+
+    The authenticated user only holds the fields in `CACHED_USER_FIELDS`; other fields are
+    loaded on access. Its profile type is available as 'profile_type'.
+    """
+    def authenticate_credentials(self, key):
+        entry = local_token_cache.get(key)
+        if entry is None:
+            entry = cache.get(get_token_cache_key(key))
+            if entry is None:
+                entry = load_token_entry(key)
+                if entry is None:
+                    raise exceptions.AuthenticationFailed('Invalid token.')
+                cache.set(get_token_cache_key(key), entry, timeout=get_shared_token_cache_timeout())
+            local_token_cache.set(key, entry)
+        user = User.from_db(router.db_for_read(User), CACHED_USER_FIELDS, entry['user'])
+        user.profile_type = entry['profile_type']
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        token = Token.from_db(router.db_for_read(Token), ['key', 'user_id', 'created'], [key, user.pk, entry['created']])
+        token.user = user
+        return (user, token)
@@ -1,5 +1,6 @@
 from rest_framework import permissions
 from users_app.models import BusinessProfile, CustomerProfile
+from users_app.utils.profiles import get_profile_type
 
 class ReadOnly(permissions.BasePermission):
     """
@@ -45,7 +46,7 @@ class PostAsBusinessUser(permissions.BasePermission):
         if (
             request.method == 'POST'
             and request.user.is_authenticated
-            and BusinessProfile.objects.filter(user=request.user.pk).exists()
+            and get_profile_type(request.user) == BusinessProfile.TYPE
         ):
             return True
         return False
@@ -56,7 +57,7 @@ class PostAsCustomerUser(permissions.BasePermission):
         if (
             request.method == 'POST'
             and request.user.is_authenticated
-            and CustomerProfile.objects.filter(user=request.user.pk).exists()
+            and get_profile_type(request.user) == CustomerProfile.TYPE
         ):
             return True
         return False
\ No newline at end of file
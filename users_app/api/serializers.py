@@ -5,11 +5,13 @@ from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 from users_app.models import AbstractUserProfile, CustomerProfile, BusinessProfile, AccountActivation
 from users_app.utils.auth import split_username, get_auth_response_data
+from coderr_backend.utils import format_number
 
 USER_NAME_FIELDS = ['username', 'first_name', 'last_name']
 USER_FIELDS = USER_NAME_FIELDS + ['email']
 PROFILE_EXTRA_FIELDS = ['type', 'created_at', 'file', 'uploaded_at']
 BUSINESS_EXTRA_FIELDS = ['location', 'description', 'working_hours', 'tel']
+BUSINESS_RATING_FIELDS = ['rating_count', 'average_rating', 'rating_histogram']
 
 class LoginSerializer(serializers.Serializer):
     """
@@ -142,17 +144,34 @@ class CustomerProfileDetailSerializer(AbstractProfileDetailSerializer):
         model = CustomerProfile
         fields = AbstractProfileDetailSerializer.Meta.fields
     
-class BusinessProfileDetailSerializer(AbstractProfileDetailSerializer):
+class BusinessRatingSerializerMixin(serializers.Serializer):
+    """
+    Mixin for business profile serializers, adding the rating aggregates stored on the business profile.
+
+    Fields:
+        rating_count: The number of rated reviews, read-only.
+        average_rating: The average rating to one decimal place, or None without ratings.
+        rating_histogram: The number of reviews per rating from '0' to '5', read-only.
+    """
+    rating_count = serializers.IntegerField(read_only=True)
+    average_rating = serializers.SerializerMethodField()
+    rating_histogram = serializers.DictField(child=serializers.IntegerField(), read_only=True)
+
+    def get_average_rating(self, obj):
+        return format_number(obj.average_rating, 1) if obj.average_rating is not None else None
+
+class BusinessProfileDetailSerializer(BusinessRatingSerializerMixin, AbstractProfileDetailSerializer):
     """
     Serializer for detailed Business profile information, inheriting from AbstractProfileDetailSerializer, 
-    with additional business-specific fields.
+    with additional business-specific fields and the rating aggregates.
     """
     class Meta:
         """
-        fields: Includes business-specific fields such as location, description, working_hours, and tel.
+        fields: Includes business-specific fields such as location, description, working_hours, and tel,
+        and the rating aggregates.
         """
         model = BusinessProfile
-        fields = AbstractProfileDetailSerializer.Meta.fields + BUSINESS_EXTRA_FIELDS
+        fields = AbstractProfileDetailSerializer.Meta.fields + BUSINESS_EXTRA_FIELDS + BUSINESS_RATING_FIELDS
 
 class BaseProfileListSerializer(serializers.HyperlinkedModelSerializer):
     """
@@ -190,16 +209,18 @@ class CustomerProfileListSerializer(BaseProfileListSerializer):
         model = CustomerProfile
         fields = BaseProfileListSerializer.Meta.fields
         
-class BusinessProfileListSerializer(BaseProfileListSerializer):
+class BusinessProfileListSerializer(BusinessRatingSerializerMixin, BaseProfileListSerializer):
     """
-    Serializer for listing Business profiles, inheriting from BaseProfileListSerializer, with additional business-specific fields.
+    Serializer for listing Business profiles, inheriting from BaseProfileListSerializer, with additional business-specific fields
+    and the rating aggregates.
     """
     class Meta:
         """
-        fields: Includes business-specific fields such as location, description, working_hours, and tel.
+        fields: Includes business-specific fields such as location, description, working_hours, and tel,
+        and the rating aggregates.
         """
         model = BusinessProfile
-        fields = BaseProfileListSerializer.Meta.fields + BUSINESS_EXTRA_FIELDS
+        fields = BaseProfileListSerializer.Meta.fields + BUSINESS_EXTRA_FIELDS + BUSINESS_RATING_FIELDS
 
 class AccountActivationSerializer(serializers.Serializer):
     """
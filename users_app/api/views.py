@@ -1,6 +1,7 @@
 from rest_framework import status, generics, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from coderr_backend.utils import conditional_get, get_object_validators
 from uploads_app.utils import handle_file_update
 from users_app.utils.views import update_profile_w_user
 from users_app.utils.profiles import get_profile, get_profile_serializer
@@ -58,11 +59,20 @@ class ProfileView(APIView):
     def get(self, request, pk, format=None):
         """
         Retrieves profile data for the specified user.
+        The request is answered conditionally based on the profile's version timestamps, since profile
+        PATCH requests save the profile after updating the user, and reviews update the rating aggregates.
         """
         try:
             profile = get_profile(user_pk=pk)
         except:
             return Response({'user': 'Benutzer oder Profil wurde nicht gefunden.'}, status=status.HTTP_404_NOT_FOUND)
+        validators = get_object_validators(profile, profile.VERSION_FIELDS)
+        return conditional_get(request, validators, self.get_profile_response, profile)
+    
+    def get_profile_response(self, request, profile):
+        """
+        Returns the full response of a profile GET request.
+        """
         serializer = get_profile_serializer(request, profile, data=request.data)
         return Response(serializer.data, status=status.HTTP_200_OK)       
 
@@ -80,22 +90,25 @@ class ProfileView(APIView):
 class CustomerProfileViewSet(generics.ListAPIView):
     """
     ViewSet for listing CustomerProfile instances.
+    The users and files are joined, so the list is retrieved in a single query.
 
     Permission:
         ReadOnly: Allows read-only access to customer profiles.
     """
-    queryset = CustomerProfile.objects.all()
+    queryset = CustomerProfile.objects.select_related('user', 'file')
     serializer_class = CustomerProfileListSerializer
     permission_classes = [ReadOnly]
     
 class BusinessProfileViewSet(generics.ListAPIView):
     """
     ViewSet for listing BusinessProfile instances.
+    The users and files are joined, and the rating aggregates are stored on the profiles,
+    so the list is retrieved in a single query.
 
     Permission:
         ReadOnly: Allows read-only access to business profiles.
     """
-    queryset = BusinessProfile.objects.all()
+    queryset = BusinessProfile.objects.select_related('user', 'file')
     serializer_class = BusinessProfileListSerializer
     permission_classes = [ReadOnly]
 
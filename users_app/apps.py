@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class UsersAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users_app'
+
+    def ready(self):
+        """
+        Connects the authentication cache invalidation signals.
+        """
+        import users_app.signals
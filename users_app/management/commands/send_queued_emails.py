@@ -0,0 +1,95 @@
+import time
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from users_app.models import OutgoingEmail
+
+class Command(BaseCommand):
+    """
+    Sends the due emails of the outbox over a single email backend connection.
+    Failed emails are retried with exponential backoff. The throughput is reported per batch.
+
+    Usage:
+        python manage.py send_queued_emails
+        python manage.py send_queued_emails --loop --interval 5
+    """
+    help = 'Sends queued emails, retrying failed ones with backoff.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Maximum number of emails claimed at once.',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling the outbox instead of exiting once it is drained.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5,
+            help='Seconds to wait between polls of an empty outbox in loop mode.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = self.send_due_emails(options['batch_size'])
+            if not options['loop']:
+                break
+            if not (sent or failed):
+                time.sleep(options['interval'])
+
+    def send_due_emails(self, batch_size):
+        """
+        Sends all due emails, claiming them in batches. A connection is only opened if emails
+        are due, and is reused by all of them. It is reopened after a failure. Emails whose
+        lease was taken over by another worker are skipped.
+
+        Returns:
+            tuple: The numbers of sent and failed emails.
+        """
+        sent = failed = 0
+        emails = OutgoingEmail.claim_due(batch_size)
+        if not emails:
+            return sent, failed
+        connection = get_connection()
+        self.open_connection(connection)
+        try:
+            while emails:
+                started_at = time.perf_counter()
+                batch_sent = batch_failed = 0
+                for email in emails:
+                    if not email.renew_lease():
+                        continue
+                    if email.send(connection=connection):
+                        batch_sent += 1
+                    else:
+                        batch_failed += 1
+                        connection.close()
+                        self.open_connection(connection)
+                self.report_batch(batch_sent, batch_failed, time.perf_counter() - started_at)
+                sent += batch_sent
+                failed += batch_failed
+                emails = OutgoingEmail.claim_due(batch_size)
+        finally:
+            connection.close()
+        return sent, failed
+
+    def open_connection(self, connection):
+        """
+        Opens the email connection. If this fails, each email opens its own connection
+        and is retried later if that fails, too.
+        """
+        try:
+            connection.open()
+        except Exception as error:
+            self.stderr.write(f"Opening the email connection failed: {error}")
+
+    def report_batch(self, sent, failed, duration):
+        """
+        Writes the result and throughput of a batch.
+        """
+        rate = sent / duration if duration else 0
+        self.stdout.write(f"Batch of {sent + failed} emails: {sent} sent, {failed} failed in {duration:.2f}s ({rate:.1f} emails/s).")
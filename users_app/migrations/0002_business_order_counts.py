@@ -0,0 +1,28 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='businessprofile',
+            name='cancelled_order_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='businessprofile',
+            name='completed_order_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='businessprofile',
+            name='in_progress_order_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users_app', '0004_outgoing_emails'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outgoingemail',
+            name='lease_token',
+            field=models.UUIDField(blank=True, db_index=True, default=None, null=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users_app', '0005_outgoing_email_lease_token'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='businessprofile',
+            name='rating_updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
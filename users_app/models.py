@@ -1,12 +1,17 @@
 from django.db import models
 from django.contrib.auth.models import User
 from datetime import timedelta
+from uuid import uuid4
+from django.conf import settings
 from django.utils.timezone import now
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 import os
 import six
 from uploads_app.models import FileUpload
-from .utils.models import get_user_field, send_account_activation_email
+from .utils.models import (
+    get_user_field, get_account_activation_email_data, send_email_with_data,
+    ACCOUNT_ACTIVATION_SUBJECT, ACCOUNT_ACTIVATION_TEMPLATE,
+)
     
 class AbstractUserProfile(models.Model):
     """
@@ -16,11 +21,15 @@ class AbstractUserProfile(models.Model):
         TYPE: Defines the profile type, should be specified in subclasses.
         user: The user associated with the profile.
         created_at: The timestamp when the profile was created.
+        updated_at: The timestamp when the profile was last updated.
         file: A file associated with the profile, stored in FileUpload.
+        VERSION_FIELDS: The timestamp fields which together change with the profile's representation.
     """
     TYPE = None
+    VERSION_FIELDS = ['updated_at']
     user = get_user_field(related_name='+')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     file = models.OneToOneField(FileUpload, on_delete=models.SET_NULL, default=None, blank=True, null=True)
     
     class Meta:
@@ -54,13 +63,69 @@ class BusinessProfile(AbstractUserProfile):
         description: A description of the business.
         working_hours: The business's working hours.
         tel: The business's contact phone number.
+        in_progress_order_count: Number of orders in progress, maintained on order writes.
+        completed_order_count: Number of completed orders, maintained on order writes.
+        cancelled_order_count: Number of cancelled orders, maintained on order writes.
+        rating_count: Number of rated reviews, maintained on review writes.
+        rating_sum: Sum of the ratings of all reviews, maintained on review writes.
+        rating_0_count ... rating_5_count: Number of reviews per rating, maintained on review writes.
+        rating_updated_at: The timestamp when the rating aggregates last changed. Kept apart from 'updated_at',
+            which versions the cached offers of the business, since the offers do not contain the ratings.
     """
     TYPE = 'business'
+    RATING_HISTOGRAM_FIELDS = [
+        'rating_0_count', 'rating_1_count', 'rating_2_count', 'rating_3_count', 'rating_4_count', 'rating_5_count',
+    ]
+    RATING_FIELDS = ['rating_count', 'rating_sum'] + RATING_HISTOGRAM_FIELDS
+    COUNTER_FIELDS = ['in_progress_order_count', 'completed_order_count', 'cancelled_order_count'] + RATING_FIELDS + ['rating_updated_at']
+    VERSION_FIELDS = ['updated_at', 'rating_updated_at']
     user = get_user_field(related_name='business_profile')
     location = models.CharField(max_length=32, default='', blank=True, null=True)
     description = models.CharField(max_length=1024, default='', blank=True, null=True)
     working_hours = models.CharField(max_length=32, default='', blank=True, null=True)
     tel = models.CharField(max_length=32, default='', blank=True, null=True)
+    in_progress_order_count = models.PositiveIntegerField(default=0)
+    completed_order_count = models.PositiveIntegerField(default=0)
+    cancelled_order_count = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_0_count = models.PositiveIntegerField(default=0)
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+    rating_updated_at = models.DateTimeField(default=now)
+    
+    @property
+    def average_rating(self):
+        """
+        Returns the average rating of the business, or None if it has no ratings.
+        """
+        return self.rating_sum / self.rating_count if self.rating_count else None
+    
+    @property
+    def rating_histogram(self):
+        """
+        Returns the number of reviews per rating, keyed by the rating from '0' to '5'.
+        """
+        return {str(rating): getattr(self, field) for rating, field in enumerate(self.RATING_HISTOGRAM_FIELDS)}
+    
+    def save(self, *args, **kwargs):
+        """
+        Overrides save to leave the counter fields (and the timestamp of the rating aggregates) of an existing
+        profile untouched, since they are only changed by atomic updates and the values of this instance may be outdated.
+
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
 class AccountActivationTokenGenerator(PasswordResetTokenGenerator):
     """
@@ -119,9 +184,155 @@ class AccountActivation(UserAction):
     @classmethod
     def create_with_email(cls, user):
         """
-        Creates class instance and sends corresponding email to the respective user.
+        Creates class instance and queues the corresponding email to the respective user.
+        The email is sent by the `send_queued_emails` command, so the request is not blocked by the mail server.
         """
         instance = cls.create_with_token(user, AccountActivationTokenGenerator)
         activation_url = os.environ['FRONTEND_BASE_URL'] + 'login.html?activate=' + instance.token
-        send_account_activation_email(recipient=instance.user.email, activation_url=activation_url)
-        return instance
\ No newline at end of file
+        OutgoingEmail.enqueue(
+            subject=ACCOUNT_ACTIVATION_SUBJECT,
+            template_name=ACCOUNT_ACTIVATION_TEMPLATE,
+            recipient=instance.user.email,
+            email_data=get_account_activation_email_data(instance.user.email, activation_url),
+        )
+        return instance
+
+class OutgoingEmail(models.Model):
+    """
+    Outbox entry of an email, sent asynchronously by the `send_queued_emails` command.
+    The email is rendered from its template when it is sent. Failed attempts are retried
+    with exponential backoff until 'EMAIL_QUEUE_MAX_ATTEMPTS' is reached.
+
+    Attributes:
+        subject: The email subject.
+        template_name: The name of the templates in the "emails" directory.
+        recipient: The recipient's email address.
+        email_data: The template data.
+        status: 'pending', 'sent' or 'failed'.
+        attempts: The number of failed sending attempts.
+        next_attempt_at: The earliest time of the next sending attempt.
+        last_error: The error of the last failed attempt.
+        lease_token: Identifies the worker's claim of the email, see `claim_due`.
+        created_at: The timestamp when the email was queued.
+        sent_at: The timestamp when the email was sent.
+    """
+    PENDING, SENT, FAILED = 'pending', 'sent', 'failed'
+    LEASE = timedelta(minutes=5)
+    STATUS_CHOICES = (
+        (PENDING, PENDING),
+        (SENT, SENT),
+        (FAILED, FAILED),
+    )
+    subject = models.CharField(max_length=255)
+    template_name = models.CharField(max_length=63)
+    recipient = models.EmailField(max_length=254)
+    email_data = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=now)
+    last_error = models.TextField(default='', blank=True)
+    lease_token = models.UUIDField(default=None, blank=True, null=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(default=None, blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='email_status_next_attempt_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient}: {self.subject} ({self.status})"
+
+    @classmethod
+    def enqueue(cls, subject, template_name, recipient, email_data):
+        """
+        Queues an email for sending.
+        """
+        return cls.objects.create(subject=subject, template_name=template_name, recipient=recipient, email_data=email_data)
+
+    @classmethod
+    def enqueue_many(cls, subject, template_name, recipients_data, batch_size=1000):
+        """
+        Queues an email with the same template to many recipients, e.g. for a campaign.
+
+        Args:
+            recipients_data (dict): Maps the recipients' email addresses to their template data.
+
+        Returns:
+            list: The queued emails.
+        """
+        return cls.objects.bulk_create([
+            cls(subject=subject, template_name=template_name, recipient=recipient, email_data=email_data)
+            for recipient, email_data in recipients_data.items()
+        ], batch_size=batch_size)
+
+    @classmethod
+    def claim_due(cls, limit, lease=LEASE):
+        """
+        Claims up to `limit` pending emails which are due, by moving their next attempt
+        behind a lease period and tagging them with a new lease token. The claim is a single
+        UPDATE which re-checks that the emails are still due, so concurrent workers never
+        claim the same email. The lease is renewed before each email is sent, see `renew_lease`.
+
+        Returns:
+            list: The claimed emails.
+        """
+        current_time = now()
+        lease_token = uuid4()
+        due_emails = cls.objects.filter(status=cls.PENDING, next_attempt_at__lte=current_time)
+        claimed_count = due_emails.filter(
+            pk__in=due_emails.order_by('next_attempt_at').values('pk')[:limit]
+        ).update(next_attempt_at=current_time + lease, lease_token=lease_token)
+        if not claimed_count:
+            return []
+        return list(cls.objects.filter(lease_token=lease_token).order_by('next_attempt_at', 'pk'))
+
+    def renew_lease(self, lease=LEASE):
+        """
+        Extends the lease of a claimed email before it is sent, so the lease only has to cover
+        a single send instead of the whole batch. Fails if the lease expired and another worker
+        claimed the email meanwhile, in which case the email must not be sent.
+
+        Returns:
+            bool: Whether the lease is still held.
+        """
+        leased_until = now() + lease
+        if not OutgoingEmail.objects.filter(pk=self.pk, lease_token=self.lease_token, status=self.PENDING).update(next_attempt_at=leased_until):
+            return False
+        self.next_attempt_at = leased_until
+        return True
+
+    def get_retry_delay(self):
+        """
+        Returns the delay before the next attempt, doubling with every failed attempt
+        up to 'EMAIL_QUEUE_MAX_RETRY_DELAY' seconds.
+        """
+        delay = settings.EMAIL_QUEUE_RETRY_DELAY * 2 ** (self.attempts - 1)
+        return timedelta(seconds=min(delay, settings.EMAIL_QUEUE_MAX_RETRY_DELAY))
+
+    def send(self, connection=None):
+        """
+        Sends the email and records the result. A failure schedules a retry,
+        or marks the email as failed after 'EMAIL_QUEUE_MAX_ATTEMPTS' attempts.
+
+        Args:
+            connection: An open email backend connection to reuse. Optional.
+
+        Returns:
+            bool: Whether the email was sent.
+        """
+        try:
+            send_email_with_data(self.subject, self.template_name, self.recipient, self.email_data, connection=connection)
+        except Exception as error:
+            self.attempts += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+            if self.attempts >= settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+                self.status = self.FAILED
+            else:
+                self.next_attempt_at = now() + self.get_retry_delay()
+            self.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+            return False
+        self.status = self.SENT
+        self.sent_at = now()
+        self.save(update_fields=['status', 'sent_at'])
+        return True
\ No newline at end of file
@@ -0,0 +1,59 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from users_app.models import CustomerProfile, BusinessProfile
+from users_app.api.authentication import CACHED_USER_FIELDS, invalidate_tokens
+
+# The user fields which a cached token authentication depends on.
+TOKEN_CACHED_USER_FIELDS = (*CACHED_USER_FIELDS, 'password')
+
+def get_token_cached_values(user):
+    """
+    Returns the values of the user fields which a cached token authentication depends on.
+    Unknown (None) if any of the fields is deferred.
+    """
+    if not all(field in user.__dict__ for field in TOKEN_CACHED_USER_FIELDS):
+        return None
+    return tuple(user.__dict__[field] for field in TOKEN_CACHED_USER_FIELDS)
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """
+    Invalidates the cached authentication of a deleted token.
+    """
+    invalidate_tokens([instance.key])
+
+@receiver(post_init, sender=User)
+def remember_token_cached_values(sender, instance, **kwargs):
+    """
+    Remembers the values of a user which cached token authentications contain.
+    """
+    instance._token_cached_as = get_token_cached_values(instance)
+
+@receiver(post_save, sender=User)
+def invalidate_tokens_of_user(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Invalidates the cached authentication tokens of a saved user, e.g. a deactivated one.
+    Saves which do not change the cached fields or the password, e.g. of the last login, keep them.
+    If the previous values of the user are unknown, the tokens are invalidated.
+    """
+    if update_fields and not set(TOKEN_CACHED_USER_FIELDS).intersection(update_fields):
+        return
+    cached_as = getattr(instance, '_token_cached_as', None)
+    current = get_token_cached_values(instance)
+    if not created and (cached_as is None or cached_as != current):
+        invalidate_tokens(Token.objects.filter(user_id=instance.pk).values_list('key', flat=True))
+    instance._token_cached_as = current
+
+@receiver(post_save, sender=CustomerProfile)
+@receiver(post_save, sender=BusinessProfile)
+@receiver(post_delete, sender=CustomerProfile)
+@receiver(post_delete, sender=BusinessProfile)
+def invalidate_tokens_of_profile_user(sender, instance, created=True, **kwargs):
+    """
+    Invalidates the cached authentication tokens of the user of a created or deleted profile,
+    since they contain the user's profile type.
+    """
+    if created and instance.user_id is not None:
+        invalidate_tokens(Token.objects.filter(user_id=instance.user_id).values_list('key', flat=True))
@@ -1,12 +1,23 @@
+from django.conf import settings
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail import get_connection
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils.timezone import now
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
-from .models import CustomerProfile, BusinessProfile, AccountActivation, AccountActivationTokenGenerator
+from .models import CustomerProfile, BusinessProfile, AccountActivation, AccountActivationTokenGenerator, OutgoingEmail
 from .api.serializers import CustomerProfileDetailSerializer, BusinessProfileDetailSerializer
+from .api.authentication import LocalTTLCache, local_token_cache, get_shared_token_cache_timeout
 import copy
 from datetime import timedelta
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import mock
 import os
 
 os.environ.setdefault('FRONTEND_BASE_URL', 'http://localhost:5500/')
@@ -299,6 +310,23 @@ class ProfileTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, expected_data)
         
+    def test_get_profile_detail_not_modified(self):
+        """
+        Tests conditional retrieval of profile details before and after a profile update.
+
+        Asserts:
+            304 Not Modified status for an unchanged profile.
+            200 OK status after updating the profile.
+        """
+        url = reverse('profile-detail', kwargs={"pk": self.business_user.id})
+        etag = self.client.get(url).headers['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        self.client.patch(url, {'location': 'patchcity'}, format="json")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
     def test_get_profile_detail_user_not_found(self):
         """
         Tests profile retrieval for non-existent user.
@@ -323,6 +351,19 @@ class ProfileTests(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
+    def test_get_profile_detail_single_query(self):
+        """
+        Tests that a profile is retrieved with a single query for both profile types.
+
+        Asserts:
+            200 OK status with one query per request.
+        """
+        for user in (self.customer_user, self.business_user):
+            url = reverse('profile-detail', kwargs={"pk": user.id})
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
     def test_patch_customer_profile_detail_ok(self):
         """
         Tests updating a customer profile.
@@ -404,4 +445,254 @@ class ProfileTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         for profile in response.data:
             self.assertIn('file', profile)
-            self.assertIn('uploaded_at', profile)
\ No newline at end of file
+            self.assertIn('uploaded_at', profile)
+
+class OutgoingEmailTests(APITestCase):
+    """
+    Tests for queueing registration emails and sending them with the `send_queued_emails` command.
+    """
+    def setUp(self):
+        """
+        Registers a new user, which queues an account activation email.
+        """
+        self.response = self.client.post(reverse('registration'), AuthTests.AUTH_DATA, format="json")
+
+    def test_registration_queues_email(self):
+        """
+        Tests that the registration queues the activation email instead of sending it.
+
+        Asserts:
+            201 Created status.
+            No email is sent during the request.
+            A pending email to the new user is queued.
+        """
+        self.assertEqual(self.response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.status, OutgoingEmail.PENDING)
+        self.assertEqual(email.recipient, AuthTests.AUTH_DATA['email'])
+
+    def test_send_queued_emails(self):
+        """
+        Tests sending the queued activation email.
+
+        Asserts:
+            The email is sent with the activation URL and marked as sent.
+            A second run sends nothing.
+        """
+        call_command('send_queued_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        token = AccountActivation.objects.get().token
+        self.assertIn(token, mail.outbox[0].body)
+        self.assertEqual(OutgoingEmail.objects.get().status, OutgoingEmail.SENT)
+        call_command('send_queued_emails', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(EMAIL_QUEUE_RETRY_DELAY=60, EMAIL_QUEUE_MAX_ATTEMPTS=2)
+    def test_send_queued_emails_retry(self):
+        """
+        Tests the retries of an email failing to send.
+
+        Asserts:
+            After the first failure, the email stays pending and is retried after the retry delay.
+            It is not sent again before the delay has passed.
+            After the last allowed attempt, the email is marked as failed.
+        """
+        with mock.patch('users_app.utils.models.EmailMultiAlternatives.send', side_effect=OSError('unreachable')):
+            call_command('send_queued_emails', stdout=StringIO())
+            email = OutgoingEmail.objects.get()
+            self.assertEqual((email.status, email.attempts), (OutgoingEmail.PENDING, 1))
+            self.assertIn('unreachable', email.last_error)
+            self.assertGreater(email.next_attempt_at, now() + timedelta(seconds=55))
+            call_command('send_queued_emails', stdout=StringIO())
+            self.assertEqual(OutgoingEmail.objects.get().attempts, 1)
+            OutgoingEmail.objects.update(next_attempt_at=now())
+            call_command('send_queued_emails', stdout=StringIO())
+        email = OutgoingEmail.objects.get()
+        self.assertEqual((email.status, email.attempts), (OutgoingEmail.FAILED, 2))
+
+    def test_send_queued_emails_file_backend(self):
+        """
+        Tests sending the queued email with the file-based email backend.
+
+        Asserts:
+            The email is written to the email file path.
+        """
+        with TemporaryDirectory() as email_file_path:
+            with override_settings(EMAIL_BACKEND='django.core.mail.backends.filebased.EmailBackend', EMAIL_FILE_PATH=email_file_path):
+                call_command('send_queued_emails', stdout=StringIO())
+            self.assertEqual(len(os.listdir(email_file_path)), 1)
+        self.assertEqual(OutgoingEmail.objects.get().status, OutgoingEmail.SENT)
+
+    def test_send_queued_emails_batch(self):
+        """
+        Tests sending a campaign of queued emails in batches over a single connection.
+
+        Asserts:
+            All emails are sent and marked as sent.
+            A single connection is used, and each batch is reported.
+            Each email contains the logo.
+        """
+        OutgoingEmail.enqueue_many('Campaign', 'account_activation', {
+            f"user{i}@email.com": {'recipient': f"user{i}", 'activation_url': 'http://localhost/'} for i in range(9)
+        })
+        stdout = StringIO()
+        with mock.patch('users_app.management.commands.send_queued_emails.get_connection', side_effect=get_connection) as connection_factory:
+            call_command('send_queued_emails', '--batch-size', '4', stdout=stdout)
+        self.assertEqual(connection_factory.call_count, 1)
+        self.assertEqual(len(mail.outbox), 10)
+        self.assertFalse(OutgoingEmail.objects.exclude(status=OutgoingEmail.SENT).exists())
+        self.assertEqual(stdout.getvalue().count('emails/s'), 3)
+        for message in mail.outbox:
+            self.assertIn('Content-ID: <logo>', message.message().as_string())
+
+    def test_claim_due_expired_lease(self):
+        """
+        Tests claiming due emails in a single query and taking over an expired lease.
+
+        Asserts:
+            The emails are claimed with a single query, and cannot be claimed again during the lease.
+            After the lease expired, another worker claims the emails.
+            The first worker loses the lease and does not send the emails.
+        """
+        OutgoingEmail.enqueue_many('Campaign', 'account_activation', {
+            f"user{i}@email.com": {'recipient': f"user{i}", 'activation_url': 'http://localhost/'} for i in range(3)
+        })
+        with self.assertNumQueries(2):
+            first_claim = OutgoingEmail.claim_due(3)
+        self.assertEqual(len(first_claim), 3)
+        self.assertEqual(len(OutgoingEmail.claim_due(10)), 1)
+        OutgoingEmail.objects.update(next_attempt_at=now())
+        second_claim = OutgoingEmail.claim_due(10)
+        self.assertEqual(len(second_claim), 4)
+        self.assertFalse(any(email.renew_lease() for email in first_claim))
+        self.assertTrue(all(email.renew_lease() for email in second_claim))
+
+class CachedTokenAuthenticationTests(APITestCase):
+    """
+    Tests for the token authentication cache and its invalidation.
+    """
+    def setUp(self):
+        """
+        Calls the general setup and clears the authentication caches.
+        """
+        cache.clear()
+        local_token_cache.clear()
+        General.setUp(self)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        self.url = reverse('business-list')
+
+    def test_authentication_cached(self):
+        """
+        Tests that a repeated request is authenticated without a query.
+
+        Asserts:
+            The first request queries the token, the second one only the business profiles.
+        """
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_authentication_shared_cache(self):
+        """
+        Tests that a token missing in the process cache is read from the shared cache.
+
+        Asserts:
+            No token query after clearing the process cache.
+        """
+        self.client.get(self.url)
+        local_token_cache.clear()
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+    def test_shared_cache_timeout(self):
+        """
+        Tests that a per-process memory cache keeps token entries no longer than the process cache.
+
+        Asserts:
+            - The process cache timeout applies to the memory cache.
+            - The shared cache timeout applies to a cross-process cache.
+        """
+        self.assertEqual(get_shared_token_cache_timeout(), settings.TOKEN_AUTH_LOCAL_CACHE_TIMEOUT)
+        with TemporaryDirectory() as location:
+            file_cache = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}}
+            with override_settings(CACHES=file_cache):
+                self.assertEqual(get_shared_token_cache_timeout(), settings.TOKEN_AUTH_CACHE_TIMEOUT)
+
+    def test_deleted_token_unauthorized(self):
+        """
+        Tests that a deleted token is rejected despite being cached.
+
+        Asserts:
+            401 Unauthorized status after deleting the token.
+        """
+        self.client.get(self.url)
+        self.business_token.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_unauthorized(self):
+        """
+        Tests that the token of a deactivated user is rejected despite being cached.
+
+        Asserts:
+            401 Unauthorized status after deactivating the user.
+        """
+        self.client.get(self.url)
+        self.business_user.is_active = False
+        self.business_user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unchanged_user_save_keeps_cache(self):
+        """
+        Tests that saving a user without changing the cached fields or the password keeps the cached tokens.
+
+        Asserts:
+            A login update and an unchanged save of a loaded user keep the token cached.
+            A password change invalidates the cached token.
+        """
+        self.client.get(self.url)
+        user = User.objects.get(pk=self.business_user.pk)
+        user.last_login = now()
+        user.save(update_fields=['last_login'])
+        user.save()
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+        user.set_password('new_password')
+        user.save()
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_profile_type_cached(self):
+        """
+        Tests that the profile type is cached with the token and updated with the profiles.
+
+        Asserts:
+            The business user's type is cached, and a deleted profile removes it.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.wsgi_request.user.profile_type, BusinessProfile.TYPE)
+        self.business_profile.delete()
+        response = self.client.get(self.url)
+        self.assertIsNone(response.wsgi_request.user.profile_type)
+
+    def test_local_ttl_cache(self):
+        """
+        Tests the eviction and expiry of the process cache.
+
+        Asserts:
+            The least recently used entry is evicted beyond the maximum size.
+            Entries expire after the timeout.
+        """
+        local_cache = LocalTTLCache(maxsize=2, timeout=60)
+        local_cache.set('a', 1)
+        local_cache.set('b', 2)
+        local_cache.get('a')
+        local_cache.set('c', 3)
+        self.assertEqual((local_cache.get('a'), local_cache.get('b'), local_cache.get('c')), (1, None, 3))
+        expired_cache = LocalTTLCache(maxsize=2, timeout=-1)
+        expired_cache.set('a', 1)
+        self.assertIsNone(expired_cache.get('a'))
@@ -1,11 +1,15 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.conf import settings
 from django.contrib.sites.models import Site
 from email.mime.base import MIMEBase
 from email import encoders
+from functools import lru_cache
+
+ACCOUNT_ACTIVATION_SUBJECT = 'Confirm your email'
+ACCOUNT_ACTIVATION_TEMPLATE = 'account_activation'
 
 def get_user_field(related_name):
     """
@@ -36,17 +40,21 @@ def generate_email_base_data(recipient):
         'recipient': recipient.split('@')[0]
     } 
 
+@lru_cache
+def get_email_templates(template_name):
+    """
+    Loads the plain text and html templates of an email once per process.
+    """
+    return get_template(f"emails/{template_name}.txt"), get_template(f"emails/{template_name}.html")
+
 def render_email_content(template_name, email_data):
     """
     Renders email content in plain text and html format.
     Both alternatives each require a corresponding template in the "emails" directory.
     """
-    text_file = f"emails/{template_name}.txt"
-    html_file = f"emails/{template_name}.html"
     try:
-        text_content = render_to_string(text_file, context=email_data)
-        html_content = render_to_string(html_file, context=email_data)        
-        return text_content, html_content
+        text_template, html_template = get_email_templates(template_name)
+        return text_template.render(email_data), html_template.render(email_data)
     except:
         raise Exception("Email rendering failed. Please check email template names and paths.")
     
@@ -61,10 +69,19 @@ def prepare_logo(svg_file):
     mime_svg.add_header('Content-ID', '<logo>')
     mime_svg.add_header('Content-Disposition', 'inline', filename='logo.svg')
     return mime_svg
-    
-def send_email_with_data(subject, template_name, recipient, email_data):
+
+@lru_cache
+def get_logo():
     """
-    Sends an email to the specified recipient using the specified template
+    Reads and encodes the logo once per process. The MIME part is only read
+    when messages are serialized, so it is shared by all emails.
+    """
+    with open('static/img/logo.svg', 'rb') as svg_file:
+        return prepare_logo(svg_file)
+
+def build_email_with_data(subject, template_name, recipient, email_data, connection=None):
+    """
+    Builds an email to the specified recipient using the specified template
     and filling it with customizable data.
     """
     text, html = render_email_content(template_name, email_data)
@@ -73,18 +90,26 @@ def send_email_with_data(subject, template_name, recipient, email_data):
         text,
         "noreply@bengt-fruechtenicht.de",
         [recipient],
+        connection=connection,
     )
     msg.attach_alternative(html, "text/html")
-    with open('static/img/logo.svg', 'rb') as svg_file:
-        mime_svg = prepare_logo(svg_file)
-        msg.attach(mime_svg)
-    msg.send()
+    msg.attach(get_logo())
+    return msg
+    
+def send_email_with_data(subject, template_name, recipient, email_data, connection=None):
+    """
+    Sends an email to the specified recipient using the specified template
+    and filling it with customizable data.
+    An open connection (see `django.core.mail.get_connection`) can be passed
+    to send several emails over the same connection.
+    """
+    build_email_with_data(subject, template_name, recipient, email_data, connection=connection).send()
 
-def send_account_activation_email(recipient, activation_url):
+def get_account_activation_email_data(recipient, activation_url):
     """
-    Sends an account activation email.
+    Returns the template data of an account activation email.
     The activation URL links to the frontend and must contain a valid token.
     """
     email_data = generate_email_base_data(recipient)
     email_data.update({'activation_url': activation_url})
-    send_email_with_data('Confirm your email', 'account_activation', recipient, email_data)
\ No newline at end of file
+    return email_data
@@ -1,23 +1,86 @@
 from django.contrib.auth.models import User
+from django.core.exceptions import ObjectDoesNotExist
 from users_app.models import CustomerProfile, BusinessProfile
 from users_app.api.serializers import CustomerProfileDetailSerializer, BusinessProfileDetailSerializer
 
 def get_profile(user_pk):
     """
     Retrieves the user profile (CustomerProfile or BusinessProfile) associated with the given user primary key.
+    The user, both possible profiles and their files are loaded in a single query,
+    and the returned profile's user and file are cached on it.
 
     :param user_pk: The primary key of the user.
     :type user_pk: int
     :return: The associated profile (CustomerProfile or BusinessProfile).
     :rtype: CustomerProfile or BusinessProfile
+    :raises ObjectDoesNotExist: If the user does not exist or has no profile.
     """
-    user = User.objects.get(pk=user_pk)
-    try:
-        profile = CustomerProfile.objects.get(user=user)
-    except CustomerProfile.DoesNotExist:
-        profile = BusinessProfile.objects.get(user=user)
-    finally:
-        return profile
+    user = User.objects.select_related('customer_profile__file', 'business_profile__file').get(pk=user_pk)
+    profile = getattr(user, 'customer_profile', None) or getattr(user, 'business_profile', None)
+    if profile is None:
+        raise ObjectDoesNotExist('The user has no profile.')
+    return profile
+    
+    
+def get_profile_ids(user_pk):
+    """
+    Retrieves the IDs of the customer and business profile of a user in a single query.
+
+    :param user_pk: The primary key of the user.
+    :type user_pk: int
+    :return: The customer profile ID and the business profile ID, each None if the user has no such profile.
+    :rtype: tuple
+    """
+    profile_ids = User.objects.filter(pk=user_pk).values_list('customer_profile__id', 'business_profile__id').first()
+    return profile_ids or (None, None)
+    
+
+def get_profile_type(user):
+    """
+    Retrieves the profile type of a user. The type cached by `CachedTokenAuthentication`
+    is used if available, otherwise it is queried once and stored on the user.
+
+    :param user: The user.
+    :type user: User
+    :return: 'customer', 'business' or None if the user has no profile.
+    :rtype: str
+    """
+    if not hasattr(user, 'profile_type'):
+        customer_profile_id, business_profile_id = get_profile_ids(user.pk)
+        if customer_profile_id is not None:
+            user.profile_type = CustomerProfile.TYPE
+        elif business_profile_id is not None:
+            user.profile_type = BusinessProfile.TYPE
+        else:
+            user.profile_type = None
+    return user.profile_type
+
+
+def get_request_profile(request):
+    """
+    Retrieves the profile of the requesting user once per request, so permissions and
+    serializers share a single lookup. The profile is also cached on the user
+    (e.g. as 'request.user.customer_profile'), and the profile's user is the requesting user.
+
+    :param request: The request.
+    :type request: Request
+    :return: The profile of the requesting user, or None if the user is anonymous or has no profile.
+    :rtype: CustomerProfile or BusinessProfile
+    """
+    if not hasattr(request, '_profile'):
+        user = request.user
+        profile_type = get_profile_type(user) if user.is_authenticated else None
+        profile = None
+        if profile_type == CustomerProfile.TYPE:
+            profile = CustomerProfile.objects.filter(user_id=user.pk).first()
+            if profile is not None:
+                user.customer_profile = profile
+        elif profile_type == BusinessProfile.TYPE:
+            profile = BusinessProfile.objects.filter(user_id=user.pk).first()
+            if profile is not None:
+                user.business_profile = profile
+        request._profile = profile
+    return request._profile
     
     
 def get_profile_serializer_plain(profile):